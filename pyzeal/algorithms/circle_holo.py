@@ -0,0 +1,308 @@
+"""
+Class CircleArgumentAlgorithm from the package pyzeal_algorithms.
+
+This module defines a root finding algorithm based on the argument principle
+along circular contours. The search rectangle is covered by (almost) square
+cells, each of which is enclosed by a circle. All moments of the logarithmic
+derivative along such a circle are obtained from a single fast Fourier
+transform of equispaced samples, and the roots inside of the circle are
+calculated from a Hankel pencil of these moments. Cells whose circles contain
+too many roots (or do not admit reliable moments) are subdivided.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from math import ceil
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.constants import (
+    CIRCLE_MARGIN,
+    CIRCLE_MAX_ROOTS,
+    PENCIL_ORDER_TOL,
+    ROOT_COUNT_TOL,
+)
+from pyzeal.algorithms.estimators.circle_estimator import CircleEstimator
+from pyzeal.algorithms.estimators.constants import (
+    CIRCLE_MAX_PTS,
+    CIRCLE_NUM_PTS,
+)
+from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
+from pyzeal.algorithms.hankel_holo import HankelPencilAlgorithm
+from pyzeal.pyzeal_types.root_types import tRectangle, tRoot, tVec
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_polishing import polishRoots
+
+
+class CircleArgumentAlgorithm(FinderAlgorithm):
+    """
+    Class representation of a root finding algorithm for holomorphic functions
+    which calculates moments of the logarithmic derivative along circles
+    enclosing the cells of a covering of the search rectangle. Roots are
+    assigned to the cell containing them (up to the requested precision) and
+    roots found in several cells, e.g. on shared edges, are reported only
+    once.
+    """
+
+    __slots__ = ("estimator", "maxRoots")
+
+    def __init__(
+        self,
+        *,
+        numPts: int = CIRCLE_NUM_PTS,
+        maxPts: int = CIRCLE_MAX_PTS,
+        maxRoots: int = CIRCLE_MAX_ROOTS,
+    ) -> None:
+        """
+        Initialize a root finding algorithm that covers the search rectangle
+        with circular contours and subdivides cells until the roots inside of
+        each circle can be calculated reliably from a Hankel pencil.
+
+        :param numPts: the initial number of samples on each circle
+        :param maxPts: the maximal number of samples on each circle
+        :param maxRoots: the maximal number of roots (with multiplicities)
+            calculated from the moments along a single circle
+        """
+        self.estimator = CircleEstimator(numPts=numPts, maxPts=maxPts)
+        self.maxRoots = maxRoots
+        self.logger.debug("initialized a new CircleArgumentAlgorithm!")
+
+    def calcRoots(self, context: RootContext) -> None:
+        """
+        Calculate roots in a given context by covering the search rectangle
+        with circular contours and refining cells until their roots can be
+        calculated from moments.
+
+        :param context: Context in which the algorithm operates.
+        """
+        self.logger.info(
+            "starting circle argument search for %s",
+            context.functionDataToString(),
+        )
+        cells = CircleArgumentAlgorithm.coverRectangle(
+            context.reRan, context.imRan
+        )
+        found: List[tRoot] = []
+        while cells:
+            reRan, imRan = cells.pop()
+            cells.extend(self.decideRefinement(reRan, imRan, context, found))
+
+    def decideRefinement(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+        found: List[tRoot],
+    ) -> List[tRectangle]:
+        """
+        Calculate the roots inside of a cell from the moments along its
+        enclosing circle or decide that the cell must be subdivided.
+
+        :param reRan: Real part of the current cell
+        :param imRan: Imaginary part of the current cell
+        :param context: `RootContext` in which the algorithm operates
+        :param found: the roots found in previous cells of the current search
+        :return: the subdivided cells (empty if the cell is finished)
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        center = 0.5 * (x1 + x2 + 1j * (y1 + y2))
+        radius = CIRCLE_MARGIN * 0.5 * abs(x2 - x1 + 1j * (y2 - y1))
+        epsReal = 10 ** (-context.precision[0])
+        epsImag = 10 ** (-context.precision[1])
+        if x2 - x1 < epsReal and y2 - y1 < epsImag:
+            self.addCellCenter(center, radius, reRan, imRan, context, found)
+            return []
+
+        moments = self.estimator.calcMoments(
+            center, radius, 2 * self.maxRoots, context
+        )
+        if moments is None:
+            return CircleArgumentAlgorithm.splitCell(reRan, imRan)
+        degree = int(np.rint(moments[0].real))
+        if abs(moments[0] - degree) > ROOT_COUNT_TOL or degree < 0:
+            return CircleArgumentAlgorithm.splitCell(reRan, imRan)
+        if degree == 0:
+            self.advanceProgress(reRan, imRan, context)
+            return []
+        if degree > self.maxRoots:
+            return CircleArgumentAlgorithm.splitCell(reRan, imRan)
+
+        result = self.rootsFromMoments(
+            moments, degree, center, radius, context
+        )
+        if result is None:
+            self.logger.debug("moments along circle are inconsistent!")
+            return CircleArgumentAlgorithm.splitCell(reRan, imRan)
+        for root, order in zip(*result):
+            # roots of overlapping circles belong to the cell containing them,
+            # roots on (or numerically beyond) shared edges to the first one
+            if (
+                x1 - epsReal <= root.real <= x2 + epsReal
+                and y1 - epsImag <= root.imag <= y2 + epsImag
+            ):
+                self.addRoot((complex(root), int(order)), context, found)
+        self.advanceProgress(reRan, imRan, context)
+        return []
+
+    def rootsFromMoments(
+        self,
+        moments: tVec,
+        degree: int,
+        center: complex,
+        radius: float,
+        context: RootContext,
+    ) -> Optional[Tuple[tVec, NDArray[np.int32]]]:
+        """
+        Calculate the roots inside of a circle (together with their orders)
+        from a Hankel pencil of moments in circle-local coordinates.
+
+        :param moments: the moments along the circle
+        :param degree: the number of roots inside of the circle
+        :param center: Center of the circle
+        :param radius: Radius of the circle
+        :param context: `RootContext` in which the algorithm operates
+        :return: parallel arrays of roots and orders or `None` if the results
+            can not be trusted
+        """
+        moments = moments.copy()
+        moments[0] = degree
+        result = HankelPencilAlgorithm.solvePencil(moments, degree)
+        if result is None:
+            return None
+        scaledRoots, orders = result
+        roundedOrders = np.round(orders.real).astype(np.int32)
+        if not (
+            np.all(np.isfinite(scaledRoots))
+            and np.all(abs(orders - roundedOrders) < PENCIL_ORDER_TOL)
+            and np.all(roundedOrders > 0)
+            and roundedOrders.sum() == degree
+            and np.all(abs(scaledRoots) < 1 + PENCIL_ORDER_TOL)
+        ):
+            return None
+        roots = polishRoots(
+            center + radius * scaledRoots, roundedOrders, context
+        )
+        if not HankelPencilAlgorithm.isSeparated(roots, context.precision):
+            return None
+        return roots, roundedOrders
+
+    def addCellCenter(
+        self,
+        center: complex,
+        radius: float,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+        found: List[tRoot],
+    ) -> None:
+        """
+        Add the center of a cell smaller than the requested accuracy as a root
+        if its enclosing circle contains roots.
+
+        :param center: Center of the cell
+        :param radius: Radius of the enclosing circle
+        :param reRan: Real part of the cell
+        :param imRan: Imaginary part of the cell
+        :param context: `RootContext` in which the algorithm operates
+        :param found: the roots found in previous cells of the current search
+        """
+        moments = self.estimator.calcMoments(center, radius, 1, context)
+        if moments is None:
+            self.logger.debug("could not count roots in cell %s!", str(center))
+        elif np.rint(moments[0].real) > 0:
+            self.addRoot(
+                (center, int(np.rint(moments[0].real))), context, found
+            )
+        self.advanceProgress(reRan, imRan, context)
+
+    def addRoot(
+        self, root: tRoot, context: RootContext, found: List[tRoot]
+    ) -> None:
+        """
+        Add a root to the container of `context` unless it coincides (up to
+        the requested precision) with a root found in a neighboring cell.
+
+        :param root: the root (and its order) to add
+        :param context: `RootContext` in which the algorithm operates
+        :param found: the roots found in previous cells of the current search
+        """
+        epsReal = 10 ** (-context.precision[0])
+        epsImag = 10 ** (-context.precision[1])
+        if any(
+            abs(root[0].real - other.real) < epsReal
+            and abs(root[0].imag - other.imag) < epsImag
+            for other, _ in found
+        ):
+            self.logger.debug(
+                "root %s was already found in another cell!", str(root[0])
+            )
+            return
+        found.append(root)
+        context.container.addRoot(root, context.toFilterContext())
+
+    @staticmethod
+    def advanceProgress(
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> None:
+        """
+        Advance the progress bar of `context` by the area of a finished cell.
+
+        :param reRan: Real part of the cell
+        :param imRan: Imaginary part of the cell
+        :param context: `RootContext` in which the algorithm operates
+        """
+        if context.progress is not None and context.task is not None:
+            context.progress.update(
+                context.task,
+                advance=(reRan[1] - reRan[0]) * (imRan[1] - imRan[0]),
+            )
+
+    @staticmethod
+    def coverRectangle(
+        reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> List[tRectangle]:
+        """
+        Cover a rectangle by a regular grid of (almost) square cells, such
+        that the enclosing circles of the cells are not much larger than the
+        cells themselves.
+
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :return: the cells covering the rectangle
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        side = min(x2 - x1, y2 - y1)
+        numRe = max(ceil((x2 - x1) / side - 1e-9), 1)
+        numIm = max(ceil((y2 - y1) / side - 1e-9), 1)
+        reGrid = np.linspace(x1, x2, numRe + 1)
+        imGrid = np.linspace(y1, y2, numIm + 1)
+        return [
+            ((reGrid[i], reGrid[i + 1]), (imGrid[j], imGrid[j + 1]))
+            for i in range(numRe)
+            for j in range(numIm)
+        ]
+
+    @staticmethod
+    def splitCell(
+        reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> List[tRectangle]:
+        """
+        Subdivide a cell into four cells of half the width and height.
+
+        :param reRan: Real part of the cell
+        :param imRan: Imaginary part of the cell
+        :return: the four subdivided cells
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        xm, ym = 0.5 * (x1 + x2), 0.5 * (y1 + y2)
+        return [
+            ((x1, xm), (y1, ym)),
+            ((xm, x2), (y1, ym)),
+            ((x1, xm), (ym, y2)),
+            ((xm, x2), (ym, y2)),
+        ]
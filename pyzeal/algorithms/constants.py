@@ -23,3 +23,57 @@ DEFAULT_MAX_PRECISION: Final[float] = 1e-10
 
 # cutoff for polynomial construction (at most 6*pi)
 MAX_PHASE: Final[float] = 0.85 * (8 * pi)
+# cutoff for Hankel pencil construction (at most 24*pi)
+MAX_PENCIL_PHASE: Final[float] = 0.96 * (26 * pi)
+# relative threshold for singular values determining the numerical rank of
+# Hankel matrices, i.e. the number of distinct roots inside a rectangle
+PENCIL_RANK_TOL: Final[float] = 1e-10
+# maximal deviation of multiplicities calculated from moments from integers
+PENCIL_ORDER_TOL: Final[float] = 1e-1
+# maximal number of (modified) Newton steps polishing roots from eigenvalues
+PENCIL_NEWTON_STEPS: Final[int] = 10
+# maximal deviation of root counts calculated from the argument principle from
+# integers before the counting rectangle is perturbed (roots near its edges)
+ROOT_COUNT_TOL: Final[float] = 1e-1
+# maximal number of perturbations of a counting rectangle
+ROOT_COUNT_RETRIES: Final[int] = 3
+# maximal number of bisections of a coarse tile while balancing the root counts
+# of parallel root finding tasks
+PARTITION_MAX_DEPTH: Final[int] = 6
+# number of points on circular contours determining the orders of roots found
+# without orders (doubled up to ORDER_REFINEMENTS times for fast phase changes)
+ORDER_NUM_PTS: Final[int] = 64
+ORDER_REFINEMENTS: Final[int] = 4
+# maximal phase change of target functions between adjacent contour points
+ORDER_MAX_PHASE_STEP: Final[float] = pi / 3
+# maximal radius of order contours relative to the accuracy of roots
+ORDER_RADIUS_SCALE: Final[float] = 10.0
+# maximal number of roots (with multiplicities) inside of a single circular
+# contour before the covered rectangle is subdivided
+CIRCLE_MAX_ROOTS: Final[int] = 12
+# radius of circular contours relative to half the diagonal of the covered
+# rectangle (such that roots on the corners lie inside of the circle)
+CIRCLE_MARGIN: Final[float] = 1.05
+# number of samples per edge and per row/column of the interior grid used to
+# construct rational surrogates of target functions
+SURROGATE_EDGE_PTS: Final[int] = 64
+SURROGATE_GRID_PTS: Final[int] = 12
+# relative accuracy and maximal degree of rational surrogates
+SURROGATE_TOL: Final[float] = 1e-12
+SURROGATE_MAX_DEGREE: Final[int] = 100
+# maximal number of subdivisions of rectangles without accurate surrogates
+SURROGATE_MAX_DEPTH: Final[int] = 4
+# distance (relative to the diameter of the rectangle) below which zeros of
+# surrogates are merged into a single multiple root or cancel with poles
+SURROGATE_CLUSTER_TOL: Final[float] = 1e-3
+# number of cells along the longer side of the uniform mesh on which winding
+# numbers of all cells are calculated at once
+MESH_NUM_CELLS: Final[int] = 64
+# maximal phase change of target functions along a single mesh edge before the
+# winding number of adjacent cells is considered unreliable
+MESH_MAX_DELTA_PHI: Final[float] = 0.75 * pi
+# number of samples per row and column of the grid used to exclude roots from
+# rectangles before estimating their arguments
+EXCLUSION_NUM_PTS: Final[int] = 5
+# safety factor applied to bounds of |f'| estimated from samples
+EXCLUSION_MARGIN: Final[float] = 2.0
@@ -7,14 +7,30 @@ Authors:\n
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import (
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import numpy as np
+from numpy.typing import NDArray
 
-from pyzeal.algorithms.estimators.estimator_cache import EstimatorCache
+from pyzeal.algorithms.estimators.constants import SAMPLE_TOL
+from pyzeal.algorithms.estimators.edge_store import sliceSamples, tSamples
+from pyzeal.algorithms.estimators.estimator_cache import (
+    EstimatorCache,
+    tLineKey,
+)
 from pyzeal.pyzeal_logging.loggable import Loggable
 from pyzeal.pyzeal_types.root_types import tVec
 from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.shared_samples import tLineSamples
 
 
 class ArgumentEstimator(ABC, Loggable):
@@ -24,6 +40,16 @@ class ArgumentEstimator(ABC, Loggable):
     `calcMomentAlongLine`.
     """
 
+    # estimators which obtain arguments along parts of sampled lines (almost)
+    # without new samples gain nothing from excluding roots before estimation
+    reusesLineSamples: ClassVar[bool] = False
+    # parameters in [0, 1] of the samples which are taken first along every
+    # edge (and whether derivatives are needed there), such that all edges of
+    # rectangles can be sampled at once (`None` for estimators which choose
+    # their samples depending on existing ones)
+    edgeNodes: ClassVar[Optional[NDArray[np.float64]]] = None
+    edgeDerivative: ClassVar[bool] = False
+
     def calcMoment(
         self,
         order: int,
@@ -55,16 +81,11 @@ class ArgumentEstimator(ABC, Loggable):
             y2,
         )
         phi: complex = 0
+        self.prefetchBoundaries([(reRan, imRan)], [order], context)
 
         # check if the requested complex line already resides in cache
-        arguments: List[Tuple[complex, complex]] = [
-            (x1 + y1 * 1j, x2 + y1 * 1j),
-            (x2 + y1 * 1j, x2 + y2 * 1j),
-            (x2 + y2 * 1j, x1 + y2 * 1j),
-            (x1 + y2 * 1j, x1 + y1 * 1j),
-        ]
-        for zStart, zEnd in arguments:
-            if entry := self.cache.retrieve(order, zStart, zEnd):
+        for zStart, zEnd in ArgumentEstimator.boundaryEdges(reRan, imRan):
+            if (entry := self.cache.retrieve(order, zStart, zEnd)) is not None:
                 phi += entry
             else:
                 deltaPhi = self.calcMomentAlongLine(
@@ -72,12 +93,233 @@ class ArgumentEstimator(ABC, Loggable):
                 )
                 # store the missing entry in the cache
                 self.cache.store(order, zStart, zEnd, deltaPhi)
-                self.cache.store(order, zEnd, zStart, -deltaPhi)
                 phi += deltaPhi
 
         self.logger.debug("estimated argument is %s", str(phi / (2.0 * np.pi)))
         return phi
 
+    def calcMoments(
+        self,
+        numMoments: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> tVec:
+        """
+        Calculate the moments of orders `0, ..., numMoments - 1` of the
+        logarithmic derivative of the target function `context.f` along the
+        boundary of the rectangle specified by `reRan` x `imRan`. Estimators
+        which can calculate all orders from a single set of samples should
+        override `calcMomentsAlongLine` accordingly.
+
+        :param numMoments: Number of moments to be calculated.
+        :param reRan: Interval describing the real part of the rectangle
+        :param imRan: Interval describing the imaginary part of the rectangle
+        :param context: `RootContext` containing the necessary information.
+        :return: moments of the logarithmic derivative of `context.f` along
+            the boundary of the specified rectangle.
+        """
+        moments = np.zeros(numMoments, dtype=np.complex128)
+        self.prefetchBoundaries([(reRan, imRan)], range(numMoments), context)
+        for zStart, zEnd in ArgumentEstimator.boundaryEdges(reRan, imRan):
+            entries = [
+                self.cache.retrieve(order, zStart, zEnd)
+                for order in range(numMoments)
+            ]
+            if all(entry is not None for entry in entries):
+                moments += np.array(entries, dtype=np.complex128)
+                continue
+            lineMoments = self.calcMomentsAlongLine(
+                numMoments, zStart, zEnd, context
+            )
+            # store the missing entries in the cache
+            for order, moment in enumerate(lineMoments):
+                self.cache.store(order, zStart, zEnd, complex(moment))
+            moments += lineMoments
+
+        return moments
+
+    @staticmethod
+    def boundaryEdges(
+        reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> List[Tuple[complex, complex]]:
+        """
+        Calculate the (positively oriented) edges of a rectangle.
+
+        :param reRan: Interval describing the real part of the rectangle
+        :param imRan: Interval describing the imaginary part of the rectangle
+        :return: Starting and end points of the edges
+        """
+        x1, x2 = reRan
+        y1, y2 = imRan
+        return [
+            (x1 + y1 * 1j, x2 + y1 * 1j),
+            (x2 + y1 * 1j, x2 + y2 * 1j),
+            (x2 + y2 * 1j, x1 + y2 * 1j),
+            (x1 + y2 * 1j, x1 + y1 * 1j),
+        ]
+
+    def prefetchBoundaries(
+        self,
+        rectangles: Sequence[Tuple[Tuple[float, float], Tuple[float, float]]],
+        orders: Sequence[int],
+        context: RootContext,
+    ) -> None:
+        """
+        Sample the target function `context.f` at the `edgeNodes` of all edges
+        of the given rectangles whose moments of the given orders are not
+        cached yet. All missing samples are evaluated by a single call of
+        `context.evalFunc` (and `context.evalDerivative`), such that
+        concurrent or asynchronous target functions evaluate the edges
+        concurrently. The samples are stored in `cache.samples`, from where
+        `calcMomentAlongLine` retrieves them. Lines with zeros of the target
+        function are left to `calcMomentAlongLine`, which translates them.
+
+        :param rectangles: Real and imaginary parts of the rectangles
+        :param orders: Orders of the moments which are going to be calculated
+        :param context: `RootContext` containing the necessary information.
+        """
+        if self.edgeNodes is None:
+            return
+        positions: Dict[
+            Tuple[Literal["horizontal", "vertical"], float],
+            List[NDArray[np.float64]],
+        ] = {}
+        for reRan, imRan in rectangles:
+            for zStart, zEnd in ArgumentEstimator.boundaryEdges(reRan, imRan):
+                if all(
+                    self.cache.contains(order, zStart, zEnd)
+                    for order in orders
+                ):
+                    continue
+                pos: Literal["horizontal", "vertical"]
+                if zStart.imag == zEnd.imag:
+                    pos, coord = "horizontal", zStart.imag
+                    start, end = zStart.real, zEnd.real
+                else:
+                    pos, coord = "vertical", zStart.real
+                    start, end = zStart.imag, zEnd.imag
+                lo, hi = min(start, end), max(start, end)
+                positions.setdefault((pos, coord), []).append(
+                    lo + self.edgeNodes * (hi - lo)
+                )
+        lines: List[
+            Tuple[
+                Literal["horizontal", "vertical"], float, NDArray[np.float64]
+            ]
+        ] = []
+        for (pos, coord), tList in positions.items():
+            tArr = np.unique(np.concatenate(tList))
+            _, _, found = self.matchSamples(
+                self.cache.toLineKey(pos, coord), tArr
+            )
+            if not found.all():
+                lines.append((pos, coord, tArr[~found]))
+        if len(lines) == 0:
+            return
+        zArr = cast(
+            tVec,
+            np.concatenate(
+                [
+                    tArr + 1j * coord
+                    if pos == "horizontal"
+                    else coord + 1j * tArr
+                    for pos, coord, tArr in lines
+                ]
+            ),
+        )
+        funcArr = context.evalFunc(zArr)
+        bounds = np.cumsum([0] + [tArr.size for _, _, tArr in lines])
+        valid = np.ones(zArr.size, dtype=np.bool_)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            valid[start:end] = np.all(funcArr[start:end] != 0)
+        derivArr = np.full(zArr.size, np.nan, dtype=np.complex128)
+        if self.edgeDerivative and context.df is not None and valid.any():
+            derivArr[valid] = context.evalDerivative(
+                zArr[valid], funcArr[valid]
+            )
+        for (pos, coord, tArr), start, end in zip(
+            lines, bounds[:-1], bounds[1:]
+        ):
+            if valid[start]:
+                self.cache.samples.insert(
+                    self.cache.toLineKey(pos, coord),
+                    (
+                        tArr,
+                        zArr[start:end],
+                        funcArr[start:end],
+                        derivArr[start:end],
+                    ),
+                )
+
+    def calcArgumentGrid(
+        self,
+        reGrid: NDArray[np.float64],
+        imGrid: NDArray[np.float64],
+        context: RootContext,
+    ) -> NDArray[np.float64]:
+        """
+        Calculate the total change in argument of the target function
+        `context.f` along the boundaries of all cells of the grid spanned by
+        the (ascending) vertices `reGrid` x `imGrid`. The default
+        implementation calculates the zeroth moment of each cell separately
+        (edges shared by neighboring cells are taken from the cache), while
+        estimators which sample complete lines should override this method.
+
+        :param reGrid: Real parts of the vertices of the grid
+        :param imGrid: Imaginary parts of the vertices of the grid
+        :param context: `RootContext` containing the necessary information.
+        :return: Change in argument along the boundary of the cell
+            `[reGrid[i], reGrid[i + 1]] x [imGrid[j], imGrid[j + 1]]` at
+            index `(i, j)`
+        """
+        self.prefetchBoundaries(
+            [
+                ((x1, x2), (y1, y2))
+                for x1, x2 in zip(reGrid[:-1], reGrid[1:])
+                for y1, y2 in zip(imGrid[:-1], imGrid[1:])
+            ],
+            [0],
+            context,
+        )
+        return np.array(
+            [
+                [
+                    self.calcMoment(0, (x1, x2), (y1, y2), context).real
+                    for y1, y2 in zip(imGrid[:-1], imGrid[1:])
+                ]
+                for x1, x2 in zip(reGrid[:-1], reGrid[1:])
+            ],
+            dtype=np.float64,
+        ).reshape(reGrid.size - 1, imGrid.size - 1)
+
+    def calcMomentsAlongLine(
+        self,
+        numMoments: int,
+        zStart: complex,
+        zEnd: complex,
+        context: RootContext,
+    ) -> tVec:
+        """
+        Calculate the moments of orders `0, ..., numMoments - 1` of the
+        logarithmic derivative of the target function `context.f` along the
+        line given by `zStart` and `zEnd`. The default implementation simply
+        delegates to `calcMomentAlongLine` for each order separately.
+
+        :param numMoments: Number of moments to calculate
+        :param zStart: Starting point of the line
+        :param zEnd: End point of the line
+        :param context: `RootContext` containing the necessary information.
+        :return: The moments as calculated along the given line.
+        """
+        return np.array(
+            [
+                self.calcMomentAlongLine(order, zStart, zEnd, context)
+                for order in range(numMoments)
+            ],
+            dtype=np.complex128,
+        )
+
     @abstractmethod
     def calcMomentAlongLine(
         self,
@@ -98,6 +340,75 @@ class ArgumentEstimator(ABC, Loggable):
         :return: The moment as calculated along the given line.
         """
 
+    def releaseLines(
+        self, reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> None:
+        """
+        Notify the estimator that the left and bottom edges of the rectangle
+        `reRan` x `imRan` will not be requested again. The default
+        implementation removes these edges and the samples on them from the
+        cache, estimators holding additional internal data along lines may
+        free it as well.
+
+        :param reRan: Interval describing the real part of the rectangle
+        :param imRan: Interval describing the imaginary part of the rectangle
+        """
+        x1, x2 = reRan
+        y1, y2 = imRan
+        for order in list(self.cache.orders):
+            self.cache.remove(order, x1 + y1 * 1j, x2 + y1 * 1j)
+            self.cache.remove(order, x1 + y2 * 1j, x1 + y1 * 1j)
+        samples = self.cache.samples
+        samples.release(self.cache.toLineKey("horizontal", y1), x1, x2)
+        samples.release(self.cache.toLineKey("vertical", x1), y1, y2)
+
+    def reset(self) -> None:
+        """
+        Reset the estimator by clearing its cache and any internal data.
+        """
+        self.cache.reset()
+
+    def exportSamples(self) -> List[tLineSamples]:
+        """
+        Export all samples of the target function held in the cache, e.g. for
+        seeding the estimators of worker processes via `seedSamples`.
+
+        :return: Orientation, coordinate, samples and sampled ranges of each
+            line
+        """
+        lines: List[tLineSamples] = []
+        for line, samples, ranges in self.cache.samples.export():
+            pos, coord = self.cache.fromLineKey(cast(tLineKey, line))
+            lines.append((pos, coord, samples, tuple(ranges)))
+        return lines
+
+    def seedSamples(self, context: RootContext) -> None:
+        """
+        Seed the cache with the samples along `context.sharedLines` (which
+        were calculated elsewhere) inside of the search domain of `context`.
+        Samples are not copied until they are modified.
+
+        :param context: `RootContext` containing the necessary information.
+        """
+        (x1, x2), (y1, y2) = context.reRan, context.imRan
+        for pos, coord, samples, ranges in context.sharedLines:
+            (lo, hi), (coordLo, coordHi) = (
+                ((x1, x2), (y1, y2))
+                if pos == "horizontal"
+                else ((y1, y2), (x1, x2))
+            )
+            tol = SAMPLE_TOL * max(abs(lo), abs(hi), hi - lo)
+            if not coordLo - tol <= coord <= coordHi + tol:
+                continue
+            tArr = samples[0]
+            start = int(np.searchsorted(tArr, lo - tol, side="left"))
+            stop = int(np.searchsorted(tArr, hi + tol, side="right"))
+            self.cache.samples.seed(
+                self.cache.toLineKey(pos, coord),
+                sliceSamples(samples, start, stop),
+                ranges,
+            )
+
     @property
     @abstractmethod
     def cache(self) -> EstimatorCache:
@@ -111,11 +422,42 @@ class ArgumentEstimator(ABC, Loggable):
         self, zStart: complex, zEnd: complex, context: RootContext, size: int
     ) -> Tuple[tVec, tVec]:
         """
-        TODO.
+        Evaluate the target function `context.f` on `size` equidistant points
+        of the line `[zStart, zEnd]`. Zeros of the target function found
+        during this procedure are put into `context.container` immediately and
+        the line is translated by a small offset perpendicular to itself.
+
+        :param zStart: Starting point of the line
+        :param zEnd: End point of the line
+        :param context: `RootContext` containing the necessary information.
+        :param size: Number of points on the line
+        :return: Points on the line along with function values
+        """
+        pos: Literal["horizontal", "vertical"] = (
+            "horizontal" if zStart.imag == zEnd.imag else "vertical"
+        )
+        zArr = cast(tVec, np.linspace(zStart, zEnd, size))
+        return self.evalFuncArr(zArr, pos, context)
+
+    def evalFuncArr(
+        self,
+        zArr: tVec,
+        pos: Literal["horizontal", "vertical"],
+        context: RootContext,
+    ) -> Tuple[tVec, tVec]:
+        """
+        Evaluate the target function `context.f` on arbitrary points `zArr`
+        lying on a horizontal or vertical line. Zeros of the target function
+        found during this procedure are put into `context.container`
+        immediately and the points are translated by a small offset
+        perpendicular to the line.
+
+        :param zArr: Points on the line
+        :param pos: Orientation of the line
+        :param context: `RootContext` containing the necessary information.
+        :return: Points on the (translated) line along with function values
         """
-        pos = "horizontal" if zStart.imag == zEnd.imag else "vertical"
-        zArr = np.linspace(zStart, zEnd, size)
-        funcArr = context.f(zArr)
+        funcArr = context.evalFunc(zArr)
         zerosOnLine = np.where(funcArr == 0)[0]
 
         while zerosOnLine.size > 0:
@@ -125,7 +467,8 @@ class ArgumentEstimator(ABC, Loggable):
                 str(zArr[0]),
                 str(zArr[-1]),
             )
-            # order of these zeros is not determined further, so put 0
+            # order of these zeros is not determined here, so put 0 (see
+            # `RootFinder.calculateOrders`)
             for newRoot in zArr[zerosOnLine]:
                 context.container.addRoot(
                     (newRoot, 0), context.toFilterContext()
@@ -135,7 +478,118 @@ class ArgumentEstimator(ABC, Loggable):
                 zArr += 2 * 10 ** (-context.precision[0])
             else:
                 zArr += 2j * 10 ** (-context.precision[1])
-            funcArr = context.f(zArr)
+            funcArr = context.evalFunc(zArr)
             zerosOnLine = np.where(funcArr == 0)[0]
 
         return zArr, funcArr
+
+    def sampleLine(
+        self,
+        pos: Literal["horizontal", "vertical"],
+        coord: float,
+        tArr: NDArray[np.float64],
+        context: RootContext,
+        derivative: bool = False,
+    ) -> Tuple[tVec, tVec, tVec]:
+        """
+        Sample the target function `context.f` (and optionally its derivative
+        `context.df`) at the positions `tArr` along a horizontal or vertical
+        line. Samples already present in `cache.samples` are reused and only
+        missing values are calculated (and stored).
+
+        :param pos: Orientation of the line
+        :param coord: Imaginary (horizontal) or real (vertical) part of the
+            line
+        :param tArr: Ascending real (horizontal) or imaginary (vertical) parts
+            of the sample points
+        :param context: `RootContext` containing the necessary information.
+        :param derivative: Flag indicating whether derivative values are
+            required
+        :return: Sample points (possibly translated) along with function and
+            derivative values (the latter are `nan` if not required)
+        """
+        line = self.cache.toLineKey(pos, coord)
+        (tOld, zOld, fOld, dfOld), nearest, found = self.matchSamples(
+            line, tArr
+        )
+        if tOld.size == 0:
+            return self.sampleNew(pos, coord, tArr, context, derivative)
+        zArr, funcArr, derivArr = zOld[nearest], fOld[nearest], dfOld[nearest]
+        if (new := ~found).any():
+            zArr[new], funcArr[new], derivArr[new] = self.sampleNew(
+                pos, coord, tArr[new], context, derivative
+            )
+        if derivative and context.df is not None:
+            missing = found & np.isnan(derivArr)
+            if missing.any():
+                derivArr[missing] = context.evalDerivative(
+                    zArr[missing], funcArr[missing]
+                )
+                self.cache.samples.update(
+                    line, tOld[nearest[missing]], derivArr[missing]
+                )
+        return zArr, funcArr, derivArr
+
+    def matchSamples(
+        self, line: tLineKey, tArr: NDArray[np.float64]
+    ) -> Tuple[tSamples, NDArray[np.intp], NDArray[np.bool_]]:
+        """
+        Match positions along a line with the first existing sample in
+        `cache.samples` within a small tolerance.
+
+        :param line: Key of the line
+        :param tArr: Ascending positions along the line
+        :return: Existing samples close to `tArr`, indices of the matching
+            samples and flags indicating if a match was found
+        """
+        tol = SAMPLE_TOL * max(abs(tArr[0]), abs(tArr[-1]), tArr[-1] - tArr[0])
+        samples = self.cache.samples.lookup(
+            line, tArr[0] - tol, tArr[-1] + tol
+        )
+        tOld = samples[0]
+        if tOld.size == 0:
+            return (
+                samples,
+                np.zeros(tArr.size, dtype=np.intp),
+                np.zeros(tArr.size, dtype=np.bool_),
+            )
+        nearest = np.minimum(np.searchsorted(tOld, tArr - tol), tOld.size - 1)
+        return samples, nearest, abs(tOld[nearest] - tArr) <= tol
+
+    def sampleNew(
+        self,
+        pos: Literal["horizontal", "vertical"],
+        coord: float,
+        tArr: NDArray[np.float64],
+        context: RootContext,
+        derivative: bool = False,
+    ) -> Tuple[tVec, tVec, tVec]:
+        """
+        Sample the target function `context.f` (and optionally its derivative
+        `context.df`) at new positions `tArr` along a horizontal or vertical
+        line and store the results in `cache.samples`.
+
+        :param pos: Orientation of the line
+        :param coord: Imaginary (horizontal) or real (vertical) part of the
+            line
+        :param tArr: Ascending real (horizontal) or imaginary (vertical) parts
+            of the sample points
+        :param context: `RootContext` containing the necessary information.
+        :param derivative: Flag indicating whether derivative values are
+            required
+        :return: Sample points (possibly translated) along with function and
+            derivative values (the latter are `nan` if not required)
+        """
+        zArr = cast(
+            tVec,
+            tArr + 1j * coord if pos == "horizontal" else coord + 1j * tArr,
+        )
+        zArr, funcArr = self.evalFuncArr(zArr, pos, context)
+        if derivative and context.df is not None:
+            derivArr = context.evalDerivative(zArr, funcArr)
+        else:
+            derivArr = np.full(tArr.size, np.nan, dtype=np.complex128)
+        self.cache.samples.insert(
+            self.cache.toLineKey(pos, coord), (tArr, zArr, funcArr, derivArr)
+        )
+        return zArr, funcArr, derivArr
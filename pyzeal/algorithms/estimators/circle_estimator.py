@@ -0,0 +1,207 @@
+"""
+Class CircleEstimator from the package pyzeal_estimators.
+
+This module defines an estimator of the moments of the logarithmic derivative
+of a holomorphic function along circular contours. On a circle the
+trapezoidal rule converges exponentially fast for analytic integrands, such
+that a moderate number of equispaced samples determines all moments at once
+via a single fast Fourier transform.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pyzeal.algorithms.estimators.constants import (
+    CIRCLE_COEFF_TOL,
+    CIRCLE_MAX_PTS,
+    CIRCLE_NUM_PTS,
+    MAX_LINE_DELTA_PHI,
+)
+from pyzeal.pyzeal_logging.loggable import Loggable
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.root_context import RootContext
+
+
+class CircleEstimator(Loggable):
+    """
+    Estimator of the moments `s_p = 1/(2*pi*i) * int w^p f'(w)/f(w) dw` of a
+    target function along circles, where `w = (z - center) / radius` denote
+    circle-local coordinates. With a derivative the moments are the Fourier
+    coefficients of `w * f'(w)/f(w)`, otherwise they are calculated from the
+    Fourier coefficients of `log f(w)`. The number of samples is doubled
+    (reusing previous samples) until the trapezoidal rule has converged.
+    """
+
+    __slots__ = ("numPts", "maxPts", "tol")
+
+    def __init__(
+        self,
+        *,
+        numPts: int = CIRCLE_NUM_PTS,
+        maxPts: int = CIRCLE_MAX_PTS,
+        tol: float = CIRCLE_COEFF_TOL,
+    ) -> None:
+        """
+        Initialize an estimator of moments along circular contours.
+
+        :param numPts: the initial number of samples on a circle
+        :param maxPts: the maximal number of samples on a circle
+        :param tol: relative magnitude of the highest Fourier coefficients
+            below which the samples are considered sufficient
+        """
+        self.numPts = numPts
+        self.maxPts = maxPts
+        self.tol = tol
+
+    def calcMoments(
+        self,
+        center: complex,
+        radius: float,
+        numMoments: int,
+        context: RootContext,
+    ) -> Optional[tVec]:
+        """
+        Calculate the moments `s_0, ..., s_(numMoments-1)` of the (deflated)
+        target function along the circle of given `center` and `radius`.
+
+        :param center: Center of the circle
+        :param radius: Radius of the circle
+        :param numMoments: Number of moments to calculate
+        :param context: `RootContext` containing the necessary information
+        :return: the moments in circle-local coordinates or `None` if the
+            target function vanishes on the circle or the samples did not
+            converge
+        """
+        numPts = self.numPts
+        while numPts < 4 * numMoments:
+            numPts *= 2
+        zArr, funcArr, derivArr = self.sampleCircle(
+            center, radius, numPts, context
+        )
+        while numPts <= self.maxPts:
+            if not np.all(np.isfinite(funcArr)) or np.any(funcArr == 0):
+                self.logger.debug("target function vanishes on circle!")
+                return None
+            result = self.momentsFromSamples(
+                zArr, funcArr, derivArr, center, radius, numMoments
+            )
+            if result is not None:
+                self.logger.debug(
+                    "calculated %d moments from %d samples on circle!",
+                    numMoments,
+                    numPts,
+                )
+                return result
+            # double the number of samples (reusing the previous ones)
+            newZ, newFunc, newDeriv = self.sampleCircle(
+                center, radius, numPts, context, offset=True
+            )
+            zArr = self.interleave(zArr, newZ)
+            funcArr = self.interleave(funcArr, newFunc)
+            derivArr = (
+                None
+                if derivArr is None or newDeriv is None
+                else self.interleave(derivArr, newDeriv)
+            )
+            numPts *= 2
+        self.logger.debug("samples on circle did not converge!")
+        return None
+
+    def momentsFromSamples(
+        self,
+        zArr: tVec,
+        funcArr: tVec,
+        derivArr: Optional[tVec],
+        center: complex,
+        radius: float,
+        numMoments: int,
+    ) -> Optional[tVec]:
+        """
+        Calculate moments from equispaced samples on a circle via a single
+        fast Fourier transform.
+
+        :param zArr: Equispaced points on the circle
+        :param funcArr: Function values at `zArr`
+        :param derivArr: Derivative values at `zArr` (if available)
+        :param center: Center of the circle
+        :param radius: Radius of the circle
+        :param numMoments: Number of moments to calculate
+        :return: the moments or `None` if the samples are insufficient
+        """
+        numPts = zArr.size
+        wArr = (zArr - center) / radius
+        if derivArr is not None:
+            # s_p = mean of w^(p+1) f'(w)/f(w) = p-th coefficient of the ifft
+            with np.errstate(all="ignore"):
+                coefficients = np.fft.ifft(wArr * radius * derivArr / funcArr)
+            moments = coefficients[:numMoments]
+        else:
+            phase = np.unwrap(np.angle(np.append(funcArr, funcArr[0])))
+            if np.max(np.abs(np.diff(phase))) > MAX_LINE_DELTA_PHI:
+                return None
+            winding = int(np.rint((phase[-1] - phase[0]) / (2 * np.pi)))
+            theta = 2 * np.pi * np.arange(numPts) / numPts
+            # log f(w) - N log(w) is periodic and its coefficient of w^(-p)
+            # equals -s_p / p for p > 0
+            coefficients = np.fft.ifft(
+                np.log(np.abs(funcArr))
+                + 1j * (phase[:-1] - phase[0] - winding * theta)
+            )
+            moments = -np.arange(numMoments) * coefficients[:numMoments]
+            moments[0] = winding
+        if not np.all(np.isfinite(coefficients)):
+            return None
+        # aliasing errors are bounded by the highest Fourier coefficients
+        tail = np.abs(coefficients[3 * numPts // 8 : 5 * numPts // 8]).max()
+        if tail > self.tol * max(np.abs(coefficients).max(), 1.0):
+            return None
+        return np.asarray(moments, dtype=np.complex128)
+
+    @staticmethod
+    def sampleCircle(
+        center: complex,
+        radius: float,
+        numPts: int,
+        context: RootContext,
+        offset: bool = False,
+    ) -> Tuple[tVec, tVec, Optional[tVec]]:
+        """
+        Sample the (deflated) target function and its derivative (if
+        available) at `numPts` equispaced points on a circle.
+
+        :param center: Center of the circle
+        :param radius: Radius of the circle
+        :param numPts: Number of samples
+        :param context: `RootContext` containing the necessary information
+        :param offset: Flag indicating that the points are shifted by half of
+            their spacing (to double the number of existing samples)
+        :return: Points on the circle along with function and derivative
+            values
+        """
+        theta = 2 * np.pi * (np.arange(numPts) + 0.5 * offset) / numPts
+        zArr = center + radius * np.exp(1j * theta)
+        funcArr = context.evalFunc(zArr)
+        derivArr = (
+            None
+            if context.df is None
+            else context.evalDerivative(zArr, funcArr)
+        )
+        return zArr, funcArr, derivArr
+
+    @staticmethod
+    def interleave(first: tVec, second: tVec) -> tVec:
+        """
+        Interleave two arrays of samples of equal length.
+
+        :param first: Samples at even positions
+        :param second: Samples at odd positions
+        :return: Interleaved samples
+        """
+        result = np.empty(2 * first.size, dtype=np.complex128)
+        result[::2] = first
+        result[1::2] = second
+        return result
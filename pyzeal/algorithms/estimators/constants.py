@@ -8,14 +8,72 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Final
+from typing import Final, Tuple
 
-# number of sample points for integration
-EXP_SAMPLE_POINTS: Final[int] = 10
-# maximal sample points for integration
-MAX_SAMPLE_POINTS: Final[int] = 21
+# non-negative nodes of the 15-point Kronrod rule on [-1, 1] (the nodes with
+# odd index are the nodes of the embedded 7-point Gauss rule)
+KRONROD_NODES: Final[Tuple[float, ...]] = (
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+)
+# weights of the 15-point Kronrod rule belonging to KRONROD_NODES
+KRONROD_WEIGHTS: Final[Tuple[float, ...]] = (
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+)
+# weights of the embedded 7-point Gauss rule belonging to KRONROD_NODES[1::2]
+GAUSS_WEIGHTS: Final[Tuple[float, ...]] = (
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+)
+# absolute tolerance for moments calculated by adaptive quadrature
+QUAD_TOL: Final[float] = 1e-10
+# maximal number of bisections of a line during adaptive quadrature
+MAX_QUAD_DEPTH: Final[int] = 30
+# maximal number of simultaneously refined intervals on a line
+MAX_QUAD_INTERVALS: Final[int] = 2**10
 
 # constant determining the refinement of complex arrays for large phi values
 Z_REFINE: Final[int] = 100
 # constant determining the maximal length of z-arrays
 MAX_Z_LENGTH: Final[int] = 100
+# minimal number of initial support points on new lines
+MIN_SUPPORT_PTS: Final[int] = 16
+# maximal threshold for phase changes between sparse support points
+MAX_LINE_DELTA_PHI: Final[float] = 0.4
+# default cap on the memory held by samples along edges (in bytes)
+MAX_EDGE_SAMPLE_BYTES: Final[int] = 2**28
+# maximal number of samples in a leaf of the segment tree of an edge
+EDGE_LEAF_SIZE: Final[int] = 4096
+# relative distance below which samples along an edge are identified
+SAMPLE_TOL: Final[float] = 1e-12
+# default cap on the memory held by estimator caches (in bytes)
+MAX_ESTIMATOR_CACHE_BYTES: Final[int] = 2**26
+# default cap on the total memory held by estimator caches and their samples
+MAX_CACHE_BYTES: Final[int] = MAX_ESTIMATOR_CACHE_BYTES + MAX_EDGE_SAMPLE_BYTES
+# number of lattice points per requested precision used for cache keys
+LATTICE_REFINE: Final[int] = 256
+# lattice spacing used for cache keys if no precision has been set
+DEFAULT_LATTICE_SPACING: Final[float] = 2**-40
+# relative tolerance for gaps between support points exceeding their spacing
+FILL_TOL: Final[float] = 1e-6
+# initial and maximal number of equispaced samples on circular contours
+CIRCLE_NUM_PTS: Final[int] = 64
+CIRCLE_MAX_PTS: Final[int] = 2**14
+# relative magnitude of the highest Fourier coefficients of samples on a
+# circle below which the trapezoidal rule is considered converged
+CIRCLE_COEFF_TOL: Final[float] = 1e-10
@@ -0,0 +1,556 @@
+"""
+This module provides a memory-bounded store for samples of the target function
+(and its derivative) along horizontal and vertical lines in the complex plane.
+Samples on each line are organized in a segment tree such that arbitrary
+sub-segments of previously sampled lines can be queried efficiently.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Sequence, Tuple, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.estimators.constants import (
+    EDGE_LEAF_SIZE,
+    MAX_EDGE_SAMPLE_BYTES,
+)
+from pyzeal.pyzeal_logging.loggable import Loggable
+from pyzeal.pyzeal_types.root_types import tVec
+
+# type alias for samples (positions along the line, points, f and df values)
+tSamples = Tuple[NDArray[np.float64], tVec, tVec, tVec]
+# type alias for completely sampled ranges (lower and upper end, spacing)
+tRange = Tuple[float, float, float]
+
+
+class SampleNode:
+    """
+    Node of the segment tree of samples on a single line. Leaves hold sorted
+    arrays of samples, inner nodes bisect their interval into two children.
+    """
+
+    __slots__ = ("lo", "hi", "left", "right", "samples")
+
+    def __init__(self, lo: float, hi: float, samples: tSamples) -> None:
+        """
+        Initialize a leaf of a segment tree.
+
+        :param lo: Lower end of the interval covered by this node
+        :param hi: Upper end of the interval covered by this node
+        :param samples: Samples inside of the interval, sorted by position
+        """
+        self.lo = lo
+        self.hi = hi
+        self.left: Optional[SampleNode] = None
+        self.right: Optional[SampleNode] = None
+        self.samples = samples
+
+    @property
+    def mid(self) -> float:
+        """
+        Returns the point at which this node is bisected.
+
+        :return: Midpoint of the interval covered by this node.
+        """
+        return 0.5 * (self.lo + self.hi)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes held by the samples of this node.
+
+        :return: Number of bytes held by this node.
+        """
+        return sum(arr.nbytes for arr in self.samples)
+
+
+class SampleTree:
+    """
+    Segment tree holding all samples on a single line together with the
+    ranges which have been sampled completely (and the spacing of their
+    initial samples).
+    """
+
+    __slots__ = ("root", "ranges", "nbytes")
+
+    def __init__(self, lo: float, hi: float) -> None:
+        """
+        Initialize an empty tree covering the interval `[lo, hi]`.
+
+        :param lo: Lower end of the interval covered by the tree
+        :param hi: Upper end of the interval covered by the tree
+        """
+        self.root = SampleNode(lo, hi, emptySamples())
+        self.ranges: List[tRange] = []
+        self.nbytes = 0
+
+
+def emptySamples() -> tSamples:
+    """
+    Create an empty set of samples.
+
+    :return: Empty arrays of positions, points, f and df values.
+    """
+    return (
+        np.empty(0, dtype=np.float64),
+        np.empty(0, dtype=np.complex128),
+        np.empty(0, dtype=np.complex128),
+        np.empty(0, dtype=np.complex128),
+    )
+
+
+def copySamples(samples: tSamples) -> tSamples:
+    """
+    Copy a set of samples.
+
+    :param samples: Samples to copy
+    :return: Copies of positions, points, f and df values.
+    """
+    tArr, zArr, fArr, dfArr = samples
+    return tArr.copy(), zArr.copy(), fArr.copy(), dfArr.copy()
+
+
+def mergeSamples(old: tSamples, new: tSamples) -> tSamples:
+    """
+    Merge two sets of samples which are both sorted by position.
+
+    :param old: Existing samples
+    :param new: Samples to merge into the existing ones
+    :return: Sorted union of both sets of samples
+    """
+    if old[0].size == 0:
+        return copySamples(new)
+    size = old[0].size + new[0].size
+    newIdx = np.searchsorted(old[0], new[0]) + np.arange(new[0].size)
+    isOld = np.ones(size, dtype=bool)
+    isOld[newIdx] = False
+    merged = []
+    for oldArr, newArr in zip(old, new):
+        arr = np.empty(size, dtype=oldArr.dtype)
+        arr[isOld] = oldArr
+        arr[newIdx] = newArr
+        merged.append(arr)
+    return cast(tSamples, tuple(merged))
+
+
+def sliceSamples(
+    samples: tSamples, start: int, stop: Optional[int] = None
+) -> tSamples:
+    """
+    Slice a set of samples.
+
+    :param samples: Samples to slice
+    :param start: Index of the first sample in the slice
+    :param stop: Index after the last sample in the slice
+    :return: Views of positions, points, f and df values inside the slice.
+    """
+    tArr, zArr, fArr, dfArr = samples
+    return (
+        tArr[start:stop],
+        zArr[start:stop],
+        fArr[start:stop],
+        dfArr[start:stop],
+    )
+
+
+class EdgeSampleStore(Loggable):
+    """
+    A bounded in-memory store of samples of the target function `f` and its
+    derivative `df` along horizontal and vertical lines. Lines are identified
+    by hashable keys supplied by the caller and positions along a line are
+    the real (horizontal) or imaginary (vertical) parts of the sample points.
+    Derivative values which have not been calculated are stored as `nan`.
+    Whenever the configured cap is exceeded the least recently used lines are
+    evicted.
+    """
+
+    __slots__ = ("_lines", "maxBytes", "bytesUsed")
+
+    def __init__(self, maxBytes: int = MAX_EDGE_SAMPLE_BYTES) -> None:
+        """
+        Initialize a new `EdgeSampleStore`.
+
+        :param maxBytes: Maximal number of bytes held by the store
+        """
+        self._lines: "OrderedDict[Hashable, SampleTree]" = OrderedDict()
+        self.maxBytes = maxBytes
+        self.bytesUsed = 0
+        self.logger.info("initialized a new edge sample store...")
+
+    def cover(
+        self, line: Hashable, start: float, end: float, spacing: float
+    ) -> None:
+        """
+        Mark the range `[start, end]` of a line as completely sampled, i.e. no
+        gap between neighboring samples exceeds `spacing`.
+
+        :param line: Key of the line
+        :param start: Lower end of the sampled range
+        :param end: Upper end of the sampled range
+        :param spacing: Maximal distance of neighboring samples in the range
+        """
+        if (tree := self._lines.get(line, None)) is not None:
+            tree.ranges.append((start, end, spacing))
+
+    def covering(
+        self, line: Hashable, start: float, end: float
+    ) -> Optional[tRange]:
+        """
+        Return the smallest completely sampled range of a line containing
+        `[start, end]`.
+
+        :param line: Key of the line
+        :param start: Lower end of the queried range
+        :param end: Upper end of the queried range
+        :return: The smallest sampled range containing the queried range
+            (together with its spacing) if such a range exists, else None is
+            returned.
+        """
+        if (tree := self._lines.get(line, None)) is None:
+            return None
+        ranges = [r for r in tree.ranges if r[0] <= start and end <= r[1]]
+        if len(ranges) == 0:
+            return None
+        return min(ranges, key=lambda r: r[1] - r[0])
+
+    def coveringLines(self, start: float, end: float) -> List[Hashable]:
+        """
+        Return the keys of all lines on which a range containing
+        `[start, end]` has been sampled completely.
+
+        :param start: Lower end of the queried range
+        :param end: Upper end of the queried range
+        :return: Keys of the lines covering the queried range
+        """
+        return [
+            line
+            for line, tree in self._lines.items()
+            if any(r[0] <= start and end <= r[1] for r in tree.ranges)
+        ]
+
+    def lookup(self, line: Hashable, start: float, end: float) -> tSamples:
+        """
+        Return all samples on a line with positions in `[start, end]`.
+
+        :param line: Key of the line
+        :param start: Lower end of the queried range
+        :param end: Upper end of the queried range
+        :return: Positions, points, f and df values of the samples, sorted by
+            position.
+        """
+        if (tree := self._lines.get(line, None)) is None:
+            return emptySamples()
+        self._lines.move_to_end(line)
+        parts: List[tSamples] = []
+        EdgeSampleStore.collect(tree.root, start, end, parts)
+        if len(parts) == 1:
+            return parts[0]
+        if len(parts) == 0:
+            return emptySamples()
+        return (
+            np.concatenate([part[0] for part in parts]),
+            np.concatenate([part[1] for part in parts]),
+            np.concatenate([part[2] for part in parts]),
+            np.concatenate([part[3] for part in parts]),
+        )
+
+    def insert(self, line: Hashable, samples: tSamples) -> None:
+        """
+        Insert new samples into the segment tree of a line.
+
+        :param line: Key of the line
+        :param samples: Positions, points, f and df values of the new
+            samples, sorted by position
+        """
+        tArr = samples[0]
+        if tArr.size == 0:
+            return
+        lo, hi = float(tArr[0]), float(tArr[-1])
+        if (tree := self._lines.get(line, None)) is None:
+            tree = self._lines[line] = SampleTree(
+                lo, hi if hi > lo else lo + 1
+            )
+        self._lines.move_to_end(line)
+        # grow the tree until it covers the new samples
+        while lo < tree.root.lo or hi > tree.root.hi:
+            width = tree.root.hi - tree.root.lo
+            oldRoot = tree.root
+            if lo < oldRoot.lo:
+                tree.root = SampleNode(
+                    oldRoot.lo - width, oldRoot.hi, emptySamples()
+                )
+                tree.root.left = SampleNode(
+                    oldRoot.lo - width, oldRoot.lo, emptySamples()
+                )
+                tree.root.right = oldRoot
+            else:
+                tree.root = SampleNode(
+                    oldRoot.lo, oldRoot.hi + width, emptySamples()
+                )
+                tree.root.left = oldRoot
+                tree.root.right = SampleNode(
+                    oldRoot.hi, oldRoot.hi + width, emptySamples()
+                )
+        self.bytesUsed -= tree.nbytes
+        tree.nbytes += EdgeSampleStore.insertNode(tree.root, samples)
+        self.bytesUsed += tree.nbytes
+        self.evict()
+
+    def seed(
+        self, line: Hashable, samples: tSamples, ranges: Sequence[tRange]
+    ) -> None:
+        """
+        Insert samples of a line computed elsewhere (e.g. views of shared
+        memory) together with its completely sampled ranges. Samples of lines
+        which are not present yet are not copied until they are modified.
+
+        :param line: Key of the line
+        :param samples: Positions, points, f and df values of the samples,
+            sorted by position
+        :param ranges: Completely sampled ranges of the line
+        """
+        tArr = samples[0]
+        if tArr.size == 0:
+            return
+        if line in self._lines:
+            self.insert(line, samples)
+        else:
+            lo, hi = float(tArr[0]), float(tArr[-1])
+            tree = self._lines[line] = SampleTree(
+                lo, hi if hi > lo else lo + 1
+            )
+            tree.root.samples = samples
+            tree.nbytes = tree.root.nbytes
+            self.bytesUsed += tree.nbytes
+        self._lines[line].ranges.extend(ranges)
+        self.evict()
+
+    def export(self) -> List[Tuple[Hashable, tSamples, List[tRange]]]:
+        """
+        Return the samples and completely sampled ranges of all lines, e.g.
+        for seeding the stores of other processes.
+
+        :return: Keys, samples and sampled ranges of all lines
+        """
+        lines = []
+        for line, tree in self._lines.items():
+            parts: List[tSamples] = []
+            EdgeSampleStore.collect(
+                tree.root, tree.root.lo, tree.root.hi, parts
+            )
+            if len(parts) == 0:
+                continue
+            samples = cast(
+                tSamples,
+                tuple(
+                    np.concatenate([part[i] for part in parts])
+                    for i in range(4)
+                ),
+            )
+            lines.append((line, samples, list(tree.ranges)))
+        return lines
+
+    def update(
+        self, line: Hashable, tArr: NDArray[np.float64], dfArr: tVec
+    ) -> None:
+        """
+        Update the derivative values of existing samples on a line.
+
+        :param line: Key of the line
+        :param tArr: Positions of the samples, sorted
+        :param dfArr: New derivative values
+        """
+        if (tree := self._lines.get(line, None)) is None or tArr.size == 0:
+            return
+        EdgeSampleStore.updateNode(tree.root, tArr, dfArr)
+
+    def release(self, line: Hashable, start: float, end: float) -> None:
+        """
+        Remove all samples on a line with positions strictly between `start`
+        and `end`.
+
+        :param line: Key of the line
+        :param start: Lower end of the released range
+        :param end: Upper end of the released range
+        """
+        if (tree := self._lines.get(line, None)) is None:
+            return
+        tree.ranges = [r for r in tree.ranges if r[0] < start or end < r[1]]
+        self.bytesUsed -= tree.nbytes
+        tree.nbytes -= EdgeSampleStore.releaseNode(tree.root, start, end)
+        self.bytesUsed += tree.nbytes
+        if tree.nbytes == 0:
+            del self._lines[line]
+
+    def evict(self) -> None:
+        """
+        Evict least recently used lines until the memory consumption of the
+        store falls below its cap. The most recently used line is kept.
+        """
+        while self.bytesUsed > self.maxBytes and len(self._lines) > 1:
+            line, tree = self._lines.popitem(last=False)
+            self.logger.debug("evicting line %s from sample store!", str(line))
+            self.bytesUsed -= tree.nbytes
+
+    def reset(self) -> None:
+        """
+        Resets the store by clearing all samples.
+        """
+        self._lines.clear()
+        self.bytesUsed = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of lines containing samples.
+
+        :return: Number of lines containing samples.
+        """
+        return len(self._lines)
+
+    @staticmethod
+    def collect(
+        node: SampleNode, start: float, end: float, parts: List[tSamples]
+    ) -> None:
+        """
+        Collect the samples inside of `[start, end]` from a (sub-)tree.
+
+        :param node: Root of the (sub-)tree
+        :param start: Lower end of the queried range
+        :param end: Upper end of the queried range
+        :param parts: List to which samples are appended in sorted order
+        """
+        if node.hi < start or end < node.lo:
+            return
+        if node.left is not None and node.right is not None:
+            EdgeSampleStore.collect(node.left, start, end, parts)
+            EdgeSampleStore.collect(node.right, start, end, parts)
+            return
+        tArr = node.samples[0]
+        i = int(np.searchsorted(tArr, start, side="left"))
+        j = int(np.searchsorted(tArr, end, side="right"))
+        if i < j:
+            parts.append(sliceSamples(node.samples, i, j))
+
+    @staticmethod
+    def insertNode(node: SampleNode, samples: tSamples) -> int:
+        """
+        Insert sorted samples into a (sub-)tree, splitting leaves which exceed
+        their capacity.
+
+        :param node: Root of the (sub-)tree
+        :param samples: Samples to insert, sorted by position
+        :return: The change in bytes held by the (sub-)tree
+        """
+        if samples[0].size == 0:
+            return 0
+        if node.left is not None and node.right is not None:
+            k = int(np.searchsorted(samples[0], node.mid, side="left"))
+            return EdgeSampleStore.insertNode(
+                node.left, sliceSamples(samples, 0, k)
+            ) + EdgeSampleStore.insertNode(
+                node.right, sliceSamples(samples, k)
+            )
+        oldBytes = node.nbytes
+        node.samples = mergeSamples(node.samples, samples)
+        EdgeSampleStore.splitNode(node)
+        return EdgeSampleStore.countBytes(node) - oldBytes
+
+    @staticmethod
+    def splitNode(node: SampleNode) -> None:
+        """
+        Recursively split a leaf which exceeds its capacity at its midpoint.
+
+        :param node: Leaf to split
+        """
+        mid = node.mid
+        if (
+            node.samples[0].size <= EDGE_LEAF_SIZE
+            or not node.lo < mid < node.hi
+        ):
+            return
+        k = int(np.searchsorted(node.samples[0], mid, side="left"))
+        node.left = SampleNode(node.lo, mid, sliceSamples(node.samples, 0, k))
+        node.right = SampleNode(mid, node.hi, sliceSamples(node.samples, k))
+        node.samples = emptySamples()
+        for child in (node.left, node.right):
+            EdgeSampleStore.splitNode(child)
+            # leaves copy their samples such that the parent buffers are freed
+            if child.left is None:
+                child.samples = copySamples(child.samples)
+
+    @staticmethod
+    def updateNode(
+        node: SampleNode, tArr: NDArray[np.float64], dfArr: tVec
+    ) -> None:
+        """
+        Update the derivative values of existing samples in a (sub-)tree.
+
+        :param node: Root of the (sub-)tree
+        :param tArr: Positions of the samples, sorted
+        :param dfArr: New derivative values
+        """
+        if node.left is not None and node.right is not None:
+            k = int(np.searchsorted(tArr, node.mid, side="left"))
+            EdgeSampleStore.updateNode(node.left, tArr[:k], dfArr[:k])
+            EdgeSampleStore.updateNode(node.right, tArr[k:], dfArr[k:])
+            return
+        if tArr.size == 0 or node.samples[0].size == 0:
+            return
+        idx = np.clip(
+            np.searchsorted(node.samples[0], tArr), 0, node.samples[0].size - 1
+        )
+        matches = node.samples[0][idx] == tArr
+        if not node.samples[3].flags.writeable:
+            # seeded samples are copied before they are modified
+            tNode, zNode, fNode, dfNode = node.samples
+            node.samples = (tNode, zNode, fNode, dfNode.copy())
+        node.samples[3][idx[matches]] = dfArr[matches]
+
+    @staticmethod
+    def releaseNode(node: SampleNode, start: float, end: float) -> int:
+        """
+        Remove samples strictly between `start` and `end` from a (sub-)tree.
+
+        :param node: Root of the (sub-)tree
+        :param start: Lower end of the released range
+        :param end: Upper end of the released range
+        :return: The number of bytes freed
+        """
+        if node.hi <= start or end <= node.lo:
+            return 0
+        if node.left is not None and node.right is not None:
+            return EdgeSampleStore.releaseNode(
+                node.left, start, end
+            ) + EdgeSampleStore.releaseNode(node.right, start, end)
+        tArr = node.samples[0]
+        i = int(np.searchsorted(tArr, start, side="right"))
+        j = int(np.searchsorted(tArr, end, side="left"))
+        if i >= j:
+            return 0
+        oldBytes = node.nbytes
+        tArr, zArr, fArr, dfArr = node.samples
+        node.samples = (
+            np.concatenate((tArr[:i], tArr[j:])),
+            np.concatenate((zArr[:i], zArr[j:])),
+            np.concatenate((fArr[:i], fArr[j:])),
+            np.concatenate((dfArr[:i], dfArr[j:])),
+        )
+        return oldBytes - node.nbytes
+
+    @staticmethod
+    def countBytes(node: SampleNode) -> int:
+        """
+        Count the bytes held by the samples of a (sub-)tree.
+
+        :param node: Root of the (sub-)tree
+        :return: Number of bytes held by the (sub-)tree
+        """
+        if node.left is not None and node.right is not None:
+            return EdgeSampleStore.countBytes(
+                node.left
+            ) + EdgeSampleStore.countBytes(node.right)
+        return node.nbytes
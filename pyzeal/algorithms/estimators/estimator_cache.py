@@ -6,29 +6,194 @@ Authors:\n
 - Philipp Schuette
 """
 
-from logging import DEBUG
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from sys import getsizeof
+from typing import Literal, Optional, Set, Tuple
 
+from pyzeal.algorithms.estimators.constants import (
+    DEFAULT_LATTICE_SPACING,
+    LATTICE_REFINE,
+    MAX_CACHE_BYTES,
+    MAX_EDGE_SAMPLE_BYTES,
+    MAX_ESTIMATOR_CACHE_BYTES,
+)
+from pyzeal.algorithms.estimators.edge_store import EdgeSampleStore
 from pyzeal.pyzeal_logging.loggable import Loggable
 
+# type aliases for lattice points and cache keys
+tLatticePoint = Tuple[int, int]
+tCacheKey = Tuple[int, tLatticePoint, tLatticePoint]
+tLineKey = Tuple[Literal["horizontal", "vertical"], int]
+
 
 class EstimatorCache(Loggable):
     """
     A simple in-memory cache that can store and retrieve total argument changes
-    along horizontal and vertical lines in the complex plane.
+    along horizontal and vertical lines in the complex plane. Lines are keyed
+    by the integer coordinates of their end points on a lattice which is fine
+    compared to the requested precision, such that end points computed along
+    different code paths coincide. Each line is stored in a single (canonical)
+    orientation and the least recently used lines are evicted once the cache
+    exceeds its memory cap. Raw samples of the target function along lines
+    are kept in an `EdgeSampleStore` shared by all estimators using the cache.
     """
 
-    __slots__ = ("_cache", "cacheHits", "cacheMisses")
+    __slots__ = (
+        "_cache",
+        "_orders",
+        "origin",
+        "spacing",
+        "maxBytes",
+        "bytesUsed",
+        "cacheHits",
+        "cacheMisses",
+        "samples",
+    )
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        maxBytes: int = MAX_ESTIMATOR_CACHE_BYTES,
+        maxSampleBytes: int = MAX_EDGE_SAMPLE_BYTES,
+    ) -> None:
         """
         Initializes a new `EstimatorCache`.
+
+        :param maxBytes: Maximal (estimated) number of bytes held by the cache
+        :param maxSampleBytes: Maximal number of bytes held by samples of the
+            target function along lines
         """
-        self._cache: Dict[int, Dict[Tuple[complex, complex], complex]] = {}
+        self._cache: "OrderedDict[tCacheKey, complex]" = OrderedDict()
+        self._orders: Set[int] = set()
+        self.origin: Tuple[float, float] = (0.0, 0.0)
+        self.spacing: Tuple[float, float] = (
+            DEFAULT_LATTICE_SPACING,
+            DEFAULT_LATTICE_SPACING,
+        )
+        self.maxBytes = maxBytes
+        self.bytesUsed = 0
         self.logger.info("initialized a new argument estimator cache...")
-        # cache hits and misses are only recorded if logging is set to DEBUG
         self.cacheHits = 0
         self.cacheMisses = 0
+        self.samples = EdgeSampleStore(maxSampleBytes)
+
+    @staticmethod
+    def withMemoryCap(maxCacheBytes: int) -> "EstimatorCache":
+        """
+        Construct a cache whose argument changes and samples together hold at
+        most (approximately) `maxCacheBytes` bytes. The cap is split between
+        both in the ratio of their default caps.
+
+        :param maxCacheBytes: Maximal number of bytes held by the cache
+        :return: the new cache
+        """
+        maxBytes = maxCacheBytes * MAX_ESTIMATOR_CACHE_BYTES // MAX_CACHE_BYTES
+        return EstimatorCache(
+            maxBytes=maxBytes, maxSampleBytes=maxCacheBytes - maxBytes
+        )
+
+    @property
+    def totalBytesUsed(self) -> int:
+        """
+        Return the (estimated) number of bytes held by argument changes and
+        samples of the target function.
+
+        :return: the number of bytes held by the cache
+        """
+        return self.bytesUsed + self.samples.bytesUsed
+
+    @property
+    def orders(self) -> Set[int]:
+        """
+        Returns the orders of moments which have been stored in the cache.
+
+        :return: Orders of moments stored in the cache.
+        """
+        return self._orders
+
+    def setLattice(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Tuple[int, int],
+    ) -> None:
+        """
+        Derive the lattice on which lines are keyed from the search domain and
+        the requested precision. Entries stored on a previous lattice are
+        discarded.
+
+        :param reRan: Real part of the search domain
+        :param imRan: Imaginary part of the search domain
+        :param precision: Accuracy in real and imaginary parts
+        """
+        self.reset()
+        self.origin = (reRan[0], imRan[0])
+        self.spacing = (
+            10 ** (-precision[0]) / LATTICE_REFINE,
+            10 ** (-precision[1]) / LATTICE_REFINE,
+        )
+        self.logger.debug(
+            "estimator cache lattice has spacing %s!", str(self.spacing)
+        )
+
+    def toLattice(self, z: complex) -> tLatticePoint:
+        """
+        Map a complex number to the nearest point of the lattice.
+
+        :param z: Complex number to map
+        :return: Integer coordinates of the nearest lattice point
+        """
+        return (
+            round((z.real - self.origin[0]) / self.spacing[0]),
+            round((z.imag - self.origin[1]) / self.spacing[1]),
+        )
+
+    def toLineKey(
+        self, pos: Literal["horizontal", "vertical"], coord: float
+    ) -> tLineKey:
+        """
+        Map a horizontal or vertical line to the key of the nearest lattice
+        line, e.g. for looking up samples in `samples`.
+
+        :param pos: Orientation of the line
+        :param coord: Imaginary (horizontal) or real (vertical) part of the
+            line
+        :return: Orientation and integer coordinate of the lattice line
+        """
+        if pos == "horizontal":
+            return pos, round((coord - self.origin[1]) / self.spacing[1])
+        return pos, round((coord - self.origin[0]) / self.spacing[0])
+
+    def fromLineKey(
+        self, line: tLineKey
+    ) -> Tuple[Literal["horizontal", "vertical"], float]:
+        """
+        Map the key of a lattice line back to its orientation and coordinate.
+
+        :param line: Orientation and integer coordinate of the lattice line
+        :return: Orientation and imaginary (horizontal) or real (vertical)
+            part of the line
+        """
+        pos, coord = line
+        if pos == "horizontal":
+            return pos, self.origin[1] + coord * self.spacing[1]
+        return pos, self.origin[0] + coord * self.spacing[0]
+
+    def toKey(
+        self, order: int, zStart: complex, zEnd: complex
+    ) -> Tuple[tCacheKey, int]:
+        """
+        Calculate the canonical key of a line together with the sign relating
+        the orientation of the line to the canonical orientation.
+
+        :param order: Order of the moment
+        :param zStart: Starting point of the line
+        :param zEnd: End point of the line
+        :return: Canonical key and orientation of the line
+        """
+        start, end = self.toLattice(zStart), self.toLattice(zEnd)
+        if end < start:
+            return (order, end, start), -1
+        return (order, start, end), 1
 
     def store(
         self,
@@ -39,23 +204,29 @@ class EstimatorCache(Loggable):
     ) -> None:
         """
         Store the total argument change associated with a horizontally or
-        vertically oriented range of complex numbers.
+        vertically oriented range of complex numbers. The argument change
+        along the reversed range is implied.
 
         :param order: Order of the moment to be stored
         :param zStart: Starting point of the line
         :param zEnd: End point of the line
         :param argument: Total argument change
         """
-        if (orderCache := self._cache.get(order, None)) is None:
-            self._cache[order] = {(zStart, zEnd): argument}
+        key, sign = self.toKey(order, zStart, zEnd)
+        if key in self._cache:
+            self._cache.move_to_end(key)
         else:
-            orderCache[(zStart, zEnd)] = argument
+            self.bytesUsed += EstimatorCache.entrySize(key)
+        self._cache[key] = sign * argument
+        self._orders.add(order)
         self.logger.debug(
-            "stored value %s under key (%s, %d) in estimator cache!",
+            "stored value %s under key %s in estimator cache!",
             str(argument),
-            str((order, (zStart, zEnd))),
-            order,
+            str(key),
         )
+        while self.bytesUsed > self.maxBytes and len(self._cache) > 1:
+            oldKey, _ = self._cache.popitem(last=False)
+            self.bytesUsed -= EstimatorCache.entrySize(oldKey)
 
     def retrieve(
         self,
@@ -74,19 +245,31 @@ class EstimatorCache(Loggable):
         :return: Total argument change if the cache contains a value, else
             None is returned.
         """
-        if (orderCache := self._cache.get(order, None)) is None:
-            value = None
-        else:
-            value = orderCache.get((zStart, zEnd), None)
+        key, sign = self.toKey(order, zStart, zEnd)
+        if (value := self._cache.get(key, None)) is None:
+            self.cacheMisses += 1
+            return None
+        self.cacheHits += 1
+        self._cache.move_to_end(key)
         self.logger.debug(
             "retrieved value %s under key %s from estimator cache!",
             str(value),
-            str((zStart, zEnd)),
+            str(key),
         )
-        if self.logger.isEnabledFor(DEBUG):
-            self.cacheHits += 1 if value else 0
-            self.cacheMisses += 1 if not value else 0
-        return value
+        return sign * value
+
+    def contains(self, order: int, zStart: complex, zEnd: complex) -> bool:
+        """
+        Check if the total argument change associated with a horizontally or
+        vertically oriented range of complex numbers is present, without
+        counting the lookup as a cache hit or miss.
+
+        :param order: Order of the moment
+        :param zStart: Starting point of the line
+        :param zEnd: End point of the line
+        :return: `True` if the cache contains a value
+        """
+        return self.toKey(order, zStart, zEnd)[0] in self._cache
 
     def remove(
         self,
@@ -96,18 +279,19 @@ class EstimatorCache(Loggable):
     ) -> None:
         """
         Remove the total argument change associated with a horizontally or
-        vertically oriented range of complex numbers.
+        vertically oriented range of complex numbers (in both orientations).
 
         :param order: Order of the moment to remove
         :param zStart: Starting point of the line
         :param zEnd: End point of the line
         """
-        if order in self._cache:
-            value = self._cache[order].pop((zStart, zEnd), None)
+        key, _ = self.toKey(order, zStart, zEnd)
+        if (value := self._cache.pop(key, None)) is not None:
+            self.bytesUsed -= EstimatorCache.entrySize(key)
             self.logger.debug(
                 "removed value %s under key %s from estimator cache!",
                 str(value),
-                str((zStart, zEnd)),
+                str(key),
             )
 
     def dirty(self) -> bool:
@@ -116,13 +300,33 @@ class EstimatorCache(Loggable):
 
         :return: `True` if the cache contains anything.
         """
-        return len(self._cache) > 0
+        return len(self._cache) > 0 or len(self.samples) > 0
 
     def reset(self) -> None:
         """
-        Resets the cache by clearing all stored values and resetting
-        the hit and miss counters.
+        Resets the cache by clearing all stored values and samples and
+        resetting the hit and miss counters.
         """
         self._cache.clear()
+        self.samples.reset()
+        self._orders.clear()
+        self.bytesUsed = 0
         self.cacheHits = 0
         self.cacheMisses = 0
+
+    @staticmethod
+    def entrySize(key: tCacheKey) -> int:
+        """
+        Estimate the number of bytes occupied by a single cache entry.
+
+        :param key: Key of the entry
+        :return: Estimated size of the entry in bytes
+        """
+        _, start, end = key
+        return (
+            getsizeof(key)
+            + getsizeof(start)
+            + getsizeof(end)
+            + sum(getsizeof(coord) for coord in start + end)
+            + getsizeof(0j)
+        )
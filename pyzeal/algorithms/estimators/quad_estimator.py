@@ -1,20 +1,24 @@
 """
 This module provides an argument estimator based on numerical integration
-using Romberg quadrature.
+using adaptive Gauss-Kronrod quadrature.
 
 Authors:\n
 - Philipp Schuette
 """
 
-from typing import Tuple
+from typing import ClassVar, Literal, Optional, Tuple, cast
 
 import numpy as np
-from scipy.integrate import romb  # type: ignore
+from numpy.typing import NDArray
 
 from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
 from pyzeal.algorithms.estimators.constants import (
-    EXP_SAMPLE_POINTS,
-    MAX_SAMPLE_POINTS,
+    GAUSS_WEIGHTS,
+    KRONROD_NODES,
+    KRONROD_WEIGHTS,
+    MAX_QUAD_DEPTH,
+    MAX_QUAD_INTERVALS,
+    QUAD_TOL,
 )
 from pyzeal.algorithms.estimators.estimator_cache import EstimatorCache
 from pyzeal.pyzeal_types.root_types import tVec
@@ -24,11 +28,28 @@ from pyzeal.utils.root_context import RootContext
 class QuadratureEstimator(ArgumentEstimator):
     """
     This class implements an argument estimator using numerical quadrature
-    to integrate the logarithmic derivative.
+    to integrate the logarithmic derivative. Lines are bisected adaptively
+    such that only sub-intervals close to roots of the target function are
+    refined.
     """
 
     __slots__ = ("_cache",)
 
+    # nodes and weights of the 15-point Kronrod rule on [-1, 1] in ascending
+    # order, the embedded 7-point Gauss rule uses every other node
+    nodes: ClassVar[NDArray[np.float64]] = np.concatenate(
+        (-np.array(KRONROD_NODES[:-1]), np.array(KRONROD_NODES[::-1]))
+    )
+    kronrodWeights: ClassVar[NDArray[np.float64]] = np.concatenate(
+        (np.array(KRONROD_WEIGHTS[:-1]), np.array(KRONROD_WEIGHTS[::-1]))
+    )
+    gaussWeights: ClassVar[NDArray[np.float64]] = np.concatenate(
+        (np.array(GAUSS_WEIGHTS[:-1]), np.array(GAUSS_WEIGHTS[::-1]))
+    )
+    # the first quadrature step samples all Kronrod nodes of an edge
+    edgeNodes: ClassVar[Optional[NDArray[np.float64]]] = 0.5 + 0.5 * nodes
+    edgeDerivative: ClassVar[bool] = True
+
     def __init__(self, *, cache: EstimatorCache) -> None:
         """
         Initialize a `QuadratureEstimator`.
@@ -57,77 +78,138 @@ class QuadratureEstimator(ArgumentEstimator):
             argument estimation.
         :return: The moment as calculated along the given line.
         """
+        return complex(
+            self.integrateMoments(np.array([order]), zStart, zEnd, context)[0]
+        )
+
+    # docstr-coverage:inherited
+    def calcMomentsAlongLine(
+        self,
+        numMoments: int,
+        zStart: complex,
+        zEnd: complex,
+        context: RootContext,
+    ) -> tVec:
+        return self.integrateMoments(
+            np.arange(numMoments), zStart, zEnd, context
+        )
+
+    def integrateMoments(
+        self,
+        orders: NDArray[np.int_],
+        zStart: complex,
+        zEnd: complex,
+        context: RootContext,
+    ) -> tVec:
+        """
+        Calculate the moments of given `orders` of the logarithmic derivative
+        along the line given by `zStart` and `zEnd` from a single set of
+        samples. Sampling is refined until all moments have converged.
+
+        :param orders: Moments to compute
+        :param zStart: Start z-value
+        :param zEnd: End z-value
+        :param context: `RootContext` containing the necessary information
+        :raises ValueError: An error is raised when no derivative is supplied,
+            as the `QuadratureEstimator` does not support derivative-free
+            argument estimation.
+        :return: The moments as calculated along the given line.
+        """
         if context.df is None:
             raise ValueError(
                 "derivative required for quadrature-based argument estimation!"
             )
 
-        samplePts = EXP_SAMPLE_POINTS
-        zArr, funcArr = self.genFuncArr(
-            zStart, zEnd, context, 2**samplePts + 1
-        )
-        funcArr = context.df(zArr) * zArr**order / funcArr
-        distance = abs(zEnd - zStart)
-
-        realResult = romb(np.real(funcArr), distance / (2**samplePts))
-        imagResult = romb(np.imag(funcArr), distance / (2**samplePts))
-        while samplePts <= MAX_SAMPLE_POINTS:
-            # for expensive target functions merging of arrays with function
-            # values is preferable over recalculation - for inexpensive targets
-            # the converse is true:
-            merge = samplePts >= EXP_SAMPLE_POINTS + 2
-            if merge:
-                zStart = (zArr[0] + zArr[1]) / 2
-                zEnd = (zArr[-1] + zArr[-2]) / 2
-                newZArr, newFuncArr = self.genFuncArr(
-                    zStart, zEnd, context, 2**samplePts
-                )
-                newFuncArr = (
-                    context.df(newZArr) * newZArr**order / newFuncArr
-                )
-                zArr, funcArr = QuadratureEstimator.mergeArrays(
-                    (zArr, funcArr), (newZArr, newFuncArr)
-                )
-
-                samplePts += 1
-            else:
-                samplePts += 1
-                zArr, funcArr = self.genFuncArr(
-                    zStart, zEnd, context, 2**samplePts + 1
-                )
-                funcArr = context.df(zArr) * zArr**order / funcArr
-
-            newRealResult = romb(np.real(funcArr), distance / (2**samplePts))
-            newImagResult = romb(np.imag(funcArr), distance / (2**samplePts))
-            if (
-                abs(newRealResult - realResult) < 1e-3
-                and abs(newImagResult - imagResult) < 1e-3
-            ):
+        # intervals [lo, hi] of the parametrization z = zStart + t * (zEnd -
+        # zStart) which remain to be integrated, in ascending order
+        lo, hi = np.zeros(1), np.ones(1)
+        result = np.zeros(orders.size, dtype=np.complex128)
+        # tolerances of higher moments scale with the magnitude of z^order
+        tol = QUAD_TOL * max(abs(zStart), abs(zEnd), 1.0) ** orders[:, None]
+        for depth in range(MAX_QUAD_DEPTH + 1):
+            center, halfWidth = 0.5 * (lo + hi), 0.5 * (hi - lo)
+            tArr = (center[:, None] + halfWidth[:, None] * self.nodes).ravel()
+            zArr, funcArr = self.genIntegrandArr(zStart, zEnd, context, tArr)
+            integrand = (zArr[None, :] ** orders[:, None] * funcArr).reshape(
+                orders.size, lo.size, self.nodes.size
+            )
+            kronrod = halfWidth * (integrand @ self.kronrodWeights)
+            gauss = halfWidth * (integrand[:, :, 1::2] @ self.gaussWeights)
+            # local tolerances are proportional to the length of intervals
+            converged = np.all(abs(kronrod - gauss) <= tol * (hi - lo), axis=0)
+            if depth == MAX_QUAD_DEPTH:
+                self.logger.warning("maximum quadrature depth reached!")
+                converged[:] = True
+            elif 2 * np.count_nonzero(~converged) > MAX_QUAD_INTERVALS:
+                self.logger.warning("maximum number of intervals reached!")
+                converged[:] = True
+            result += kronrod[:, converged].sum(axis=1)
+            if converged.all():
                 break
-            realResult = newRealResult
-            imagResult = newImagResult
+            # bisect the remaining intervals (keeping ascending order)
+            lo, hi = lo[~converged], hi[~converged]
+            mid = 0.5 * (lo + hi)
+            lo = np.column_stack((lo, mid)).ravel()
+            hi = np.column_stack((mid, hi)).ravel()
+            self.logger.debug(
+                "bisecting %d intervals on the line [%s, %s] (depth %d)",
+                lo.size // 2,
+                str(zStart),
+                str(zEnd),
+                depth + 1,
+            )
 
         # result (divided by 1j) is only necessarily real if order=0!
-        return complex(
-            (zEnd - zStart) * (-1j * realResult + imagResult) / distance
-        )
+        return -1j * (zEnd - zStart) * result
 
     # docstr-coverage:inherited
     @property
     def cache(self) -> EstimatorCache:
         return self._cache
 
-    @staticmethod
-    def mergeArrays(
-        oldArrays: Tuple[tVec, tVec], newArrays: Tuple[tVec, tVec]
+    def genIntegrandArr(
+        self,
+        zStart: complex,
+        zEnd: complex,
+        context: RootContext,
+        tArr: NDArray[np.float64],
     ) -> Tuple[tVec, tVec]:
         """
-        TODO.
+        Calculate the logarithmic derivative of the target function at the
+        points `zStart + tArr * (zEnd - zStart)` of the line `[zStart, zEnd]`.
+        Along horizontal and vertical lines samples are shared with other
+        estimators via `cache.samples`.
+
+        :param zStart: Start z-value
+        :param zEnd: End z-value
+        :param context: `RootContext` containing the necessary information
+        :param tArr: Ascending parameters of points in `[0, 1]`
+        :return: Points along with the logarithmic derivative at these points
         """
-        zArr, funcArr = oldArrays
-        newZArr, newFuncArr = newArrays
-        zArr = np.append(np.vstack((zArr[:-1], newZArr)).ravel("F"), zArr[-1])
-        funcArr = np.append(
-            np.vstack((funcArr[:-1], newFuncArr)).ravel("F"), funcArr[-1]
+        if context.df is None:
+            raise ValueError(
+                "derivative required for quadrature-based argument estimation!"
+            )
+        pos: Literal["horizontal", "vertical"]
+        if zStart.imag == zEnd.imag:
+            pos, coord = "horizontal", zStart.imag
+            start, end = zStart.real, zEnd.real
+        elif zStart.real == zEnd.real:
+            pos, coord = "vertical", zStart.real
+            start, end = zStart.imag, zEnd.imag
+        else:
+            zArr, funcArr = self.evalFuncArr(
+                cast(tVec, zStart + tArr * (zEnd - zStart)),
+                "horizontal",
+                context,
+            )
+            return zArr, context.evalDerivative(zArr, funcArr) / funcArr
+        # samples are stored in ascending order along the line
+        reverse = end < start
+        posArr = start + (tArr[::-1] if reverse else tArr) * (end - start)
+        zArr, funcArr, derivArr = self.sampleLine(
+            pos, coord, posArr, context, derivative=True
         )
-        return zArr, funcArr
+        if reverse:
+            zArr, funcArr, derivArr = zArr[::-1], funcArr[::-1], derivArr[::-1]
+        return zArr, derivArr / funcArr
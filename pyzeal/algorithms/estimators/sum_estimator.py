@@ -6,25 +6,27 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Dict, Literal, Tuple, Union, cast
+from typing import ClassVar, List, Literal, Tuple, cast
 
 import numpy as np
+from numpy.typing import NDArray
 
 from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
-from pyzeal.algorithms.estimators.constants import MAX_Z_LENGTH, Z_REFINE
-from pyzeal.algorithms.estimators.estimator_cache import EstimatorCache
+from pyzeal.algorithms.estimators.constants import (
+    FILL_TOL,
+    MAX_LINE_DELTA_PHI,
+    MAX_Z_LENGTH,
+    MIN_SUPPORT_PTS,
+    SAMPLE_TOL,
+    Z_REFINE,
+)
+from pyzeal.algorithms.estimators.estimator_cache import (
+    EstimatorCache,
+    tLineKey,
+)
 from pyzeal.pyzeal_types.root_types import tVec
 from pyzeal.utils.root_context import RootContext
 
-# type alias for internal caches
-tCache = Dict[
-    Tuple[float, int],
-    Dict[
-        Tuple[float, Union[Literal["start"], Literal["end"]]],
-        Tuple[tVec, tVec],
-    ],
-]
-
 
 class SummationEstimator(ArgumentEstimator):
     """
@@ -35,13 +37,13 @@ class SummationEstimator(ArgumentEstimator):
     derivative.
     """
 
+    reusesLineSamples: ClassVar[bool] = True
+
     __slots__ = (
         "numPts",
         "deltaPhi",
         "maxPrecision",
         "_cache",
-        "cacheHorizontal",
-        "cacheVertical",
     )
 
     def __init__(
@@ -66,9 +68,6 @@ class SummationEstimator(ArgumentEstimator):
         self.deltaPhi = deltaPhi
         self.maxPrecision = maxPrecision
         self._cache = cache
-        # initialize additional internal caches to avoid function re-evals
-        self.cacheHorizontal: tCache = {}
-        self.cacheVertical: tCache = {}
 
         self.logger.info("initialized new phase summation based estimator...")
 
@@ -98,149 +97,88 @@ class SummationEstimator(ArgumentEstimator):
             parallel to either the real or imaginary axis.
         :return: The moment as calculated along the given line.
         """
-        # look for required function values in the internal caches
-        x1, y1 = zStart.real, zStart.imag
-        x2, y2 = zEnd.real, zEnd.imag
-        phi: complex
-        # handle the case of horizontal line first
-        if y1 == y2:
-            phi = self.retrieveCachedHorizontal(order, x1, x2, y1, context)
-        elif x1 == x2:
-            phi = self.retrieveCachedVertical(order, y1, y2, x1, context)
-        else:
+        if zStart.imag != zEnd.imag and zStart.real != zEnd.real:
             raise ValueError(
                 f"{zStart} and {zEnd} must define an axis-parallel line!"
             )
+        return cast(
+            float, self.genPhiArr(order, zStart, zEnd, context)[1].sum()
+        )
 
-        return phi
-
-    def retrieveCachedHorizontal(
-        self, order: int, x1: float, x2: float, y: float, context: RootContext
-    ) -> complex:
+    # docstr-coverage:inherited
+    def calcArgumentGrid(
+        self,
+        reGrid: NDArray[np.float64],
+        imGrid: NDArray[np.float64],
+        context: RootContext,
+    ) -> NDArray[np.float64]:
+        # every grid line is sampled (and refined) once along its full length
+        horizontal = np.array(
+            [
+                self.calcEdgePhases("horizontal", y, reGrid, context)
+                for y in imGrid
+            ],
+            dtype=np.float64,
+        ).reshape(imGrid.size, reGrid.size - 1)
+        vertical = np.array(
+            [
+                self.calcEdgePhases("vertical", x, imGrid, context)
+                for x in reGrid
+            ],
+            dtype=np.float64,
+        ).reshape(reGrid.size, imGrid.size - 1)
+        # edges are traversed counterclockwise around each cell
+        return cast(
+            NDArray[np.float64],
+            horizontal[:-1].T
+            - horizontal[1:].T
+            + vertical[1:]
+            - vertical[:-1],
+        )
+
+    def calcEdgePhases(
+        self,
+        pos: Literal["horizontal", "vertical"],
+        coord: float,
+        vertices: NDArray[np.float64],
+        context: RootContext,
+    ) -> NDArray[np.float64]:
         """
-        Try to retrieve the moment along a horizontal line from cache,
-        calculating it if necessary.
-
-        :param order: Moment to retrieve
-        :param x1: Starting point x-value
-        :param x2: End point x-value
-        :param y: y-value of the line
+        Calculate the changes in argument along all edges between successive
+        (ascending) `vertices` of a horizontal or vertical grid line. The line
+        is refined as a whole and the changes in argument along its edges are
+        stored in the cache.
+
+        :param pos: Orientation of the line
+        :param coord: y-value (horizontal) or x-value (vertical) of the line
+        :param vertices: x-values (horizontal) or y-values (vertical) of the
+            vertices on the line
         :param context: `RootContext` containing the necessary information
-        :return: The moment as calculated along the given line.
-        """
-        cache = self.cacheHorizontal
-        # the internal caches only contain positively oriented lines
-        sign = 1 if x1 < x2 else -1
-        x1, x2 = sorted((x1, x2))
-        if (y, order) in cache:
-            if (x1, "start") in cache[(y, order)]:
-                self.logger.debug(
-                    "horizontal line start in internal cache found - dividing!"
-                )
-                value = cache[(y, order)][(x1, "start")]
-                if len((indices := np.where(np.real(value[0]) <= x2)[0])) < 3:
-                    self.logger.warning("must regenerate support points!")
-                    newValue = self.genPhiArr(
-                        order, x1 + 1j * y, x2 + 1j * y, context
-                    )
-                else:
-                    middleIdx = indices[-1]
-                    newValue = (
-                        value[0][: middleIdx + 1],
-                        value[1][: middleIdx + 1],
-                    )
-                self.storeCache(y, order, x1, x2, cache, newValue)
-                return cast(float, sign * newValue[1].sum())
-            if (x2, "end") in cache[(y, order)]:
-                self.logger.debug(
-                    "horizontal line end in internal cache found - dividing!"
-                )
-                value = cache[(y, order)][(x2, "end")]
-
-                if len((indices := np.where(x1 <= np.real(value[0]))[0])) < 3:
-                    self.logger.warning("must regenerate support points!")
-                    newValue = self.genPhiArr(
-                        order, x1 + 1j * y, x2 + 1j * y, context
-                    )
-                else:
-                    middleIdx = indices[0]
-                    newValue = (
-                        value[0][middleIdx:],
-                        value[1][middleIdx:],
-                    )
-                self.storeCache(y, order, x1, x2, cache, newValue)
-                return cast(float, sign * newValue[1].sum())
-
-        self.logger.debug("internal cache miss on horizontal line!")
-        newValue = self.genPhiArr(order, x1 + 1j * y, x2 + 1j * y, context)
-
-        if (y, order) not in cache:
-            cache[(y, order)] = {}
-        self.storeCache(y, order, x1, x2, cache, newValue)
-        return cast(float, sign * newValue[1].sum())
-
-    def retrieveCachedVertical(
-        self, order: int, y1: float, y2: float, x: float, context: RootContext
-    ) -> complex:
+        :return: Changes in argument along the edges in ascending order
         """
-        Try to retrieve the moment along a vertical line from cache,
-        calculating it if necessary.
-
-        :param order: Moment to retrieve
-        :param y1: Starting point y-value
-        :param y2: End point y-value
-        :param x: x-value of the line
-        :param context: `RootContext` containing the necessary information.
-        :return: The moment as calculated along the given line.
-        """
-        cache = self.cacheVertical
-        sign = 1 if y1 < y2 else -1
-        y1, y2 = sorted((y1, y2))
-        if (x, order) in cache:
-            if (y1, "start") in cache[(x, order)]:
-                self.logger.debug(
-                    "vertical line start in internal cache found - dividing!"
-                )
-                value = cache[(x, order)][(y1, "start")]
-                if len((indices := np.where(np.imag(value[0]) <= y2)[0])) < 3:
-                    self.logger.warning("must regenerate support points!")
-                    newValue = self.genPhiArr(
-                        order, x + 1j * y1, x + 1j * y2, context
-                    )
-                else:
-                    middleIdx = indices[-1]
-                    newValue = (
-                        value[0][: middleIdx + 1],
-                        value[1][: middleIdx + 1],
-                    )
-                self.storeCache(x, order, y1, y2, cache, newValue)
-                return cast(float, sign * newValue[1].sum())
-            if (y2, "end") in cache[(x, order)]:
-                self.logger.debug(
-                    "vertical line end in internal cache found - dividing!"
-                )
-                value = cache[(x, order)][(y2, "end")]
-                if len((indices := np.where(np.imag(value[0]) <= y2)[0])) < 3:
-                    self.logger.warning("must regenerate support points!")
-                    newValue = self.genPhiArr(
-                        order, x + 1j * y1, x + 1j * y2, context
-                    )
-                else:
-                    middleIdx = np.where(y1 <= np.imag(value[0]))[0][0]
-                    newValue = (
-                        value[0][middleIdx:],
-                        value[1][middleIdx:],
-                    )
-                self.storeCache(x, order, y1, y2, cache, newValue)
-                return cast(float, sign * newValue[1].sum())
-
-        self.logger.debug("internal cache miss on vertical line!")
-        newValue = self.genPhiArr(order, x + 1j * y1, x + 1j * y2, context)
-
-        if (x, order) not in cache:
-            cache[(x, order)] = {}
-        self.storeCache(x, order, y1, y2, cache, newValue)
-        return cast(float, sign * newValue[1].sum())
+        # vertices are sampled first such that they delimit support points
+        self.sampleLine(pos, coord, vertices, context)
+        zVertices = cast(
+            tVec,
+            vertices + 1j * coord
+            if pos == "horizontal"
+            else coord + 1j * vertices,
+        )
+        zArr, phiArr = self.genPhiArr(
+            0, complex(zVertices[0]), complex(zVertices[-1]), context
+        )
+        tArr = zArr.real if pos == "horizontal" else zArr.imag
+        tol = SAMPLE_TOL * max(
+            abs(vertices[0]), abs(vertices[-1]), vertices[-1] - vertices[0]
+        )
+        idx = np.searchsorted(tArr, vertices - tol)
+        cumPhi = np.concatenate(([0.0], np.cumsum(phiArr.real)))
+        edgePhases: NDArray[np.float64] = np.diff(cumPhi[idx])
+        for zStart, zEnd, edgePhase in zip(
+            zVertices[:-1], zVertices[1:], edgePhases
+        ):
+            self.cache.store(0, zStart, zEnd, edgePhase)
+        return edgePhases
 
     def genPhiArr(
         self,
@@ -255,7 +193,9 @@ class SummationEstimator(ArgumentEstimator):
         `[zStart, zEnd]`. Zeros of the target function found during this
         procedure are put into `context.container` immediately and the complex
         line is adjusted by translating into direction `pos` by a small offset.
-        The number of support points on the line is adjusted dynamically.
+        The number of support points on the line is adjusted dynamically and
+        samples of the target function already present in the cache are
+        reused.
 
         :param order: The moment which is to be calculated.
         :param zStart: Starting point of the line segment.
@@ -268,77 +208,253 @@ class SummationEstimator(ArgumentEstimator):
                 f"summation estimator is not implemented for order={order}>0!"
             )
 
-        # build the array f(z_{k+1})/f(z_k) of quotients of successive values
-        zArr, funcArr = self.genFuncArr(zStart, zEnd, context, self.numPts)
-        funcArr = funcArr[1:] / funcArr[:-1]
+        pos: Literal["horizontal", "vertical"]
+        if zStart.imag == zEnd.imag:
+            pos, coord = "horizontal", zStart.imag
+            start, end = zStart.real, zEnd.real
+        else:
+            pos, coord = "vertical", zStart.real
+            start, end = zStart.imag, zEnd.imag
+        # support points are generated in ascending order along the line
+        tArr, zArr, funcArr, deltaPhi = self.genSupportPoints(
+            pos, coord, min(start, end), max(start, end), context
+        )
         # compute change in argument between two points on the line
-        phiArr = np.arctan2(funcArr.imag, funcArr.real)
+        phiArr = SummationEstimator.calcPhaseDiffs(funcArr)
 
-        # loop over entries in phiArr larger than deltaPhi with dynamically
-        # increasing refinement size
-        idxPhi = np.where(abs(phiArr) >= self.deltaPhi)[0]
+        # refine all intervals with phase changes larger than deltaPhi at once
+        # with dynamically increasing refinement size
         idx = 0
-        while idxPhi.size > 0:
-            idx += 1
-            # refine grid between z values at large phi values
-            k = idxPhi[0]
-            self.logger.debug(
-                "Refining the line between [%s, %s] because phase change=%s",
-                str(zArr[k]),
-                str(zArr[k + 1]),
-                str(phiArr[k]),
-            )
-            if abs(zArr[k] - zArr[k + 1]) < self.maxPrecision:
-                self.logger.warning("maximum z-refinement depth reached!")
+        depthReached = False
+        while True:
+            offending = abs(phiArr) >= deltaPhi
+            exhausted = offending & (np.diff(tArr) < self.maxPrecision)
+            if exhausted.any():
+                if not depthReached:
+                    self.logger.warning("maximum z-refinement depth reached!")
+                    depthReached = True
+                offending &= ~exhausted
+            idxPhi = np.nonzero(offending)[0]
+            if idxPhi.size == 0:
                 break
             if len(zArr) > MAX_Z_LENGTH * self.numPts:
                 self.logger.warning("maximum z-length reached!")
                 break
-            refinementFactor = int(
-                idx * Z_REFINE * abs(phiArr[k]) / self.deltaPhi
+            idx += 1
+            self.logger.debug(
+                "refining %d intervals on the line [%s, %s] (pass %d)",
+                idxPhi.size,
+                str(zArr[0]),
+                str(zArr[-1]),
+                idx,
             )
-            zArrRefinement, funcArr = self.genFuncArr(
-                cast(complex, zArr[k]),
-                cast(complex, zArr[k + 1]),
-                context,
-                refinementFactor,
+            # number of new support points inside of each offending interval
+            numNew = np.maximum(
+                (idx * Z_REFINE * abs(phiArr[idxPhi]) / deltaPhi).astype(
+                    np.int64
+                )
+                - 2,
+                1,
             )
-            funcArr = funcArr[1:] / funcArr[:-1]
-            phiArrRefinement = np.arctan2(funcArr.imag, funcArr.real)
-
-            # concatenate old and new arrays
-            zArr = np.concatenate(
-                (zArr[: k + 1], zArrRefinement[1:-1], zArr[k + 1 :])
+            budget = MAX_Z_LENGTH * self.numPts - len(zArr)
+            if (total := int(numNew.sum())) > budget:
+                numNew = np.maximum((numNew * budget) // total, 1)
+            tRefinement = SummationEstimator.genRefinement(
+                tArr, idxPhi, numNew
             )
-
-            phiArr = np.concatenate(
-                (phiArr[:k], phiArrRefinement, phiArr[k + 1 :])
+            zRefinement, funcRefinement, _ = self.sampleNew(
+                pos, coord, tRefinement, context
             )
-            idxPhi = np.where(abs(phiArr) >= self.deltaPhi)[0]
 
+            # insert new support points and rebuild phases once per pass
+            insertAt = np.repeat(idxPhi + 1, numNew)
+            tArr = np.insert(tArr, insertAt, tRefinement)
+            zArr = np.insert(zArr, insertAt, zRefinement)
+            funcArr = np.insert(funcArr, insertAt, funcRefinement)
+            phiArr = SummationEstimator.calcPhaseDiffs(funcArr)
+
+        if end < start:
+            return zArr[::-1], -phiArr[::-1]
         return zArr, phiArr
 
-    def storeCache(
+    def genSupportPoints(
         self,
-        z: float,
-        order: int,
+        pos: Literal["horizontal", "vertical"],
+        coord: float,
         start: float,
         end: float,
-        cache: tCache,
-        newValue: Tuple[tVec, tVec],
-    ) -> None:
+        context: RootContext,
+    ) -> Tuple[NDArray[np.float64], tVec, tVec, float]:
+        """
+        Generate the initial support points on the segment `[start, end]` of a
+        horizontal or vertical line. Samples already present in the cache are
+        reused and new samples are only calculated at the end points and
+        inside of gaps which are larger than the initial spacing of support
+        points. Segments of completely sampled ranges inherit the spacing of
+        the range, the spacing of new segments is derived from the phase
+        variation on neighboring parallel lines (see `estimateSpacing`). The
+        threshold for phase changes between support points is scaled
+        accordingly.
+
+        :param pos: Orientation of the line
+        :param coord: y-value (horizontal) or x-value (vertical) of the line
+        :param start: Smaller x-value (horizontal) or y-value (vertical)
+        :param end: Larger x-value (horizontal) or y-value (vertical)
+        :param context: `RootContext` containing the necessary information
+        :return: Positions along the line, support points, function values and
+            the threshold for phase changes between support points
+        """
+        line = self.cache.toLineKey(pos, coord)
+        tol = SAMPLE_TOL * max(abs(start), abs(end), end - start)
+        tOld, zOld, fOld, _ = self.cache.samples.lookup(
+            line, start - tol, end + tol
+        )
+        covering = self.cache.samples.covering(line, start + tol, end - tol)
+        if covering is None:
+            width = end - start
+            spacing = self.estimateSpacing(pos, coord, start, end)
+        else:
+            width, spacing = covering[1] - covering[0], covering[2]
+        # sparse support points allow for proportionally larger phase changes
+        deltaPhi = max(
+            min(
+                self.deltaPhi * spacing * (self.numPts - 1) / width,
+                MAX_LINE_DELTA_PHI,
+            ),
+            self.deltaPhi,
+        )
+
+        # end points are sampled if they are not present yet
+        missing = []
+        if tOld.size == 0 or abs(tOld[0] - start) > tol:
+            missing.append(start)
+        if tOld.size == 0 or abs(tOld[-1] - end) > tol:
+            missing.append(end)
+        tAll = np.sort(np.concatenate((tOld, missing)))
+        gaps = np.diff(tAll)
+        numNew = np.maximum(np.ceil(gaps / spacing - FILL_TOL) - 1, 0).astype(
+            np.int64
+        )
+        idxGap = np.nonzero(numNew)[0]
+        tNew = np.sort(
+            np.concatenate(
+                (
+                    missing,
+                    SummationEstimator.genRefinement(
+                        tAll, idxGap, numNew[idxGap]
+                    ),
+                )
+            )
+        )
+        if tNew.size == 0:
+            return tOld, zOld, fOld, deltaPhi
+        self.logger.debug(
+            "sampling %d new support points on %s line (reusing %d)!",
+            tNew.size,
+            pos,
+            tOld.size,
+        )
+        zNew, fNew, _ = self.sampleNew(pos, coord, tNew, context)
+        if covering is None:
+            # support points on this segment are complete after sampling
+            self.cache.samples.cover(line, start, end, spacing)
+        order = np.argsort(np.concatenate((tOld, tNew)), kind="stable")
+        return (
+            np.concatenate((tOld, tNew))[order],
+            np.concatenate((zOld, zNew))[order],
+            np.concatenate((fOld, fNew))[order],
+            deltaPhi,
+        )
+
+    def estimateSpacing(
+        self,
+        pos: Literal["horizontal", "vertical"],
+        coord: float,
+        start: float,
+        end: float,
+    ) -> float:
         """
-        Store a new value in cache.
-
-        :param z: Real or imaginary part of the line, depending on if the line
-            is horizontal or vertical.
-        :param order: Order of the moment to be calculated
-        :param start: Real or imaginary part of the starting point, depending
-            on line orientation
-        :param end: Real or imaginary part of the starting point, depending
-            on line orientation
-        :param cache: Cache to store the new value in.
-        :param newValue: New value to store.
+        Estimate the initial spacing of support points on a segment which has
+        not been sampled yet. The number of support points is chosen such that
+        the total phase variation on the nearest completely sampled parallel
+        segments (typically the edges of the rectangle which is currently
+        subdivided) is resolved with increments of `deltaPhi`, but remains
+        between `MIN_SUPPORT_PTS` and `numPts`. Without sampled parallel
+        segments `numPts` support points are used.
+
+        :param pos: Orientation of the line
+        :param coord: y-value (horizontal) or x-value (vertical) of the line
+        :param start: Smaller x-value (horizontal) or y-value (vertical)
+        :param end: Larger x-value (horizontal) or y-value (vertical)
+        :return: Spacing of the initial support points
+        """
+        samples = self.cache.samples
+        _, latticeCoord = self.cache.toLineKey(pos, coord)
+        parallel = [
+            line
+            for line in cast(List[tLineKey], samples.coveringLines(start, end))
+            if line[0] == pos and line[1] != latticeCoord
+        ]
+        below = [line for line in parallel if line[1] < latticeCoord]
+        above = [line for line in parallel if line[1] > latticeCoord]
+        neighbors = [max(below, key=lambda line: line[1])] if below else []
+        if above:
+            neighbors.append(min(above, key=lambda line: line[1]))
+        if len(neighbors) == 0:
+            return (end - start) / (self.numPts - 1)
+
+        variation = max(
+            float(
+                abs(
+                    SummationEstimator.calcPhaseDiffs(
+                        samples.lookup(line, start, end)[2]
+                    )
+                ).sum()
+            )
+            for line in neighbors
+        )
+        numPts = min(
+            max(int(np.ceil(variation / self.deltaPhi)) + 1, MIN_SUPPORT_PTS),
+            self.numPts,
+        )
+        self.logger.debug(
+            "phase variation %f on parallel lines yields %d support points!",
+            variation,
+            numPts,
+        )
+        return (end - start) / (numPts - 1)
+
+    @staticmethod
+    def genRefinement(
+        tArr: NDArray[np.float64],
+        idxPhi: NDArray[np.intp],
+        numNew: NDArray[np.int64],
+    ) -> NDArray[np.float64]:
+        """
+        Generate equidistant support points inside of several intervals
+        `[tArr[k], tArr[k + 1]]` of a line at once.
+
+        :param tArr: Positions of support points along the line
+        :param idxPhi: Indices `k` of the intervals to refine
+        :param numNew: Number of new points inside of each interval
+        :return: Positions of new support points, ordered along the line
+        """
+        starts = np.repeat(tArr[idxPhi], numNew)
+        steps = np.repeat(
+            (tArr[idxPhi + 1] - tArr[idxPhi]) / (numNew + 1), numNew
+        )
+        # position of each new point inside of its interval (starting at 1)
+        offsets = np.repeat(np.cumsum(numNew) - numNew, numNew)
+        local = np.arange(1, int(numNew.sum()) + 1) - offsets
+        return starts + local * steps
+
+    @staticmethod
+    def calcPhaseDiffs(funcArr: tVec) -> tVec:
+        """
+        Calculate the changes in argument between successive function values.
+
+        :param funcArr: Function values along a line
+        :return: Changes in argument between successive function values
         """
-        cache[(z, order)][(start, "start")] = newValue
-        cache[(z, order)][(end, "end")] = newValue
+        quotients = funcArr[1:] / funcArr[:-1]
+        return cast(tVec, np.arctan2(quotients.imag, quotients.real))
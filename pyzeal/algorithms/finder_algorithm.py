@@ -10,6 +10,7 @@ Authors:\n
 """
 
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from pyzeal.pyzeal_logging.loggable import Loggable
 from pyzeal.utils.root_context import RootContext
@@ -22,6 +23,10 @@ class FinderAlgorithm(ABC, Loggable):
     virtual method `calcRoots` appropriately.
     """
 
+    # algorithms which cannot operate without the derivative of the target
+    # function are rejected by root finders early
+    requiresDerivative: ClassVar[bool] = False
+
     @abstractmethod
     def calcRoots(self, context: RootContext) -> None:
         """
@@ -31,3 +36,18 @@ class FinderAlgorithm(ABC, Loggable):
 
         :param context: Context in which the algorithm operates.
         """
+
+    def calcNearestRoots(
+        self, context: RootContext, target: complex, numRoots: int
+    ) -> None:
+        """
+        Entry point for searching (at least) the `numRoots` roots closest to
+        `target` inside of the search domain of `context`. Found roots are
+        expected to be inserted into `context.container`. The default
+        implementation searches all roots inside of the domain.
+
+        :param context: Context in which the algorithm operates.
+        :param target: Point around which roots are searched.
+        :param numRoots: Number of roots (with multiplicities) to search.
+        """
+        self.calcRoots(context)
@@ -0,0 +1,291 @@
+"""
+Class HankelPencilAlgorithm from the package pyzeal_algorithms.
+
+This module defines a variant of the associated polynomial algorithm which
+avoids the numerically unstable construction of monomial coefficients via
+Newton's identities. Instead the roots are calculated as the eigenvalues of a
+generalized eigenvalue problem built from Hankel matrices of (shifted and
+scaled) moments of the logarithmic derivative. Our implementation follows the
+ideas of [Kravanja, Van Barel].
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import ClassVar, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.linalg import (  # type: ignore
+    LinAlgError,
+    eigvals,
+    hankel,
+    solve,
+    svdvals,
+)
+
+from pyzeal.algorithms.constants import (
+    DEFAULT_DELTA_PHI,
+    DEFAULT_MAX_PRECISION,
+    DEFAULT_NUM_PTS,
+    MAX_PENCIL_PHASE,
+    PENCIL_ORDER_TOL,
+    PENCIL_RANK_TOL,
+)
+from pyzeal.algorithms.estimators import ArgumentEstimator, EstimatorCache
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
+from pyzeal.algorithms.polynomial_holo import AssociatedPolynomialAlgorithm
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.containers.rounding_container import RoundingContainer
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_polishing import polishRoots
+from pyzeal.utils.service_locator import ServiceLocator
+
+
+class HankelPencilAlgorithm(AssociatedPolynomialAlgorithm):
+    """
+    Class representation of a root finding algorithm which calculates the
+    roots inside of a rectangle from the eigenvalues of a Hankel matrix pencil
+    of higher moments. Compared to the associated polynomial this is stable
+    for a considerably larger number of roots per rectangle, such that far
+    fewer subdivisions (and therefore boundary evaluations) are necessary.
+    """
+
+    __slots__ = ("pencilCache", "pencilEstimator")
+
+    # rectangles with a total phase below this cutoff are handled directly
+    maxPhase: ClassVar[float] = MAX_PENCIL_PHASE
+
+    def __init__(
+        self,
+        estimatorType: EstimatorTypes,
+        *,
+        numPts: int = DEFAULT_NUM_PTS,
+        deltaPhi: float = DEFAULT_DELTA_PHI,
+        maxPrecision: float = DEFAULT_MAX_PRECISION,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
+    ) -> None:
+        """
+        Initialize a root finding algorithm that refines an initial bounding
+        rectangle until the roots inside of the current rectangle can be
+        calculated reliably from a Hankel pencil of moments. The estimator of
+        type `estimatorType` counts roots, while the moments of the pencil are
+        always integrated by the `QuadratureEstimator` (which needs the
+        derivative of the target function).
+
+        :param estimatorType: the type of estimator used to count roots
+        :param numPts: the default number of support points on rectangle edges
+            at the start of dynamic refinement
+        :param deltaPhi: the maximal phase shift between neighboring points on
+            rectangle edges before dynamic refinement starts
+        :param maxPrecision: the minimal distance between neighboring points on
+            rectangle edges during dynamic refinement
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            argument changes and samples shared by the estimators (and by the
+            separate cache of moments)
+        """
+        super().__init__(
+            estimatorType,
+            numPts=numPts,
+            deltaPhi=deltaPhi,
+            maxPrecision=maxPrecision,
+            maxCacheBytes=maxCacheBytes,
+        )
+        # moments are calculated in box-local coordinates and must therefore
+        # not share the cache of the main argument estimator; the summation
+        # estimator only calculates total arguments, hence higher moments are
+        # always integrated by quadrature
+        self.pencilCache = EstimatorCache.withMemoryCap(maxCacheBytes)
+        self.pencilEstimator = ServiceLocator.tryResolve(
+            ArgumentEstimator,
+            estimatorType=EstimatorTypes.QUADRATURE_ESTIMATOR,
+            numPts=numPts,
+            deltaPhi=deltaPhi,
+            maxPrecision=maxPrecision,
+            cache=self.pencilCache,
+        )
+
+    # docstr-coverage:inherited
+    def calcRootsFromMoments(
+        self,
+        degree: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> Optional[Tuple[tVec, NDArray[np.int32]]]:
+        self.logger.debug(
+            "constructing Hankel pencil of size %d from moments!", degree
+        )
+        # the moments s_p (p=0, ..., 2*degree-1) are the power sums of roots
+        # in the coordinates w = (z - center) / radius
+        x1, x2 = reRan
+        y1, y2 = imRan
+        center = 0.5 * (x1 + x2 + 1j * (y1 + y2))
+        radius = 0.5 * abs(x2 - x1 + 1j * (y2 - y1))
+        scaledContext = HankelPencilAlgorithm.scaleContext(
+            reRan, imRan, context
+        )
+        self.pencilEstimator.reset()
+        moments = self.pencilEstimator.calcMoments(
+            2 * degree, scaledContext.reRan, scaledContext.imRan, scaledContext
+        ) / (2 * np.pi)
+        moments[0] = degree
+        result = HankelPencilAlgorithm.solvePencil(moments, degree)
+        if result is None:
+            self.logger.debug("Hankel pencil is singular - subdividing!")
+            return None
+        scaledRoots, orders = result
+
+        roundedOrders = np.round(orders.real).astype(np.int32)
+        roots = polishRoots(
+            center + radius * scaledRoots, roundedOrders, context
+        )
+        if not HankelPencilAlgorithm.isConsistent(
+            roots, orders, roundedOrders, degree, reRan, imRan
+        ) or not HankelPencilAlgorithm.isSeparated(roots, context.precision):
+            self.logger.debug("Hankel pencil is inconsistent - subdividing!")
+            return None
+
+        return roots, roundedOrders
+
+    @staticmethod
+    def solvePencil(moments: tVec, degree: int) -> Optional[Tuple[tVec, tVec]]:
+        """
+        Calculate distinct roots and their (non-rounded) multiplicities from
+        the moments `s_p` (p=0, ..., 2*degree-1) of `degree` roots counted
+        with multiplicity. The numerical rank of the Hankel matrix of moments
+        determines the number of distinct roots.
+
+        :param moments: the moments (power sums) of the roots
+        :param degree: the number of roots (counted with multiplicity)
+        :returns: parallel arrays of roots and multiplicities or `None` if the
+            pencil is singular
+        """
+        hankel0 = hankel(
+            moments[:degree], moments[degree - 1 : 2 * degree - 1]
+        )
+        hankel1 = hankel(moments[1 : degree + 1], moments[degree : 2 * degree])
+        singularValues = svdvals(hankel0)
+        numDistinct = int(
+            np.count_nonzero(
+                singularValues > PENCIL_RANK_TOL * singularValues[0]
+            )
+        )
+        try:
+            roots = eigvals(
+                hankel1[:numDistinct, :numDistinct],
+                hankel0[:numDistinct, :numDistinct],
+            )
+            # multiplicities solve the Vandermonde system V^T * m = (s_p)
+            vandermonde = np.vander(roots, numDistinct, increasing=True)
+            orders = solve(vandermonde.T, moments[:numDistinct])
+        except (LinAlgError, ValueError):
+            return None
+        return roots, orders
+
+    @staticmethod
+    def scaleContext(
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> RootContext:
+        """
+        Construct the context of the target function on the rectangle
+        `reRan x imRan` in the coordinates `w = (z - center) / radius`, where
+        `center` and `radius` denote the center and half the diagonal of the
+        rectangle. Higher moments in these coordinates are bounded by the
+        number of roots which keeps the Hankel matrices well conditioned and
+        the moments cheap to integrate.
+
+        :param reRan: Real part of current search range
+        :param imRan: Imaginary part of current search range
+        :param context: `RootContext` in which the algorithm operates
+        :returns: the transformed context
+        """
+        f, df = context.f, context.df
+        if df is None:
+            raise ValueError("Hankel pencil algorithm needs the derivative!")
+        x1, x2 = reRan
+        y1, y2 = imRan
+        center = 0.5 * (x1 + x2 + 1j * (y1 + y2))
+        radius = 0.5 * abs(x2 - x1 + 1j * (y2 - y1))
+
+        def scaledFunc(w: tVec) -> tVec:
+            return f(center + radius * w)
+
+        def scaledDerivative(w: tVec) -> tVec:
+            return radius * df(center + radius * w)
+
+        return RootContext(
+            f=scaledFunc,
+            df=scaledDerivative,
+            # roots found on (scaled) lines must not leak into the container
+            container=RoundingContainer(context.precision),
+            precision=context.precision,
+            reRan=((x1 - center.real) / radius, (x2 - center.real) / radius),
+            imRan=((y1 - center.imag) / radius, (y2 - center.imag) / radius),
+            chunkSize=context.chunkSize,
+            knownRoots=tuple(
+                ((root - center) / radius, order)
+                for root, order in context.knownRoots
+            ),
+            derivativeBound=(
+                None
+                if context.derivativeBound is None
+                else radius * context.derivativeBound
+            ),
+        )
+
+    @staticmethod
+    def isSeparated(roots: tVec, precision: Tuple[int, int]) -> bool:
+        """
+        Check if distinct roots calculated from a Hankel pencil are separated
+        with respect to the given precision.
+
+        :param roots: the calculated roots
+        :param precision: accuracy in real and imaginary parts
+        :returns: flag indicating whether all roots are pairwise distinct
+        """
+        deltaRe = abs(roots.real[:, None] - roots.real[None, :])
+        deltaIm = abs(roots.imag[:, None] - roots.imag[None, :])
+        coincide = (deltaRe < 10 ** (-precision[0])) & (
+            deltaIm < 10 ** (-precision[1])
+        )
+        return bool(np.count_nonzero(coincide) == roots.size)
+
+    @staticmethod
+    def isConsistent(
+        roots: tVec,
+        orders: tVec,
+        roundedOrders: NDArray[np.int32],
+        degree: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+    ) -> bool:
+        """
+        Check if roots and multiplicities calculated from a Hankel pencil are
+        consistent with the rectangle they were calculated for.
+
+        :param roots: the calculated roots
+        :param orders: the calculated (non-rounded) multiplicities
+        :param roundedOrders: the calculated multiplicities rounded to integers
+        :param degree: the number of roots inside the rectangle
+        :param reRan: Real part of current search range
+        :param imRan: Imaginary part of current search range
+        :returns: flag indicating whether the results can be trusted
+        """
+        x1, x2 = reRan
+        y1, y2 = imRan
+        tolRe = PENCIL_ORDER_TOL * (x2 - x1)
+        tolIm = PENCIL_ORDER_TOL * (y2 - y1)
+        return bool(
+            np.all(np.isfinite(roots))
+            and np.all(abs(orders - roundedOrders) < PENCIL_ORDER_TOL)
+            and np.all(roundedOrders > 0)
+            and roundedOrders.sum() == degree
+            and np.all(x1 - tolRe <= roots.real)
+            and np.all(roots.real <= x2 + tolRe)
+            and np.all(y1 - tolIm <= roots.imag)
+            and np.all(roots.imag <= y2 + tolIm)
+        )
@@ -0,0 +1,308 @@
+"""
+Class MeshArgumentAlgorithm from the package pyzeal_algorithms.
+
+This module defines a root finding algorithm which evaluates the target
+function once on a uniform mesh covering the search rectangle (in a single
+vectorized call). Phase differences along all mesh edges and the winding
+numbers of all mesh cells are then obtained from a few array operations. Roots
+inside of cells with non-vanishing winding numbers are calculated by Newton's
+algorithm started from all cell centers at once. Only cells for which this
+fails (or with unreliable phase differences) are refined further by the
+`SimpleArgumentNewtonAlgorithm`.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from math import ceil
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.constants import (
+    DEFAULT_DELTA_PHI,
+    DEFAULT_MAX_PRECISION,
+    DEFAULT_NUM_PTS,
+    MESH_MAX_DELTA_PHI,
+    MESH_NUM_CELLS,
+    ORDER_RADIUS_SCALE,
+    TWO_PI,
+)
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
+from pyzeal.algorithms.simple_holo_newton import SimpleArgumentNewtonAlgorithm
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_orders import calcRootOrders
+from pyzeal.utils.root_polishing import polishCandidates
+
+
+class MeshArgumentAlgorithm(SimpleArgumentNewtonAlgorithm):
+    """
+    Class representation of a root finding algorithm which calculates the
+    winding numbers of all cells of a uniform mesh at once (from the phase
+    portrait of the target function on the mesh) and refines only those cells
+    which may contain roots.
+    """
+
+    __slots__ = ("meshCells",)
+
+    def __init__(
+        self,
+        estimatorType: EstimatorTypes,
+        *,
+        numPts: int = DEFAULT_NUM_PTS,
+        deltaPhi: float = DEFAULT_DELTA_PHI,
+        maxPrecision: float = DEFAULT_MAX_PRECISION,
+        exclusionPts: Optional[int] = None,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
+        meshCells: int = MESH_NUM_CELLS,
+    ) -> None:
+        """
+        Initialize a root finding algorithm that calculates winding numbers on
+        a uniform mesh before refining the cells containing roots.
+
+        :param numPts: the default number of support points on rectangle edges
+            at the start of dynamic refinement
+        :param deltaPhi: the maximal phase shift between neighboring points on
+            rectangle edges before dynamic refinement starts
+        :param maxPrecision: the minimal distance between neighboring points on
+            rectangle edges during dynamic refinement
+        :param exclusionPts: the number of samples per row and column used to
+            exclude roots from rectangles before estimating their arguments
+            (values below `2` disable the exclusion test). By default the
+            test only runs if a bound of `|f'|` is supplied by users and the
+            estimator does not reuse line samples. Explicitly enabling it
+            without such a bound uses a heuristic estimate of `|f'|`, which
+            may silently drop roots of functions whose derivative varies
+            strongly between samples (a warning is logged in this case)
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            argument changes and samples shared by the estimators
+        :param meshCells: the number of mesh cells along the longer side of
+            the search rectangle
+        """
+        super().__init__(
+            estimatorType,
+            numPts=numPts,
+            deltaPhi=deltaPhi,
+            maxPrecision=maxPrecision,
+            exclusionPts=exclusionPts,
+            maxCacheBytes=maxCacheBytes,
+        )
+        self.meshCells = meshCells
+
+    def calcRoots(self, context: RootContext) -> None:
+        """
+        Calculate roots in a given context by evaluating the target function
+        on a uniform mesh and refining cells with non-vanishing winding
+        numbers. Cells along whose edges the phase of the target function
+        changes too quickly are refined if the argument estimator detects
+        roots inside of them.
+
+        :param context: context in which the algorithm operates
+        """
+        self.logger.info(
+            "starting mesh argument search for %s",
+            context.functionDataToString(),
+        )
+        if self.cache.dirty():
+            self.logger.info("resetting argument estimator cache...")
+            self.estimator.reset()
+        self.cache.setLattice(context.reRan, context.imRan, context.precision)
+        self.estimator.seedSamples(context)
+        self.warnHeuristicExclusion(context)
+
+        reGrid, imGrid = MeshArgumentAlgorithm.buildMesh(
+            context.reRan, context.imRan, self.meshCells
+        )
+        zArr = reGrid[np.newaxis, :] + 1j * imGrid[:, np.newaxis]
+        funcArr = context.evalFunc(zArr.ravel()).reshape(zArr.shape)
+        phases, reliable = MeshArgumentAlgorithm.calcCellPhases(funcArr)
+        self.logger.debug(
+            "mesh with %d cells has %d cells with roots and %d unreliable "
+            "cells!",
+            phases.size,
+            int(np.count_nonzero(reliable & (phases >= TWO_PI))),
+            int(np.count_nonzero(~reliable)),
+        )
+
+        # cells without roots are finished immediately, cells with roots are
+        # handed to Newton's algorithm before falling back to refinement
+        rootCells = reliable & (phases >= TWO_PI)
+        pending = (~reliable | rootCells) & ~self.polishCells(
+            reGrid, imGrid, phases, rootCells, context
+        )
+        cellArea = (reGrid[1] - reGrid[0]) * (imGrid[1] - imGrid[0])
+        if context.progress is not None and context.task is not None:
+            context.progress.update(
+                context.task, advance=cellArea * np.count_nonzero(~pending)
+            )
+        # pending cells lie to the right or on top of the current cell
+        for j, i in zip(*np.nonzero(pending)):
+            reRan = (float(reGrid[i]), float(reGrid[i + 1]))
+            imRan = (float(imGrid[j]), float(imGrid[j + 1]))
+            if reliable[j, i]:
+                phi = float(phases[j, i])
+            elif self.excludeRoots(reRan, imRan, context):
+                phi = 0.0
+            else:
+                phi = self.calculateRefinedMoment(reRan, imRan, context)
+            self.decideRefinement(reRan, imRan, phi, context)
+            self.estimator.releaseLines(reRan, imRan)
+
+    def polishCells(
+        self,
+        reGrid: NDArray[np.float64],
+        imGrid: NDArray[np.float64],
+        phases: NDArray[np.float64],
+        rootCells: NDArray[np.bool_],
+        context: RootContext,
+    ) -> NDArray[np.bool_]:
+        """
+        Start (modified) Newton iterations from the centers of all mesh cells
+        containing roots at once, assuming that each cell contains a single
+        root whose order equals the winding number of the cell. Results are
+        accepted if they lie inside of their cell (or an adjacent cell) and
+        the argument principle on a small circle around them confirms their
+        order. Accepted roots are put into `context.container`.
+
+        :param reGrid: Real parts of the mesh lines
+        :param imGrid: Imaginary parts of the mesh lines
+        :param phases: Phase changes along the boundaries of all cells
+        :param rootCells: Flags indicating cells with roots
+        :param context: `RootContext` in which the algorithm operates
+        :return: Flags indicating cells whose roots were accepted
+        """
+        accepted = np.zeros_like(rootCells)
+        rows, cols = np.nonzero(rootCells)
+        if rows.size == 0:
+            return accepted
+        centers = 0.5 * (reGrid[cols] + reGrid[cols + 1]) + 0.5j * (
+            imGrid[rows] + imGrid[rows + 1]
+        )
+        orders = np.rint(phases[rows, cols] / (2 * np.pi)).astype(np.int32)
+        roots = polishCandidates(centers, orders, context)
+        # aliased edges split the winding numbers of roots near them between
+        # adjacent cells, whose iterations then converge to the same root
+        labels = MeshArgumentAlgorithm.labelClusters(
+            roots,
+            ORDER_RADIUS_SCALE * 10 ** (-min(context.precision)),
+        )
+        clusters = np.unique(labels)
+        if clusters.size < labels.size:
+            orders = np.bincount(labels, weights=orders)[clusters].astype(
+                np.int32
+            )
+            roots = polishCandidates(
+                np.array(
+                    [roots[labels == label].mean() for label in clusters]
+                ),
+                orders,
+                context,
+            )
+        # roots may lie in adjacent cells if their shared edge is aliased
+        rows, cols = rows[clusters], cols[clusters]
+        valid = (
+            (reGrid[np.maximum(cols - 1, 0)] <= roots.real)
+            & (roots.real <= reGrid[np.minimum(cols + 2, reGrid.size - 1)])
+            & (imGrid[np.maximum(rows - 1, 0)] <= roots.imag)
+            & (roots.imag <= imGrid[np.minimum(rows + 2, imGrid.size - 1)])
+        )
+        valid[valid] = (
+            calcRootOrders(context.evalFunc, roots[valid], context.precision)
+            == orders[valid]
+        )
+        self.logger.debug(
+            "Newton's algorithm confirmed %d of %d roots in mesh cells!",
+            int(np.count_nonzero(valid)),
+            clusters.size,
+        )
+        for root, order in zip(roots[valid], orders[valid]):
+            context.container.addRoot(
+                (root, int(order)), context.toFilterContext()
+            )
+        allRows, allCols = np.nonzero(rootCells)
+        confirmed = np.isin(labels, clusters[valid])
+        accepted[allRows[confirmed], allCols[confirmed]] = True
+        return accepted
+
+    @staticmethod
+    def labelClusters(roots: tVec, tol: float) -> NDArray[np.intp]:
+        """
+        Label roots closer than `tol` to each other by the index of the first
+        root of their cluster.
+
+        :param roots: the roots to label
+        :param tol: the distance below which roots belong to the same cluster
+        :return: the labels of all roots
+        """
+        labels = np.full(roots.size, -1, dtype=np.intp)
+        for index in range(roots.size):
+            if labels[index] < 0:
+                close = abs(roots - roots[index]) < tol
+                close[index] = True
+                labels[close & (labels < 0)] = index
+        return labels
+
+    @staticmethod
+    def buildMesh(
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        meshCells: int,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Construct a uniform mesh of (almost) square cells covering a
+        rectangle.
+
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :param meshCells: Number of cells along the longer side
+        :return: Real and imaginary parts of the mesh lines
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        side = max(x2 - x1, y2 - y1) / meshCells
+        numRe = max(ceil((x2 - x1) / side - 1e-9), 1)
+        numIm = max(ceil((y2 - y1) / side - 1e-9), 1)
+        return np.linspace(x1, x2, numRe + 1), np.linspace(y1, y2, numIm + 1)
+
+    @staticmethod
+    def calcCellPhases(
+        funcArr: tVec,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """
+        Calculate the total phase changes of a function along the boundaries
+        of all cells of a mesh from its values on the mesh points. Phase
+        changes are sums of (principal) phase differences along the edges of
+        a cell in counter-clockwise direction and hence multiples of `2*pi`.
+
+        :param funcArr: Function values on the mesh, where rows correspond to
+            imaginary parts and columns to real parts of the mesh points
+        :return: Phase changes of all cells and flags indicating if they are
+            reliable, i.e. the function does not vanish on mesh points and
+            its phase changes slowly along the edges of the cell
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            horizontal = np.angle(funcArr[:, 1:] / funcArr[:, :-1])
+            vertical = np.angle(funcArr[1:, :] / funcArr[:-1, :])
+        phases = (
+            horizontal[:-1, :]
+            + vertical[:, 1:]
+            - horizontal[1:, :]
+            - vertical[:, :-1]
+        )
+        # phase differences are undefined next to roots on mesh points
+        valid = np.isfinite(funcArr) & (funcArr != 0)
+        smoothH = valid[:, 1:] & valid[:, :-1]
+        smoothH &= np.abs(horizontal) < MESH_MAX_DELTA_PHI
+        smoothV = valid[1:, :] & valid[:-1, :]
+        smoothV &= np.abs(vertical) < MESH_MAX_DELTA_PHI
+        reliable = smoothH[:-1, :] & smoothH[1:, :]
+        reliable &= smoothV[:, 1:] & smoothV[:, :-1]
+        # phase changes beyond pi along an edge are not detected but shift
+        # winding numbers between adjacent cells (possibly below zero)
+        aliased = np.pad(phases <= -TWO_PI, 1)
+        reliable &= ~aliased[1:-1, 1:-1] & ~aliased[:-2, 1:-1]
+        reliable &= ~aliased[2:, 1:-1] & ~aliased[1:-1, :-2]
+        reliable &= ~aliased[1:-1, 2:]
+        return phases, reliable
@@ -72,7 +72,7 @@ class NewtonGridAlgorithm(FinderAlgorithm):
             return
         for root in roots:
             # the newton algorithm does not determine root orders - placeholder
-            # value can be anything non-positive
+            # value can be anything non-positive (see `calculateOrders`)
             context.container.addRoot((root, 0), context.toFilterContext())
         if context.progress and context.task:
             context.progress.update(
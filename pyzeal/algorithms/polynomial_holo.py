@@ -10,13 +10,15 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import List, Tuple
+from typing import ClassVar, List, Optional, Tuple
 
 import numpy as np
+from numpy.typing import NDArray
 
 from pyzeal.algorithms.constants import MAX_PHASE, TWO_PI
 from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
 from pyzeal.algorithms.wrappers.classical_polynomial import ClassicalPolynomial
+from pyzeal.pyzeal_types.root_types import tVec
 from pyzeal.utils.root_context import RootContext
 
 
@@ -28,6 +30,10 @@ class AssociatedPolynomialAlgorithm(SimpleArgumentAlgorithm):
     of the latter coincide with the zeros of the original target function.
     """
 
+    # rectangles with a total phase below this cutoff are handled directly
+    maxPhase: ClassVar[float] = MAX_PHASE
+    requiresDerivative: ClassVar[bool] = True
+
     def decideRefinement(
         self,
         reRan: Tuple[float, float],
@@ -69,41 +75,64 @@ class AssociatedPolynomialAlgorithm(SimpleArgumentAlgorithm):
 
         # check if the current box contains sufficiently few roots to construct
         # an associated polynomial with stable coefficients/roots
-        if TWO_PI < phi < MAX_PHASE:
+        if TWO_PI < phi < self.maxPhase:
             degree = int(round(phi / (2 * np.pi), 0))
-            self.logger.debug(
-                "constructing associated poly of degree %d from moments!",
-                degree,
+            result = self.calcRootsFromMoments(
+                degree, (x1, x2), (y1, y2), context
             )
-
-            # store higher moments for associated polynomial construction
-            moments: List[complex] = []
-            for order in range(1, degree + 1):
-                moment = self.estimator.calcMoment(
-                    order=order,
-                    reRan=(x1, x2),
-                    imRan=(y1, y2),
-                    context=context,
-                )
-                moments.append(moment / (2 * np.pi))
-
-            roots, orders = ClassicalPolynomial(
-                coefficients=self.coefficientsFromMoments(moments)
-            ).getRootsWithOrders(precision=context.precision)
-
-            for newRoot, newOrder in zip(roots, orders):
-                context.container.addRoot(
-                    (newRoot, newOrder), context.toFilterContext()
-                )
-
-            if context.progress is not None and context.task is not None:
-                context.progress.update(
-                    context.task, advance=deltaRe * deltaIm
-                )
-            return
+            if result is not None:
+                for newRoot, newOrder in zip(*result):
+                    context.container.addRoot(
+                        (newRoot, newOrder), context.toFilterContext()
+                    )
+
+                if context.progress is not None and context.task is not None:
+                    context.progress.update(
+                        context.task, advance=deltaRe * deltaIm
+                    )
+                return
 
         super().decideRefinement((x1, x2), (y1, y2), phi, context)
 
+    def calcRootsFromMoments(
+        self,
+        degree: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> Optional[Tuple[tVec, NDArray[np.int32]]]:
+        """
+        Calculate the roots (together with their orders) inside of a rectangle
+        which is known to contain `degree` roots counted with multiplicity.
+        Subclasses may return `None` to signal that the roots could not be
+        determined reliably, in which case the rectangle gets subdivided.
+
+        :param degree: the number of roots inside the rectangle
+        :param reRan: Real part of current search range
+        :param imRan: Imaginary part of current search range
+        :param context: `RootContext` in which the algorithm operates
+        :returns: parallel arrays of roots and orders
+        """
+        self.logger.debug(
+            "constructing associated poly of degree %d from moments!",
+            degree,
+        )
+
+        # store higher moments for associated polynomial construction
+        moments: List[complex] = []
+        for order in range(1, degree + 1):
+            moment = self.estimator.calcMoment(
+                order=order,
+                reRan=reRan,
+                imRan=imRan,
+                context=context,
+            )
+            moments.append(moment / (2 * np.pi))
+
+        return ClassicalPolynomial(
+            coefficients=self.coefficientsFromMoments(moments)
+        ).getRootsWithOrders(precision=context.precision)
+
     def coefficientsFromMoments(self, moments: List[complex]) -> List[complex]:
         """
         Calculate the coefficients of the associated polynomial from the higher
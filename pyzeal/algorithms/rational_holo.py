@@ -0,0 +1,291 @@
+"""
+Class RationalSurrogateAlgorithm from the package pyzeal_algorithms.
+
+This module defines a root finding algorithm for target functions which are
+expensive to evaluate. The target function is sampled a few hundred times on
+the boundary and in the interior of the search rectangle, and a rational
+surrogate is constructed by the AAA algorithm. Zeros of the surrogate serve as
+candidates which are confirmed (and assigned their orders) by the argument
+principle along small circles around them, such that only a few additional
+evaluations of the target function are necessary. Surrogate roots are only
+accepted if their number matches the argument principle along the boundary of
+their rectangle, otherwise (and for rectangles without accurate surrogates)
+the roots are searched by a `SimpleArgumentAlgorithm`.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.constants import (
+    ROOT_COUNT_TOL,
+    SURROGATE_CLUSTER_TOL,
+    SURROGATE_EDGE_PTS,
+    SURROGATE_GRID_PTS,
+    SURROGATE_MAX_DEGREE,
+    SURROGATE_MAX_DEPTH,
+    SURROGATE_TOL,
+)
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
+from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
+from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
+from pyzeal.algorithms.wrappers.barycentric_rational import (
+    BarycentricRational,
+)
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tRectangle, tRoot, tVec
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_orders import calcRootOrders
+from pyzeal.utils.root_polishing import polishCandidates
+
+
+class RationalSurrogateAlgorithm(FinderAlgorithm):
+    """
+    Class representation of a root finding algorithm which calculates roots
+    of a rational (AAA) surrogate of the target function and confirms them
+    with the target function itself. Rectangles without accurate surrogates
+    are subdivided, and rectangles where the surrogate roots disagree with
+    the argument principle are searched by a `SimpleArgumentAlgorithm`.
+    """
+
+    __slots__ = ("edgePts", "gridPts", "tol", "maxDegree", "fallback")
+
+    def __init__(
+        self,
+        *,
+        edgePts: int = SURROGATE_EDGE_PTS,
+        gridPts: int = SURROGATE_GRID_PTS,
+        tol: float = SURROGATE_TOL,
+        maxDegree: int = SURROGATE_MAX_DEGREE,
+        estimatorType: EstimatorTypes = EstimatorTypes.DEFAULT,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
+    ) -> None:
+        """
+        Initialize a root finding algorithm based on rational surrogates of
+        the target function.
+
+        :param edgePts: the number of samples on each edge of a rectangle
+        :param gridPts: the number of samples per row and column of the
+            interior grid of a rectangle
+        :param tol: the relative accuracy of surrogates on the samples
+        :param maxDegree: the maximal degree of surrogates
+        :param estimatorType: the type of argument estimator used to count
+            roots and to search rectangles without reliable surrogates
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            the argument estimator
+        """
+        self.edgePts = edgePts
+        self.gridPts = gridPts
+        self.tol = tol
+        self.maxDegree = maxDegree
+        self.fallback = SimpleArgumentAlgorithm(
+            estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+        )
+        self.logger.debug("initialized a new RationalSurrogateAlgorithm!")
+
+    def calcRoots(self, context: RootContext) -> None:
+        """
+        Calculate roots in a given context from zeros of rational surrogates
+        of the target function.
+
+        :param context: Context in which the algorithm operates.
+        """
+        self.logger.info(
+            "starting rational surrogate search for %s",
+            context.functionDataToString(),
+        )
+        # the estimator counts roots in (and searches) all rectangles
+        estimator = self.fallback.estimator
+        if self.fallback.cache.dirty():
+            self.logger.info("resetting argument estimator cache...")
+            estimator.reset()
+        self.fallback.cache.setLattice(
+            context.reRan, context.imRan, context.precision
+        )
+        estimator.seedSamples(context)
+        rectangles: List[Tuple[tRectangle, int]] = [
+            ((context.reRan, context.imRan), 0)
+        ]
+        while rectangles:
+            (reRan, imRan), depth = rectangles.pop()
+            surrogate = self.buildSurrogate(reRan, imRan, context)
+            if surrogate is None and depth < SURROGATE_MAX_DEPTH:
+                self.logger.debug("surrogate is inaccurate - subdividing!")
+                (x1, x2), (y1, y2) = reRan, imRan
+                xm, ym = 0.5 * (x1 + x2), 0.5 * (y1 + y2)
+                rectangles.extend(
+                    (cell, depth + 1)
+                    for cell in [
+                        ((x1, xm), (y1, ym)),
+                        ((xm, x2), (y1, ym)),
+                        ((x1, xm), (ym, y2)),
+                        ((xm, x2), (ym, y2)),
+                    ]
+                )
+                continue
+            phi = estimator.calcMoment(0, reRan, imRan, context).real
+            if surrogate is None:
+                self.logger.warning(
+                    "no accurate surrogate on [%f, %f] x [%f, %f] - "
+                    "falling back to the argument principle!",
+                    *reRan,
+                    *imRan,
+                )
+            else:
+                roots = self.confirmRoots(surrogate, reRan, imRan, context)
+                count = phi / (2 * np.pi)
+                numRoots = sum(order for _, order in roots)
+                if abs(count - numRoots) < ROOT_COUNT_TOL:
+                    for root in roots:
+                        context.container.addRoot(
+                            root, context.toFilterContext()
+                        )
+                    if (
+                        context.progress is not None
+                        and context.task is not None
+                    ):
+                        context.progress.update(
+                            context.task,
+                            advance=(reRan[1] - reRan[0])
+                            * (imRan[1] - imRan[0]),
+                        )
+                    continue
+                self.logger.info(
+                    "surrogate found %d roots on [%f, %f] x [%f, %f] but the "
+                    "argument principle counts %.2f - falling back!",
+                    numRoots,
+                    *reRan,
+                    *imRan,
+                    count,
+                )
+            # the fallback algorithm updates the progress bar by itself
+            self.fallback.decideRefinement(reRan, imRan, phi, context)
+
+    def buildSurrogate(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> Optional[BarycentricRational]:
+        """
+        Sample the target function on the boundary and an interior grid of a
+        rectangle and construct a rational surrogate from the samples.
+
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :param context: `RootContext` in which the algorithm operates
+        :return: the surrogate or `None` if it is not accurate
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        edge = np.linspace(0, 1, self.edgePts, endpoint=False)
+        boundary = np.concatenate(
+            (
+                x1 + (x2 - x1) * edge + 1j * y1,
+                x2 + 1j * (y1 + (y2 - y1) * edge),
+                x2 - (x2 - x1) * edge + 1j * y2,
+                x1 + 1j * (y2 - (y2 - y1) * edge),
+            )
+        )
+        # interior grid points avoid the boundary
+        grid = (np.arange(self.gridPts) + 0.5) / self.gridPts
+        interior = (
+            x1 + (x2 - x1) * grid[:, np.newaxis] + 1j * (y1 + (y2 - y1) * grid)
+        ).ravel()
+        zArr = np.concatenate((boundary, interior))
+        funcArr = context.evalFunc(zArr)
+        valid = np.isfinite(funcArr)
+        surrogate = BarycentricRational.fromSamples(
+            zArr[valid], funcArr[valid], self.tol, self.maxDegree
+        )
+        self.logger.debug(
+            "constructed surrogate of degree %d with relative error %.2e!",
+            surrogate.support.size - 1,
+            surrogate.error / max(float(np.abs(funcArr[valid]).max()), 1e-300),
+        )
+        if surrogate.error > self.tol * np.abs(funcArr[valid]).max():
+            return None
+        return surrogate
+
+    def confirmRoots(
+        self,
+        surrogate: BarycentricRational,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> List[tRoot]:
+        """
+        Merge clusters of zeros of a surrogate inside of a rectangle into
+        candidates, discard zeros cancelling with poles (Froissart doublets)
+        and confirm candidates by the argument principle along small circles.
+
+        :param surrogate: the rational surrogate of the target function
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :param context: `RootContext` in which the algorithm operates
+        :return: the confirmed roots inside of the rectangle (with orders)
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        tol = SURROGATE_CLUSTER_TOL * abs(x2 - x1 + 1j * (y2 - y1))
+        zeros = surrogate.zeros()
+        zeros = zeros[
+            (x1 - tol <= zeros.real)
+            & (zeros.real <= x2 + tol)
+            & (y1 - tol <= zeros.imag)
+            & (zeros.imag <= y2 + tol)
+        ]
+        poles = surrogate.poles()
+        if poles.size > 0 and zeros.size > 0:
+            distances = abs(zeros[:, np.newaxis] - poles[np.newaxis, :])
+            zeros = zeros[distances.min(axis=1) > tol]
+        candidates, sizes = RationalSurrogateAlgorithm.mergeClusters(
+            zeros, tol
+        )
+        if candidates.size == 0:
+            return []
+        # candidates are only as accurate as the surrogate near them
+        candidates = polishCandidates(candidates, sizes, context)
+        orders = calcRootOrders(
+            context.evalFunc, candidates, context.precision
+        )
+        roots, orders = candidates[orders > 0], orders[orders > 0]
+        self.logger.debug(
+            "confirmed %d of %d surrogate roots!", roots.size, candidates.size
+        )
+        return [
+            (complex(root), int(order))
+            for root, order in zip(roots, orders)
+            if x1 <= root.real <= x2 and y1 <= root.imag <= y2
+        ]
+
+    @staticmethod
+    def mergeClusters(
+        zeros: tVec, tol: float
+    ) -> Tuple[tVec, NDArray[np.int32]]:
+        """
+        Merge zeros closer than `tol` into their mean. A root of order `m` of
+        the target function typically appears as `m` nearby zeros of the
+        surrogate, whose mean approximates the root considerably better than
+        each of them.
+
+        :param zeros: the zeros of a surrogate
+        :param tol: the distance below which zeros are merged
+        :return: the merged zeros and the sizes of their clusters
+        """
+        clusters: List[List[complex]] = []
+        for zero in zeros[np.argsort(zeros.real)]:
+            for cluster in clusters:
+                if abs(zero - np.mean(cluster)) < tol:
+                    cluster.append(zero)
+                    break
+            else:
+                clusters.append([zero])
+        return (
+            np.array(
+                [np.mean(cluster) for cluster in clusters], dtype=np.complex128
+            ),
+            np.array([len(cluster) for cluster in clusters], dtype=np.int32),
+        )
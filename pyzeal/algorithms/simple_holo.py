@@ -11,7 +11,9 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Tuple
+from heapq import heappop, heappush
+from itertools import count
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -19,13 +21,17 @@ from pyzeal.algorithms.constants import (
     DEFAULT_DELTA_PHI,
     DEFAULT_MAX_PRECISION,
     DEFAULT_NUM_PTS,
+    EXCLUSION_NUM_PTS,
     TWO_PI,
 )
 from pyzeal.algorithms.estimators import EstimatorCache
 from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
 from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tRectangle
 from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_exclusion import isRootFree
 from pyzeal.utils.service_locator import ServiceLocator
 
 
@@ -37,7 +43,7 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
     differences.
     """
 
-    __slots__ = ("cache", "estimator")
+    __slots__ = ("cache", "estimator", "exclusionPts")
 
     def __init__(
         self,
@@ -46,6 +52,8 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
         numPts: int = DEFAULT_NUM_PTS,
         deltaPhi: float = DEFAULT_DELTA_PHI,
         maxPrecision: float = DEFAULT_MAX_PRECISION,
+        exclusionPts: Optional[int] = None,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
     ) -> None:
         """
         Initialize a root finding algorithm that employs a straightforward,
@@ -59,8 +67,18 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
             rectangle edges before dynamic refinement starts
         :param maxPrecision: the minimal distance between neighboring points on
             rectangle edges during dynamic refinement
+        :param exclusionPts: the number of samples per row and column used to
+            exclude roots from rectangles before estimating their arguments
+            (values below `2` disable the exclusion test). By default the
+            test only runs if a bound of `|f'|` is supplied by users and the
+            estimator does not reuse line samples. Explicitly enabling it
+            without such a bound uses a heuristic estimate of `|f'|`, which
+            may silently drop roots of functions whose derivative varies
+            strongly between samples (a warning is logged in this case)
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            argument changes and samples shared by the estimators
         """
-        self.cache = EstimatorCache()
+        self.cache = EstimatorCache.withMemoryCap(maxCacheBytes)
         self.estimator = ServiceLocator.tryResolve(
             ArgumentEstimator,
             estimatorType=estimatorType,
@@ -69,6 +87,7 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
             maxPrecision=maxPrecision,
             cache=self.cache,
         )
+        self.exclusionPts = exclusionPts
         self.logger.debug(
             "initialized a new subclass of SimpleArgumentAlgorithm!"
         )
@@ -89,26 +108,144 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
             "starting simple argument search for %s",
             context.functionDataToString(),
         )
-        # reset cache
+        # reset cache (and internal data of the estimator)
         if self.cache.dirty():
             self.logger.info("resetting argument estimator cache...")
-            self.cache.reset()
+            self.estimator.reset()
+        self.cache.setLattice(context.reRan, context.imRan, context.precision)
+        self.estimator.seedSamples(context)
+        self.warnHeuristicExclusion(context)
 
         phi = self.estimator.calcMoment(
             0, context.reRan, context.imRan, context
         ).real  # if order=0 then the result is (theoretically) an int
         self.decideRefinement(context.reRan, context.imRan, phi, context)
         self.logger.debug(
-            "cache hits/misses: %d/%d (= %.03f)",
+            "cache hits/lookups: %d/%d (= %.03f)",
             self.cache.cacheHits,
             self.cache.cacheMisses + self.cache.cacheHits,
             round(
                 self.cache.cacheHits
-                / (self.cache.cacheMisses + self.cache.cacheMisses or 1),
+                / (self.cache.cacheHits + self.cache.cacheMisses or 1),
                 3,
             ),
         )
 
+    # docstr-coverage:inherited
+    def calcNearestRoots(
+        self, context: RootContext, target: complex, numRoots: int
+    ) -> None:
+        self.logger.info(
+            "starting best-first search for %d roots near %s for %s",
+            numRoots,
+            str(target),
+            context.functionDataToString(),
+        )
+        if self.cache.dirty():
+            self.logger.info("resetting argument estimator cache...")
+            self.estimator.reset()
+        self.cache.setLattice(context.reRan, context.imRan, context.precision)
+        self.estimator.seedSamples(context)
+        self.warnHeuristicExclusion(context)
+
+        epsReal = 10 ** (-context.precision[0])
+        epsImag = 10 ** (-context.precision[1])
+        # rectangles containing roots ordered by their distance to target
+        tieBreaker = count()
+        queue: List[Tuple[float, int, tRectangle, float]] = []
+        rectangles: List[tRectangle] = [(context.reRan, context.imRan)]
+        numFound = 0
+        phi = 0.0
+        while True:
+            excluded = [
+                self.excludeRoots(*rect, context) for rect in rectangles
+            ]
+            if len(rectangles) > 1 and not any(excluded):
+                self.estimator.prefetchBoundaries(rectangles, [0], context)
+            for (reRan, imRan), isFree, otherFree in zip(
+                rectangles, excluded, excluded[::-1]
+            ):
+                if isFree:
+                    continue
+                # a half next to a root-free half inherits the total argument
+                if not otherFree:
+                    phi = self.calculateRefinedMoment(reRan, imRan, context)
+                if phi >= TWO_PI:
+                    heappush(
+                        queue,
+                        (
+                            SimpleArgumentAlgorithm.distanceToRectangle(
+                                target, reRan, imRan
+                            ),
+                            next(tieBreaker),
+                            (reRan, imRan),
+                            phi,
+                        ),
+                    )
+            # remaining rectangles cannot contain roots closer than the
+            # roots which were already found
+            if numFound >= numRoots or len(queue) == 0:
+                break
+            _, _, ((x1, x2), (y1, y2)), phi = heappop(queue)
+            if x2 - x1 < epsReal and y2 - y1 < epsImag:
+                SimpleArgumentAlgorithm.getRootFromRectangle(
+                    x2, x1, y2, y1, phi, context
+                )
+                numFound += int(np.round(phi / (2 * np.pi)))
+                rectangles = []
+            else:
+                rectangles = list(
+                    SimpleArgumentAlgorithm.splitRectangle(
+                        (x1, x2), (y1, y2), context.precision
+                    )
+                )
+        self.logger.info(
+            "best-first search finished with %d roots (%d pending)!",
+            numFound,
+            len(queue),
+        )
+
+    @staticmethod
+    def splitRectangle(
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Tuple[int, int],
+    ) -> Tuple[tRectangle, tRectangle]:
+        """
+        Bisect a rectangle along its (relative to `precision`) longer side.
+
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :param precision: Accuracy in real and imaginary parts
+        :return: The two halves of the rectangle
+        """
+        (x1, x2), (y1, y2) = reRan, imRan
+        if (x2 - x1) * 10 ** precision[0] > (y2 - y1) * 10 ** precision[1]:
+            midPoint = (x1 + x2) / 2
+            return ((x1, midPoint), imRan), ((midPoint, x2), imRan)
+        midPoint = (y1 + y2) / 2
+        return (reRan, (y1, midPoint)), (reRan, (midPoint, y2))
+
+    @staticmethod
+    def distanceToRectangle(
+        target: complex,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+    ) -> float:
+        """
+        Calculate the distance between a point and a rectangle (which is zero
+        if the point lies inside of the rectangle).
+
+        :param target: Point in the complex plane
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :return: Distance between `target` and the closest point of the
+            rectangle
+        """
+        deltaRe = max(reRan[0] - target.real, 0, target.real - reRan[1])
+        deltaIm = max(imRan[0] - target.imag, 0, target.imag - imRan[1])
+        return float(np.hypot(deltaRe, deltaIm))
+
     def decideRefinement(
         self,
         reRan: Tuple[float, float],
@@ -162,30 +299,82 @@ class SimpleArgumentAlgorithm(FinderAlgorithm):
             return
 
         # the current box contains a root and must be refined further
-        if deltaRe / epsReal > deltaIm / epsImag:
-            midPoint = (x1 + x2) / 2
-            phi = self.calculateRefinedMoment(
-                (x1, midPoint), (y1, y2), context
-            )
-            self.decideRefinement((x1, midPoint), (y1, y2), phi, context)
-            self.cache.remove(0, x1 + y2 * 1j, x1 + y1 * 1j)
-            phi = self.calculateRefinedMoment(
-                (midPoint, x2), (y1, y2), context
-            )
-            self.decideRefinement((midPoint, x2), (y1, y2), phi, context)
-            self.cache.remove(0, x2 + y1 * 1j, x2 + y2 * 1j)
-        else:
-            midPoint = (y1 + y2) / 2
-            phi = self.calculateRefinedMoment(
-                (x1, x2), (y1, midPoint), context
+        halves = SimpleArgumentAlgorithm.splitRectangle(
+            reRan, imRan, context.precision
+        )
+        excluded = [self.excludeRoots(*half, context) for half in halves]
+        # both halves are estimated, so their edges are sampled at once
+        if not any(excluded):
+            self.estimator.prefetchBoundaries(halves, [0], context)
+        for (halfRe, halfIm), isFree, otherFree in zip(
+            halves, excluded, excluded[::-1]
+        ):
+            # a half next to a root-free half inherits the total argument
+            if isFree:
+                halfPhi = 0.0
+            elif otherFree:
+                halfPhi = phi
+            else:
+                halfPhi = self.calculateRefinedMoment(halfRe, halfIm, context)
+            self.decideRefinement(halfRe, halfIm, halfPhi, context)
+            # rectangles pending in the recursion lie to the right or on top
+            self.estimator.releaseLines(halfRe, halfIm)
+
+    def excludeRoots(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        context: RootContext,
+    ) -> bool:
+        """
+        Test if a rectangle contains no roots from a few samples, which is
+        much cheaper than estimating the total argument along its boundary.
+        By default the test only runs with a user supplied
+        `context.derivativeBound`. If it is enabled explicitly without such a
+        bound, it relies on a heuristic estimate of `|f'|` and an
+        underestimate silently drops roots: neither the excluded rectangle
+        nor its sibling (which inherits the total argument) is searched again.
+
+        :param reRan: Real part of the rectangle
+        :param imRan: Imaginary part of the rectangle
+        :param context: `RootContext` in which the algorithm operates
+        :return: flag indicating that the rectangle contains no roots (`False`
+            if the test is undecided or disabled)
+        """
+        numPts = self.exclusionPts
+        if numPts is None:
+            if (
+                context.derivativeBound is None
+                or self.estimator.reusesLineSamples
+            ):
+                return False
+            numPts = EXCLUSION_NUM_PTS
+        if numPts < 2:
+            return False
+        if isRootFree(reRan, imRan, context, numPts):
+            self.logger.debug(
+                "excluded roots from [%f, %f] x [%f, %f]!", *reRan, *imRan
             )
-            self.decideRefinement((x1, x2), (y1, midPoint), phi, context)
-            self.cache.remove(0, x1 + y1 * 1j, x2 + y1 * 1j)
-            phi = self.calculateRefinedMoment(
-                (x1, x2), (midPoint, y2), context
+            return True
+        return False
+
+    def warnHeuristicExclusion(self, context: RootContext) -> None:
+        """
+        Log a warning if roots are excluded from rectangles by a heuristic
+        estimate of `|f'|`, i.e. if the exclusion test was enabled explicitly
+        without a user supplied `context.derivativeBound`.
+
+        :param context: `RootContext` in which the algorithm operates
+        """
+        if (
+            self.exclusionPts is not None
+            and self.exclusionPts >= 2
+            and context.derivativeBound is None
+        ):
+            self.logger.warning(
+                "excluding roots with a heuristic bound of |f'| - roots may "
+                "be missed (supply derivativeBound to avoid this)!"
             )
-            self.decideRefinement((x1, x2), (midPoint, y2), phi, context)
-            self.cache.remove(0, x2 + y2 * 1j, x1 + y2 * 1j)
 
     def calculateRefinedMoment(
         self,
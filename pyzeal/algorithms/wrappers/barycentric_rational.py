@@ -0,0 +1,139 @@
+"""
+Class BarycentricRational from the package pyzeal_algorithms.
+
+This module defines rational functions in barycentric representation which
+are constructed from samples of a target function by the AAA algorithm of
+[Nakatsukasa, Sete, Trefethen]. Zeros and poles of such rational functions are
+the finite eigenvalues of small generalized eigenvalue problems.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import List
+
+import numpy as np
+from scipy.linalg import eigvals, svd  # type: ignore
+
+from pyzeal.pyzeal_types.root_types import tVec
+
+
+class BarycentricRational:
+    """
+    Rational function `r(z) = sum_j w_j f_j / (z - z_j) / sum_j w_j / (z -
+    z_j)` given by support points `z_j`, values `f_j` and weights `w_j`.
+    """
+
+    __slots__ = ("support", "values", "weights", "error")
+
+    def __init__(
+        self, support: tVec, values: tVec, weights: tVec, error: float
+    ) -> None:
+        """
+        Initialize a rational function in barycentric representation.
+
+        :param support: the support points `z_j`
+        :param values: the values `f_j` at the support points
+        :param weights: the barycentric weights `w_j`
+        :param error: the maximal deviation from the approximated samples
+        """
+        self.support = support
+        self.values = values
+        self.weights = weights
+        self.error = error
+
+    @staticmethod
+    def fromSamples(
+        zArr: tVec, funcArr: tVec, tol: float, maxDegree: int
+    ) -> "BarycentricRational":
+        """
+        Construct a rational approximant of samples by the AAA algorithm,
+        which greedily adds the sample with maximal deviation to the support
+        points and calculates optimal weights from a singular value
+        decomposition of the Loewner matrix.
+
+        :param zArr: the sample points
+        :param funcArr: the function values at `zArr`
+        :param tol: the relative accuracy at which the iteration stops
+        :param maxDegree: the maximal degree of numerator and denominator
+        :return: the rational approximant
+        """
+        scale = np.abs(funcArr).max()
+        remaining = np.ones(zArr.size, dtype=bool)
+        indices: List[int] = []
+        cauchy = np.empty((zArr.size, 0), dtype=np.complex128)
+        approx = np.full(zArr.size, np.mean(funcArr), dtype=np.complex128)
+        weights = np.empty(0, dtype=np.complex128)
+        error = np.inf
+        for _ in range(min(maxDegree + 1, zArr.size - 1)):
+            index = int(np.argmax(np.abs(funcArr - approx)))
+            indices.append(index)
+            remaining[index] = False
+            with np.errstate(all="ignore"):
+                cauchy = np.column_stack((cauchy, 1 / (zArr - zArr[index])))
+            loewner = (
+                funcArr[remaining, np.newaxis] * cauchy[remaining]
+                - cauchy[remaining] * funcArr[indices][np.newaxis, :]
+            )
+            weights = svd(loewner, full_matrices=False)[2][-1].conj()
+            numerator = cauchy[remaining] @ (weights * funcArr[indices])
+            denominator = cauchy[remaining] @ weights
+            approx = funcArr.copy()
+            approx[remaining] = numerator / denominator
+            error = float(np.abs(funcArr - approx).max())
+            if error <= tol * scale:
+                break
+        return BarycentricRational(
+            zArr[indices], funcArr[indices], weights, error
+        )
+
+    def __call__(self, zArr: tVec) -> tVec:
+        """
+        Evaluate the rational function (away from its support points).
+
+        :param zArr: Points at which to evaluate the rational function
+        :return: Values of the rational function at `zArr`
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cauchy = 1 / (zArr[:, np.newaxis] - self.support[np.newaxis, :])
+            result = (cauchy @ (self.weights * self.values)) / (
+                cauchy @ self.weights
+            )
+        return np.asarray(result, dtype=np.complex128)
+
+    def zeros(self) -> tVec:
+        """
+        Calculate the zeros of the rational function.
+
+        :return: the (finite) zeros
+        """
+        return self.solveArrowhead(self.weights * self.values)
+
+    def poles(self) -> tVec:
+        """
+        Calculate the poles of the rational function.
+
+        :return: the (finite) poles
+        """
+        return self.solveArrowhead(self.weights)
+
+    def solveArrowhead(self, coefficients: tVec) -> tVec:
+        """
+        Calculate the finite zeros of `sum_j c_j / (z - z_j)` as eigenvalues
+        of the generalized arrowhead eigenvalue problem.
+
+        :param coefficients: the coefficients `c_j`
+        :return: the finite eigenvalues
+        """
+        size = self.support.size + 1
+        matrix = np.zeros((size, size), dtype=np.complex128)
+        matrix[0, 1:] = coefficients
+        matrix[1:, 0] = 1
+        matrix[1:, 1:] = np.diag(self.support)
+        identity = np.eye(size, dtype=np.complex128)
+        identity[0, 0] = 0
+        with np.errstate(all="ignore"):
+            eigenvalues = eigvals(matrix, identity)
+        return np.asarray(
+            eigenvalues[np.isfinite(eigenvalues)], dtype=np.complex128
+        )
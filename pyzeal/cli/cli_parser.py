@@ -119,6 +119,7 @@ class PyZEALParser(ArgumentParser, PyZEALParserInterface):
                 "simple_argument",
                 "simple_argument_newton",
                 "associated_polynomial",
+                "hankel_pencil",
             ],
             help="change current default algorithm",
         )
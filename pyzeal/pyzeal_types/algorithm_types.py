@@ -15,4 +15,8 @@ class AlgorithmTypes(Enum):
     SIMPLE_ARGUMENT = "SimpleArgument"
     SIMPLE_ARGUMENT_NEWTON = "SimpleArgumentNewton"
     ASSOCIATED_POLYNOMIAL = "AssociatedPolynomial"
+    HANKEL_PENCIL = "HankelPencil"
+    CIRCLE_ARGUMENT = "CircleArgument"
+    RATIONAL_SURROGATE = "RationalSurrogate"
+    MESH_ARGUMENT = "MeshArgument"
     DEFAULT = "DefaultAlgorithm"
@@ -6,9 +6,23 @@ Authors:\n
 """
 
 from multiprocessing.managers import BaseManager
-from typing import Callable, Protocol, Tuple
+from typing import Callable, Optional, Protocol, Tuple
 
+from pyzeal.pyzeal_types.root_types import tRoot
 from pyzeal.utils.finder_progress import FinderProgressBar
+from pyzeal.utils.shared_samples import SharedLineSamples
+
+# compact description of a root search on a subrectangle of the form
+# (reRan, imRan, precision, knownRoots, derivativeBound, sharedLines) sent to
+# worker processes
+tRootTask = Tuple[
+    Tuple[float, float],
+    Tuple[float, float],
+    Tuple[int, int],
+    Tuple[tRoot, ...],
+    Optional[float],
+    Optional[SharedLineSamples],
+]
 
 
 # typed queues to be used for message passing with multiprocessing.Queue
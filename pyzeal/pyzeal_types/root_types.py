@@ -7,7 +7,7 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Callable, Tuple
+from typing import Awaitable, Callable, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -19,9 +19,21 @@ tVec: TypeAlias = NDArray[np.complex128]
 # type of functions our root finding algorithms can handle
 tHoloFunc: TypeAlias = Callable[[tVec], tVec]
 
+# type of (expensive) functions which can only be evaluated on single points
+tScalarFunc: TypeAlias = Callable[[complex], complex]
+
+# type of (vectorized) functions whose values are awaited, e.g. remote services
+tAsyncHoloFunc: TypeAlias = Callable[[tVec], Awaitable[tVec]]
+
+# type of target functions accepted by root finders
+tTargetFunc: TypeAlias = Union[tHoloFunc, tAsyncHoloFunc]
+
 # type used to identify roots of holomorphic functions (point in the plane with
 # its multiplicity)
 tRoot: TypeAlias = Tuple[complex, int]
 
 # type of rectangular grid used internally in simple argument rootfinders
 tRecGrid: TypeAlias = Tuple[tVec, tVec, tVec, tVec]
+
+# type of rectangles `reRan x imRan` in the complex plane
+tRectangle: TypeAlias = Tuple[Tuple[float, float], Tuple[float, float]]
@@ -0,0 +1,22 @@
+"""
+This module provides named constants used to declare symmetries of target
+functions, which allow root finders to restrict their search to a fundamental
+domain.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from enum import Enum
+
+
+class SymmetryTypes(Enum):
+    "Enumeration containing named constants identifying known symmetries."
+    # f(conj(z)) = conj(f(z)), i.e. roots are symmetric to the real axis
+    CONJUGATE = "Conjugate"
+    # f(-z) = f(z), i.e. roots are symmetric to the origin
+    EVEN = "Even"
+    # f(-z) = -f(z), i.e. roots are symmetric to the origin
+    ODD = "Odd"
+    # f(z + period) = f(z) for a real period
+    PERIODIC = "Periodic"
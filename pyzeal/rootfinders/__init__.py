@@ -11,12 +11,14 @@ from pyzeal.pyzeal_types.container_types import ContainerTypes
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
 from pyzeal.rootfinders.finder_interface import RootFinderInterface
 from pyzeal.rootfinders.parallel_finder import ParallelRootFinder
+from pyzeal.rootfinders.root_count_exception import RootCountException
 from pyzeal.rootfinders.rootfinder import RootFinder
 
 __all__ = [
     "RootFinderInterface",
     "RootFinder",
     "ParallelRootFinder",
+    "RootCountException",
     "AlgorithmTypes",
     "ContainerTypes",
     "EstimatorTypes",
@@ -12,13 +12,13 @@ Authors:\n
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
-from numpy import int32
+from numpy import int32, int64
 from numpy.typing import NDArray
 
 from pyzeal.pyzeal_types.filter_types import FilterTypes
-from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.pyzeal_types.root_types import tRectangle, tVec
 from pyzeal.utils.containers.root_container import RootContainer
 from pyzeal.utils.factories.container_factory import ContainerFactory
 from pyzeal.utils.initialization_handler import PyZEALInitializationHandler
@@ -50,6 +50,82 @@ class RootFinderInterface(ABC):
         :param precision: accuracy of the search in real and imaginary parts
         """
 
+    @abstractmethod
+    def calculateNearestRoots(
+        self,
+        target: complex,
+        numRoots: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Optional[Tuple[int, int]] = None,
+    ) -> tVec:
+        """
+        Abstract entry point for calculating the `numRoots` roots closest to
+        `target` in the rectangle `reRan x imRan` up to a number of
+        `precision` significant digits in real and imaginary part.
+
+        :param target: point around which roots are searched
+        :param numRoots: number of roots (with multiplicities) to search
+        :param reRan: horizontal extend of the complex region to search in
+        :param imRan: vertical extend of the complex region to search in
+        :param precision: accuracy of the search in real and imaginary parts
+        :return: the roots closest to `target` ordered by their distance
+        """
+
+    @abstractmethod
+    def calculateOrders(self) -> NDArray[int32]:
+        """
+        Abstract entry point for calculating the orders of all roots which
+        were found without orders (e.g. by Newton based algorithms).
+
+        :return: the orders of all roots, parallel to the `roots` property
+        """
+
+    @abstractmethod
+    def countRoots(
+        self, reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> int:
+        """
+        Abstract entry point for counting the roots (with multiplicities) in
+        the rectangle `reRan x imRan` without refining their positions.
+
+        :param reRan: horizontal extend of the complex region to count in
+        :param imRan: vertical extend of the complex region to count in
+        :raises RootCountException: if the root count is not integral
+        :return: the number of roots inside the rectangle
+        """
+
+    @abstractmethod
+    def countRootsBatched(
+        self, rectangles: Sequence[tRectangle]
+    ) -> NDArray[int64]:
+        """
+        Abstract entry point for counting the roots (with multiplicities) in
+        many rectangles `reRan x imRan` at once.
+
+        :param rectangles: the complex regions to count in
+        :raises RootCountException: if a root count is not integral
+        :return: the number of roots inside each rectangle
+        """
+
+    @abstractmethod
+    def countRootsGrid(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        numCells: Tuple[int, int],
+    ) -> NDArray[int64]:
+        """
+        Abstract entry point for counting the roots (with multiplicities) in
+        each cell of a regular grid of `numCells` cells covering the rectangle
+        `reRan x imRan`.
+
+        :param reRan: horizontal extend of the complex region to count in
+        :param imRan: vertical extend of the complex region to count in
+        :param numCells: number of cells in real and imaginary direction
+        :return: the number of roots inside each cell of the grid
+        """
+
     @property
     @abstractmethod
     def roots(self) -> tVec:
@@ -4,41 +4,96 @@ This module defines an implementation of the main root finding API as defined
 by the `RootFinderInterface` protocol. It differs from `RootFinder` in the fact
 that it devides the search region into sub-regions and delegates these to a
 number of appropriate algorithms working in parallel. The parallelism is
-realized by using the standard library `multiprocessing` module.
+realized by using the standard library `multiprocessing` module or an
+arbitrary `concurrent.futures.Executor`.
 
 Authors:\n
 - Philipp Schuette\n
 """
 
-from multiprocessing import Manager, Pool
+from concurrent.futures import Executor
+from contextlib import ExitStack
+from copy import deepcopy
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+from math import ceil
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
 from os import cpu_count, getpid
+from queue import SimpleQueue
 from signal import SIG_IGN, SIGINT, signal
-from typing import List, Optional, Tuple, cast
+from threading import local
+from types import TracebackType
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
+import numpy as np
 from numpy import linspace
+from numpy.typing import NDArray
 from rich.progress import TaskID
 
+from pyzeal.algorithms.constants import PARTITION_MAX_DEPTH, ROOT_COUNT_TOL
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
+from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
+from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
 from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
 from pyzeal.pyzeal_types.container_types import ContainerTypes
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
-from pyzeal.pyzeal_types.parallel_types import FinderProgressManager, tQueue
-from pyzeal.pyzeal_types.root_types import tHoloFunc
+from pyzeal.pyzeal_types.parallel_types import tQueue, tRootTask
+from pyzeal.pyzeal_types.root_types import (
+    tHoloFunc,
+    tRectangle,
+    tRoot,
+    tTargetFunc,
+)
+from pyzeal.pyzeal_types.symmetry_types import SymmetryTypes
 from pyzeal.rootfinders.rootfinder import RootFinder
-from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.concurrent_function import openEvaluators
+from pyzeal.utils.containers.plain_container import PlainContainer
 from pyzeal.utils.filter_context import FilterContext
 from pyzeal.utils.finder_progress import FinderProgressBar
-from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_context import DEFAULT_CHUNK_SIZE, RootContext
+from pyzeal.utils.shared_samples import SharedLineSamples
+
+# data shared by all tasks of a worker (target function, derivative,
+# algorithm and chunk size)
+tWorkerState = Tuple[tHoloFunc, Optional[tHoloFunc], FinderAlgorithm, int]
+# data shared by all tasks of a pool process (set by `initWorker`)
+_workerState: tWorkerState
+# copies of algorithms used by the threads (or processes) of an executor
+_executorState = local()
 
 
 class ParallelRootFinder(RootFinder):
     """
     Parallel (multiprocessing) implementation of the main root finding API.
+    Root searches are distributed over a long-lived pool of worker processes
+    which is reused by subsequent searches and shut down by `close` (or at the
+    end of a `with` block). Alternatively, tasks are submitted to an
+    executor supplied by the caller, which is not shut down by the finder.
     """
 
+    __slots__ = (
+        "numWorkers",
+        "executor",
+        "tasksPerChunk",
+        "_pool",
+        "_poolState",
+    )
+
     def __init__(
         self,
-        f: tHoloFunc,
-        df: Optional[tHoloFunc] = None,
+        f: tTargetFunc,
+        df: Optional[tTargetFunc] = None,
         *,
         containerType: ContainerTypes = ContainerTypes.DEFAULT,
         algorithmType: AlgorithmTypes = AlgorithmTypes.DEFAULT,
@@ -46,21 +101,59 @@ class ParallelRootFinder(RootFinder):
         precision: Optional[Tuple[int, int]] = None,
         numSamplePoints: Optional[int] = None,
         verbose: Optional[bool] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        symmetries: Sequence[SymmetryTypes] = (),
+        period: Optional[float] = None,
+        knownRoots: Sequence[tRoot] = (),
+        derivativeBound: Optional[float] = None,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
+        executor: Optional[Executor] = None,
+        numWorkers: Optional[int] = None,
+        tasksPerChunk: int = 1,
     ) -> None:
         """
         Initialize a parallel (multiprocessing) root finder.
 
-        :param f: the function whose roots should be calculated
+        :param f: the function whose roots should be calculated (coroutine
+            functions are awaited concurrently on blocks of points)
         :param df: the derivative of `f`
         :param containerType: the type of container found roots are stored in
         :param algorithmType: the type of algorithm used for root finding
         :param precision: the accuracy at which roots are considered exact
         :param numSamplePoints: determines grid size for `NewtonGridAlgorithm`
         :param verbose: flag that toggles the command line progress bar
+        :param chunkSize: maximal number of points passed to a single call of
+            `f` or `df`
+        :param symmetries: symmetries of `f` which restrict root searches to
+            fundamental domains (applied in the given order)
+        :param period: the (real) period of `f` if `symmetries` contains
+            `SymmetryTypes.PERIODIC`
+        :param knownRoots: roots of `f` (with their orders) which are known
+            already and deflated from `f` during root searches
+        :param derivativeBound: an upper bound of `|f'|` on the search domain
+            used to exclude rectangles without roots from a few samples of
+            `f` (estimated from samples if omitted)
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            argument changes and function samples of the argument estimator (of
+            each worker)
+        :param executor: executor (e.g. a thread pool or a process pool with a
+            chosen start method) running the tasks of root searches instead
+            of the finder's own pool of processes; the target function, its
+            derivative and the algorithm are sent along with each chunk of
+            tasks (and must be thread-safe for thread pools)
+        :param numWorkers: number of workers among which the search domain is
+            partitioned (and size of the finder's own pool), defaults to the
+            number of CPUs
+        :param tasksPerChunk: number of tasks sent to a worker at once
         """
+        self.numWorkers = numWorkers or cpu_count() or 1
+        self.executor = executor
+        self.tasksPerChunk = tasksPerChunk
+        self._pool: Optional[PoolType] = None
+        self._poolState: Tuple[Any, ...] = ()
         # every algorithm invocation uses numSamplePoints on its subgrid!
         numSamplePoints = (
-            int(numSamplePoints / (cpu_count() or 1)) + 1
+            int(numSamplePoints / self.numWorkers) + 1
             if numSamplePoints
             else None
         )
@@ -73,6 +166,12 @@ class ParallelRootFinder(RootFinder):
             precision=precision,
             numSamplePoints=numSamplePoints,
             verbose=verbose,
+            chunkSize=chunkSize,
+            symmetries=symmetries,
+            period=period,
+            knownRoots=knownRoots,
+            derivativeBound=derivativeBound,
+            maxCacheBytes=maxCacheBytes,
         )
 
     def __str__(self) -> str:
@@ -89,15 +188,16 @@ class ParallelRootFinder(RootFinder):
             + "df=None)"
         )
 
-    def calculateRoots(
+    def searchRoots(
         self,
         reRan: Tuple[float, float],
         imRan: Tuple[float, float],
         precision: Optional[Tuple[int, int]] = None,
     ) -> None:
         """
-        Parallel implementation of the root finding interface as defined in
-        `RootFinderInterface`.
+        Start a parallel root finding calculation in the rectangle
+        `reRan x imRan` (without reduction by symmetries), distributing
+        subrectangles over the worker processes of the finder's pool.
 
         :param reRan: horizontal extend of the complex region to search in
         :param imRan: vertical extend of the complex region to search in
@@ -111,122 +211,439 @@ class ParallelRootFinder(RootFinder):
         # desymmetrize the input rectangle
         (x1, x2), (y1, y2) = self.desymmetrizeDomain(reRan, imRan, precision)
 
-        # initialize a shared progress bar
-        FinderProgressManager.register("finderProgress", FinderProgressBar)
-        with FinderProgressManager() as manager:
-            progress = manager.finderProgress() if self.verbose else None
-            task: Optional[TaskID] = None
-            if progress is not None:
-                task = progress.addTask((x2 - x1) * (y2 - y1))
-                progress.start()
-                self.logger.debug("starting progress bar...")
-
-            # construct a list of root contexts, several for each child process
-            rootQueue: tQueue = cast(tQueue, Manager().Queue())
-            contexts = self.createRootJobs(
-                numProcesses=cpu_count() or 1,
-                reRan=(x1, x2),
-                imRan=(y1, y2),
-                rootQueue=rootQueue,
-                precision=precision,
-                progress=progress,
-                task=task,
-            )
+        # initialize the progress bar (updated whenever a task finishes)
+        progress = FinderProgressBar() if self.verbose else None
+        task: Optional[TaskID] = None
+        if progress is not None:
+            task = progress.addTask((x2 - x1) * (y2 - y1))
+            progress.start()
+            self.logger.debug("starting progress bar...")
 
-            with Pool(initializer=ParallelRootFinder.suppressSig) as pool:
-                # shut down root search orderly upon command line signals
-                try:
-                    self.logger.info("attempting to calculate roots...")
-                    pool.starmap(
-                        self.rootWorker,
-                        [(context,) for context in contexts],
-                        chunksize=cpu_count() or 1,
-                    )
-                    if progress is not None and task is not None:
-                        progress.update(
-                            task, description=("[green] search finished!")
-                        )
-                    self.logger.debug("all child processes returned normally!")
-                except KeyboardInterrupt:
-                    self.logger.warning(
-                        "calculation interrupted - some roots may be missing!"
-                    )
-                    if progress and task:
-                        progress.stop_task(task)
-                        progress.update(task, visible=False)
-                        progress.refresh()
+        tasks = self.createRootTasks(
+            numProcesses=self.numWorkers,
+            reRan=(x1, x2),
+            imRan=(y1, y2),
+            precision=precision,
+        )
+        if progress is not None and task is not None:
+            # rectangles without roots are skipped
+            progress.update(
+                task,
+                advance=(x2 - x1) * (y2 - y1)
+                - sum(
+                    (reTask[1] - reTask[0]) * (imTask[1] - imTask[0])
+                    for reTask, imTask, *_ in tasks
+                ),
+            )
+        roots: List[tRoot] = []
+        # threads of an executor share the evaluators of the target function
+        # (e.g. pools of a `ConcurrentFunction`), which are opened only once
+        evaluators = (
+            openEvaluators(self.f, self.df)
+            if self.executor is not None
+            else ExitStack()
+        )
+        # shut down root search orderly upon command line signals
+        try:
+            self.logger.info("attempting to calculate roots...")
+            for (reTask, imTask, *_), taskRoots in zip(
+                tasks,
+                self.mapTasks(tasks),
+            ):
+                roots.extend(taskRoots)
                 if progress is not None and task is not None:
-                    progress.stop()
-
-            # add found roots to the current instance's container
-            self.logger.debug("transferring roots from queue to container!")
-            precision = (precision[0] - 1, precision[1] - 1)
-            while not rootQueue.empty():
-                self.container.addRoot(
-                    rootQueue.get(),
-                    FilterContext(self.f, (x1, x2), (y1, y2), precision),
-                )
-            self.logger.info("parallel root search finished!")
+                    progress.update(
+                        task,
+                        advance=(reTask[1] - reTask[0])
+                        * (imTask[1] - imTask[0]),
+                    )
+            if progress is not None and task is not None:
+                progress.update(task, description="[green] search finished!")
+            self.logger.debug("all root tasks returned normally!")
+        except KeyboardInterrupt:
+            self.logger.warning(
+                "calculation interrupted - some roots may be missing!"
+            )
+            # the workers might still be busy, hence start a new pool later
+            self.close(terminate=True)
+            if progress and task:
+                progress.stop_task(task)
+                progress.update(task, visible=False)
+                progress.refresh()
+        finally:
+            evaluators.close()
+            if progress is not None and task is not None:
+                progress.stop()
+            # free the samples shared with the workers (even if a worker
+            # raised), which also detaches this process from them
+            for sharedLines in {rootTask[5] for rootTask in tasks} - {None}:
+                cast(SharedLineSamples, sharedLines).unlink()
 
-    def createRootJobs(
+        # add found roots to the current instance's container
+        precision = (precision[0] - 1, precision[1] - 1)
+        filterContext = FilterContext(self.f, (x1, x2), (y1, y2), precision)
+        for root in roots:
+            self.container.addRoot(root, filterContext)
+        self.addKnownRoots((x1, x2), (y1, y2), precision)
+        self.logger.info("parallel root search finished!")
+
+    def createRootTasks(
         self,
         numProcesses: int,
         reRan: Tuple[float, float],
         imRan: Tuple[float, float],
-        rootQueue: tQueue,
         precision: Tuple[int, int],
-        progress: Optional[FinderProgressBar],
-        task: Optional[TaskID],
-    ) -> List[RootContext]:
+    ) -> List[tRootTask]:
         """
-        Convenience method that constructs a list of RootContext objects on
-        which child processes operate by applying a concrete RootAlgorithm.
+        Convenience method that splits the search domain into a list of
+        compact task descriptors on which worker processes operate by applying
+        the finder's algorithm. Algorithms based on the argument principle
+        only receive subrectangles containing roots, which are balanced by
+        `partitionDomain`. The samples of the target function calculated
+        during partitioning (in particular along the seams between tasks) are
+        shared with the workers via shared memory, such that no seam is
+        sampled twice.
 
         :param numProcesses: The number of processes, which determines the
-            amount of contexts that are returned
+            amount of tasks that are returned
         :param reRan: Search range for the real part
         :param imRan: Search range for the imaginary part
-        :param rootQueue: Queue in which new roots are added
         :param precision: accuracy of search in real and imaginary parts
-        :param progress: Progress bar handle
-        :param task: TaskID for the progress bar
-        :return: List of RootContexts on which child processes can operate
+        :return: List of tasks on which worker processes can operate
         """
         self.logger.debug(
-            "initializing context jobs for %d child processes...", numProcesses
+            "initializing root tasks for %d worker processes...", numProcesses
         )
         realPts = linspace(reRan[0], reRan[1], numProcesses + 1)
         imagPts = linspace(imRan[0], imRan[1], numProcesses + 1)
-        plainContainer = ContainerFactory.getConcreteContainer(
-            ContainerTypes.PLAIN_CONTAINER, queue=rootQueue
+        sharedLines: Optional[SharedLineSamples] = None
+        if isinstance(self.algorithm, SimpleArgumentAlgorithm):
+            rectangles = self.partitionDomain(
+                numProcesses, realPts, imagPts, precision
+            )
+            if len(lines := self.estimator.exportSamples()) > 0:
+                sharedLines = SharedLineSamples(lines)
+            # samples live on in shared memory (workers need no copies)
+            self.estimator.reset()
+        else:
+            rectangles = [
+                (
+                    (float(realPts[i]), float(realPts[i + 1])),
+                    (float(imagPts[j]), float(imagPts[j + 1])),
+                )
+                for i in range(len(realPts) - 1)
+                for j in range(len(imagPts) - 1)
+            ]
+        return [
+            (
+                reTask,
+                imTask,
+                precision,
+                self.knownRoots,
+                self.derivativeBound,
+                sharedLines,
+            )
+            for reTask, imTask in rectangles
+        ]
+
+    def partitionDomain(
+        self,
+        numProcesses: int,
+        reGrid: NDArray[np.float64],
+        imGrid: NDArray[np.float64],
+        precision: Tuple[int, int],
+    ) -> List[tRectangle]:
+        """
+        Partition the domain covered by the coarse grid `reGrid x imGrid`
+        into subrectangles holding similar numbers of roots. Roots are counted
+        on the whole grid at once (sampling shared edges only once), cells
+        without roots are dropped and cells holding more roots than an even
+        share are bisected. If counts are not integral (roots close to grid
+        lines), the affected cells are kept without further splitting.
+
+        :param numProcesses: The number of processes sharing the roots
+        :param reGrid: Real parts of the vertices of the coarse grid
+        :param imGrid: Imaginary parts of the vertices of the coarse grid
+        :param precision: accuracy of search in real and imaginary parts
+        :return: subrectangles containing roots, most roots first
+        """
+        estimator = self.estimator
+        # use the lattice of the workers, such that samples can be shared
+        estimator.cache.setLattice(
+            (float(reGrid[0]), float(reGrid[-1])),
+            (float(imGrid[0]), float(imGrid[-1])),
+            precision,
+        )
+        context = RootContext(
+            f=self.f,
+            df=self.df,
+            container=self.container,
+            precision=precision,
+            reRan=(float(reGrid[0]), float(reGrid[-1])),
+            imRan=(float(imGrid[0]), float(imGrid[-1])),
+            chunkSize=self.chunkSize,
+            knownRoots=self.knownRoots,
+            derivativeBound=self.derivativeBound,
         )
-        contexts: List[RootContext] = []
-        for i in range(len(realPts) - 1):
-            for j in range(len(imagPts) - 1):
-                contexts.append(
-                    RootContext(
-                        f=self.f,
-                        df=self.df,
-                        container=plainContainer,
-                        reRan=(realPts[i], realPts[i + 1]),
-                        imRan=(imagPts[j], imagPts[j + 1]),
-                        precision=precision,
-                        progress=progress,
-                        task=task,
+
+        def countHalf(
+            reRan: Tuple[float, float], imRan: Tuple[float, float]
+        ) -> Optional[int]:
+            numRoots = estimator.calcMoment(0, reRan, imRan, context).real / (
+                2 * np.pi
+            )
+            if abs(numRoots - round(numRoots)) >= ROOT_COUNT_TOL:
+                return None
+            return round(numRoots)
+
+        # rectangles (with their root counts) ordered by decreasing counts
+        tieBreaker = count()
+        queue: List[Tuple[int, int, tRectangle, int]] = []
+        rectangles: List[tRectangle] = []
+        with openEvaluators(self.f, self.df):
+            counts = estimator.calcArgumentGrid(reGrid, imGrid, context) / (
+                2 * np.pi
+            )
+            for (i, j), cellCount in np.ndenumerate(counts):
+                cell = (
+                    (float(reGrid[i]), float(reGrid[i + 1])),
+                    (float(imGrid[j]), float(imGrid[j + 1])),
+                )
+                if abs(cellCount - round(cellCount)) >= ROOT_COUNT_TOL:
+                    rectangles.append(cell)
+                elif round(cellCount) > 0:
+                    heappush(
+                        queue,
+                        (-round(cellCount), next(tieBreaker), cell, 0),
                     )
+            share = max(
+                ceil(sum(-numRoots for numRoots, *_ in queue) / numProcesses),
+                1,
+            )
+            while len(queue) > 0:
+                numRoots, _, (reRan, imRan), depth = heappop(queue)
+                if -numRoots <= share or depth >= PARTITION_MAX_DEPTH:
+                    rectangles.append((reRan, imRan))
+                    continue
+                halves = SimpleArgumentAlgorithm.splitRectangle(
+                    reRan, imRan, precision
                 )
-        return contexts
+                halfCounts = [countHalf(*half) for half in halves]
+                if None in halfCounts:
+                    rectangles.append((reRan, imRan))
+                    continue
+                for half, halfCount in zip(halves, halfCounts):
+                    if halfCount:
+                        heappush(
+                            queue,
+                            (-halfCount, next(tieBreaker), half, depth + 1),
+                        )
+        self.logger.debug(
+            "partitioned %d grid cells into %d tasks!",
+            counts.size,
+            len(rectangles),
+        )
+        return rectangles
 
-    def rootWorker(self, context: RootContext) -> None:
+    def mapTasks(self, tasks: List[tRootTask]) -> Iterator[List[tRoot]]:
         """
-        Worker function that executes a root finding algorithm in a child
-        process.
+        Run root finding tasks in parallel, either on the finder's own pool
+        of processes or on the executor supplied by the caller.
 
-        :param context: Context object on which roots are searched
+        :param tasks: Tasks to run
+        :return: Roots (with orders) found by each task (in the order of
+            `tasks`)
         """
-        self.logger.info("starting root job in pid=%d!", getpid())
-        self.algorithm.calcRoots(context)
-        self.logger.info("finished root job in pid=%d!", getpid())
+        if self.executor is None:
+            return self.pool.imap(
+                ParallelRootFinder.rootWorker,
+                tasks,
+                chunksize=self.tasksPerChunk,
+            )
+        state: tWorkerState = (self.f, self.df, self.algorithm, self.chunkSize)
+        return self.executor.map(
+            partial(ParallelRootFinder.executorWorker, state, getpid()),
+            tasks,
+            chunksize=self.tasksPerChunk,
+        )
+
+    @property
+    def pool(self) -> PoolType:
+        """
+        Long-lived pool of worker processes used by all root searches of this
+        finder. Workers receive the target function, its derivative and the
+        algorithm once upon start-up, while each task only consists of a
+        rectangle and the search parameters. The pool is (re-)started on
+        demand whenever these objects changed.
+
+        :return: the pool of worker processes
+        """
+        state = (self.f, self.df, self.algorithm, self.chunkSize)
+        if self._pool is not None and any(
+            old is not new for old, new in zip(self._poolState, state)
+        ):
+            self.logger.debug("target of the worker pool changed!")
+            self.close()
+        if self._pool is None:
+            self.logger.debug(
+                "starting a pool of %d worker processes...", self.numWorkers
+            )
+            self._pool = Pool(
+                self.numWorkers,
+                initializer=ParallelRootFinder.initWorker,
+                initargs=state,
+            )
+            self._poolState = state
+        return self._pool
+
+    def close(self, terminate: bool = False) -> None:
+        """
+        Shut down the pool of worker processes. Subsequent root searches start
+        a new pool.
+
+        :param terminate: stop workers immediately instead of waiting for
+            pending tasks
+        """
+        if self._pool is None:
+            return
+        if terminate:
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._poolState = ()
+        self.logger.debug("shut down the pool of worker processes!")
+
+    def __enter__(self) -> "ParallelRootFinder":
+        """
+        Use the finder (and its pool of workers) for the duration of a `with`
+        block.
+
+        :return: The root finder itself
+        """
+        return self
+
+    def __exit__(
+        self,
+        excType: Optional[Type[BaseException]],
+        excValue: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Shut down the pool of workers at the end of a `with` block.
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        "Stop remaining worker processes upon garbage collection."
+        if getattr(self, "_pool", None) is not None:
+            self.close(terminate=True)
+
+    @staticmethod
+    def initWorker(
+        f: tHoloFunc,
+        df: Optional[tHoloFunc],
+        algorithm: FinderAlgorithm,
+        chunkSize: int,
+    ) -> None:
+        """
+        Initialization routine of worker processes storing the data shared by
+        all tasks and setting workers to ignore `ctrl+c`.
+
+        :param f: the function whose roots should be calculated
+        :param df: the derivative of `f`
+        :param algorithm: the algorithm applied to each task
+        :param chunkSize: maximal number of points passed to a single call of
+            `f` or `df`
+        """
+        global _workerState
+        ParallelRootFinder.suppressSig()
+        _workerState = (f, df, algorithm, chunkSize)
+
+    @staticmethod
+    def rootWorker(task: tRootTask) -> List[tRoot]:
+        """
+        Worker function that executes a root finding algorithm on a single
+        task in a process of the finder's own pool.
+
+        :param task: Descriptor of the subrectangle to search
+        :return: Roots (with orders) found inside of the subrectangle
+        """
+        return ParallelRootFinder.runTask(_workerState, task)
+
+    @staticmethod
+    def executorWorker(
+        state: tWorkerState, parentPid: int, task: tRootTask
+    ) -> List[tRoot]:
+        """
+        Worker function that executes a root finding algorithm on a single
+        task submitted to an executor. Each thread (or process) of the
+        executor uses its own copy of the algorithm. Threads share the
+        evaluators of the target function opened by the finder, while
+        processes open their copies themselves.
+
+        :param state: Target function, derivative, algorithm and chunk size
+        :param parentPid: Process id of the root finder
+        :param task: Descriptor of the subrectangle to search
+        :return: Roots (with orders) found inside of the subrectangle
+        """
+        if getattr(_executorState, "source", None) is not state:
+            f, df, algorithm, chunkSize = state
+            _executorState.source = state
+            _executorState.state = (f, df, deepcopy(algorithm), chunkSize)
+        return ParallelRootFinder.runTask(
+            _executorState.state, task, openFuncs=getpid() != parentPid
+        )
+
+    @staticmethod
+    def runTask(
+        state: tWorkerState, task: tRootTask, openFuncs: bool = True
+    ) -> List[tRoot]:
+        """
+        Execute a root finding algorithm on a single task.
+
+        :param state: Target function, derivative, algorithm and chunk size
+        :param task: Descriptor of the subrectangle to search
+        :param openFuncs: Flag indicating whether the evaluators of the
+            target function (and derivative) must be opened for the task
+        :return: Roots (with orders) found inside of the subrectangle
+        """
+        f, df, algorithm, chunkSize = state
+        reRan, imRan, precision, knownRoots, bound, sharedLines = task
+        container = PlainContainer(queue=cast(tQueue, SimpleQueue()))
+        context = RootContext(
+            f=f,
+            df=df,
+            container=container,
+            reRan=reRan,
+            imRan=imRan,
+            precision=precision,
+            chunkSize=chunkSize,
+            knownRoots=knownRoots,
+            derivativeBound=bound,
+            sharedLines=(
+                tuple(sharedLines.lines) if sharedLines is not None else ()
+            ),
+        )
+        algorithm.logger.info("starting root job in pid=%d!", getpid())
+        try:
+            with openEvaluators(f, df) if openFuncs else ExitStack():
+                algorithm.calcRoots(context)
+        finally:
+            if sharedLines is not None:
+                # release all views of the shared samples (tasks of a chunk
+                # share one attachment, which is closed once it is collected)
+                del context
+                if isinstance(algorithm, SimpleArgumentAlgorithm):
+                    algorithm.estimator.reset()
+        algorithm.logger.info("finished root job in pid=%d!", getpid())
+        return list(
+            zip(
+                container.getRoots().tolist(),
+                container.getRootOrders().tolist(),
+            )
+        )
 
     @staticmethod
     def suppressSig() -> None:
@@ -0,0 +1,33 @@
+"""
+Exception class for root counts which could not be certified.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import Tuple
+
+
+class RootCountException(Exception):
+    """
+    Raise (and expect) this exception whenever the argument principle does not
+    yield an integral root count, even after perturbing the counting rectangle.
+    """
+
+    def __init__(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        count: float,
+    ) -> None:
+        """
+        Initialize a `RootCountException` instance.
+
+        :param reRan: horizontal extend of the rectangle counted in
+        :param imRan: vertical extend of the rectangle counted in
+        :param count: the last (non-integral) root count
+        """
+        super().__init__(
+            f"root count {count:f} in {reRan} x {imRan} is not integral!"
+        )
+        self.count = count
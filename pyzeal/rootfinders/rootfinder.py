@@ -10,26 +10,54 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
 from rich.progress import TaskID
 
+from pyzeal.algorithms.constants import (
+    DEFAULT_DELTA_PHI,
+    DEFAULT_MAX_PRECISION,
+    DEFAULT_NUM_PTS,
+    ROOT_COUNT_RETRIES,
+    ROOT_COUNT_TOL,
+)
+from pyzeal.algorithms.estimators import EstimatorCache
+from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
 from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
+from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
 from pyzeal.pyzeal_logging.log_levels import LogLevel
 from pyzeal.pyzeal_logging.loggable import Loggable
 from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
 from pyzeal.pyzeal_types.container_types import ContainerTypes
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
-from pyzeal.pyzeal_types.root_types import tHoloFunc, tVec
+from pyzeal.pyzeal_types.root_types import (
+    tRectangle,
+    tRoot,
+    tTargetFunc,
+    tVec,
+)
 from pyzeal.pyzeal_types.settings_types import SettingsServicesTypes
+from pyzeal.pyzeal_types.symmetry_types import SymmetryTypes
 from pyzeal.rootfinders.finder_interface import RootFinderInterface
+from pyzeal.rootfinders.root_count_exception import RootCountException
 from pyzeal.settings.settings_service import SettingsService
+from pyzeal.utils.async_function import wrapAsync
+from pyzeal.utils.concurrent_function import openEvaluators
 from pyzeal.utils.containers.root_container import RootContainer
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.filter_context import FilterContext
 from pyzeal.utils.finder_progress import FinderProgressBar
-from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_context import (
+    DEFAULT_CHUNK_SIZE,
+    RootContext,
+    evalChunked,
+)
+from pyzeal.utils.root_orders import calcRootOrders
 from pyzeal.utils.service_locator import ServiceLocator
+from pyzeal.utils.symmetry_reduction import SymmetryReduction
 
 
 class RootFinder(RootFinderInterface, Loggable):
@@ -45,12 +73,20 @@ class RootFinder(RootFinderInterface, Loggable):
         "precision",
         "numSamplePoints",
         "verbose",
+        "chunkSize",
+        "estimatorType",
+        "_estimator",
+        "symmetries",
+        "period",
+        "_knownRoots",
+        "derivativeBound",
+        "maxCacheBytes",
     )
 
     def __init__(
         self,
-        f: tHoloFunc,
-        df: Optional[tHoloFunc] = None,
+        f: tTargetFunc,
+        df: Optional[tTargetFunc] = None,
         *,
         containerType: ContainerTypes = ContainerTypes.DEFAULT,
         algorithmType: AlgorithmTypes = AlgorithmTypes.DEFAULT,
@@ -58,11 +94,18 @@ class RootFinder(RootFinderInterface, Loggable):
         precision: Optional[Tuple[int, int]] = None,
         numSamplePoints: Optional[int] = None,
         verbose: Optional[bool] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        symmetries: Sequence[SymmetryTypes] = (),
+        period: Optional[float] = None,
+        knownRoots: Sequence[tRoot] = (),
+        derivativeBound: Optional[float] = None,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
     ) -> None:
         """
         Initialize a simple, non-parallel root finder.
 
-        :param f: the function whose roots should be calculated
+        :param f: the function whose roots should be calculated (coroutine
+            functions are awaited concurrently on blocks of points)
         :param df: the derivative of `f`
         :param containerType: the type of container found roots are stored in
         :param algorithmType: the type of algorithm used for root finding
@@ -70,21 +113,53 @@ class RootFinder(RootFinderInterface, Loggable):
         :param precision: the accuracy at which roots are considered exact
         :param numSamplePoints: determines grid size for `NewtonGridAlgorithm`
         :param verbose: flag that toggles the command line progress bar
+        :param chunkSize: maximal number of points passed to a single call of
+            `f` or `df`
+        :param symmetries: symmetries of `f` which restrict root searches to
+            fundamental domains (applied in the given order)
+        :param period: the (real) period of `f` if `symmetries` contains
+            `SymmetryTypes.PERIODIC`
+        :param knownRoots: roots of `f` (with their orders) which are known
+            already and deflated from `f` during root searches
+        :param derivativeBound: an upper bound of `|f'|` on the search domain
+            used to exclude rectangles without roots from a few samples of
+            `f` (estimated from samples if omitted)
+        :param maxCacheBytes: the maximal number of bytes held by the cache of
+            argument changes and function samples of the argument estimator
+        :raises ValueError: An error is raised if the algorithm needs the
+            derivative of `f` but `df` is omitted.
         """
-        self.f = f
-        self.df = df
+        # validate the declared symmetries early
+        SymmetryReduction(symmetries, (0, 0), period=period)
+        self.symmetries = tuple(symmetries)
+        self.period = period
+        self.f = wrapAsync(f)
+        self.df = wrapAsync(df) if df is not None else None
+        self.chunkSize = chunkSize
+        self.maxCacheBytes = maxCacheBytes
+        self.estimatorType = estimatorType
+        self._estimator: Optional[ArgumentEstimator] = None
         self.algorithm: FinderAlgorithm = ServiceLocator.tryResolve(
             FinderAlgorithm,
             algoType=algorithmType,
             estimatorType=estimatorType,
             numSamplePoints=numSamplePoints,
+            maxCacheBytes=maxCacheBytes,
         )
+        if df is None and self.algorithm.requiresDerivative:
+            raise ValueError(
+                f"{type(self.algorithm).__name__} needs the derivative of the "
+                "target function!"
+            )
         self._container = ServiceLocator.tryResolve(
             RootContainer, containerType=containerType, precision=precision
         )
         self.precision = (
             precision or ServiceLocator.tryResolve(SettingsService).precision
         )
+        self._knownRoots: Tuple[tRoot, ...] = ()
+        self.knownRoots = tuple(knownRoots)
+        self.derivativeBound = derivativeBound
 
         self.verbose = (
             verbose
@@ -114,6 +189,110 @@ class RootFinder(RootFinderInterface, Loggable):
         reRan: Tuple[float, float],
         imRan: Tuple[float, float],
         precision: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Start a root finding calculation in the rectangle `reRan x imRan` up
+        to a number of `precision` significant digits in real and imaginary
+        part. If symmetries of the target function were declared, only a
+        fundamental domain is searched and the remaining roots are
+        reconstructed from its roots.
+
+        :param reRan: horizontal extend of the complex region to search in
+        :param imRan: vertical extend of the complex region to search in
+        :param precision: accuracy of the search in real and imaginary parts
+        """
+        precision = precision or self.precision
+        if len(self.symmetries) == 0:
+            self.searchRoots(reRan, imRan, precision)
+        else:
+            self.searchSymmetricRoots(reRan, imRan, precision)
+
+    def searchSymmetricRoots(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Tuple[int, int],
+    ) -> None:
+        """
+        Search roots on a fundamental domain of the rectangle `reRan x imRan`
+        with respect to the declared symmetries of the target function and
+        reconstruct the remaining roots from its roots.
+
+        :param reRan: horizontal extend of the complex region to search in
+        :param imRan: vertical extend of the complex region to search in
+        :param precision: accuracy of the search in real and imaginary parts
+        """
+        reduction = SymmetryReduction(
+            self.symmetries, precision, period=self.period
+        )
+        reducedRe, reducedIm = reduction.reduce(reRan, imRan)
+        self.logger.info(
+            "reduced search domain to [%f, %f] x [%f, %f] by %d symmetries!",
+            *reducedRe,
+            *reducedIm,
+            len(reduction.reductions),
+        )
+        # collect roots on the fundamental domain in a separate container
+        container = self._container
+        self._container = ContainerFactory.getConcreteContainer(
+            ContainerTypes.ROUNDING_CONTAINER,
+            precision=(precision[0] + 1, precision[1] + 1),
+        )
+        try:
+            self.searchRoots(reducedRe, reducedIm, precision)
+            roots = self.container.getRoots()
+            orders = self.container.getRootOrders()
+        finally:
+            self._container = container
+        filterContext = FilterContext(
+            self.f,
+            *self.desymmetrizeDomain(reRan, imRan, precision),
+            precision,
+        )
+        for root in reduction.expand(roots, orders):
+            self.container.addRoot(root, filterContext)
+
+    def addKnownRoots(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Tuple[int, int],
+    ) -> None:
+        """
+        Add the known roots inside of the (desymmetrized) rectangle
+        `reRan x imRan` to the container (deflated searches do not find them).
+
+        :param reRan: horizontal extend of the searched region
+        :param imRan: vertical extend of the searched region
+        :param precision: accuracy at which found roots were added to the
+            container
+        """
+        filterContext = FilterContext(self.f, reRan, imRan, precision)
+        for root in self.knownRootsInside(reRan, imRan):
+            self.container.addRoot(root, filterContext)
+
+    def knownRootsInside(
+        self, reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> List[tRoot]:
+        """
+        Return the known roots inside of the rectangle `reRan x imRan`.
+
+        :param reRan: horizontal extend of the rectangle
+        :param imRan: vertical extend of the rectangle
+        :return: the known roots (with their orders) inside the rectangle
+        """
+        return [
+            (root, order)
+            for root, order in self.knownRoots
+            if reRan[0] <= root.real <= reRan[1]
+            and imRan[0] <= root.imag <= imRan[1]
+        ]
+
+    def searchRoots(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Optional[Tuple[int, int]] = None,
     ) -> None:
         """
         Start a (non-parallel) root finding calculation in the rectangle
@@ -150,11 +329,15 @@ class RootFinder(RootFinderInterface, Loggable):
             imRan=(y1, y2),
             progress=progress,
             task=task,
+            chunkSize=self.chunkSize,
+            knownRoots=self.knownRoots,
+            derivativeBound=self.derivativeBound,
         )
         # shut down root finding in orderly fashion upon command line signals
         try:
             self.logger.info("attempting to calculate roots...")
-            self.algorithm.calcRoots(context)
+            with openEvaluators(self.f, self.df):
+                self.algorithm.calcRoots(context)
             if progress is not None and task is not None:
                 progress.update(task, description="[green] search finished!")
         except KeyboardInterrupt:
@@ -167,8 +350,284 @@ class RootFinder(RootFinderInterface, Loggable):
                 progress.refresh()
         if progress is not None and task is not None:
             progress.stop()
+        self.addKnownRoots((x1, x2), (y1, y2), precision)
         self.logger.info("non-parallel root search finished!")
 
+    def calculateNearestRoots(
+        self,
+        target: complex,
+        numRoots: int,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        precision: Optional[Tuple[int, int]] = None,
+    ) -> tVec:
+        """
+        Calculate the `numRoots` roots closest to `target` in the rectangle
+        `reRan x imRan` up to a number of `precision` significant digits in
+        real and imaginary part. Algorithms based on the argument principle
+        refine the rectangles closest to `target` first and stop as soon as
+        no remaining rectangle can contain a closer root.
+
+        :param target: point around which roots are searched
+        :param numRoots: number of roots (with multiplicities) to search
+        :param reRan: horizontal extend of the complex region to search in
+        :param imRan: vertical extend of the complex region to search in
+        :param precision: accuracy of the search in real and imaginary parts
+        :return: the (at most `numRoots`) roots closest to `target` ordered by
+            their distance
+        """
+        precision = precision or self.precision
+        precision = (precision[0] + 1, precision[1] + 1)
+        (x1, x2), (y1, y2) = self.desymmetrizeDomain(reRan, imRan, precision)
+        context = RootContext(
+            f=self.f,
+            df=self.df,
+            container=self.container,
+            precision=precision,
+            reRan=(x1, x2),
+            imRan=(y1, y2),
+            chunkSize=self.chunkSize,
+            knownRoots=self.knownRoots,
+            derivativeBound=self.derivativeBound,
+        )
+        with openEvaluators(self.f, self.df):
+            self.algorithm.calcNearestRoots(context, target, numRoots)
+        self.addKnownRoots((x1, x2), (y1, y2), precision)
+        # roots of previous searches outside of the rectangle do not belong
+        # to this query (roots inside of it are deflated and not found again)
+        roots = self.roots
+        epsReal = 10.0 ** (1 - precision[0])
+        epsImag = 10.0 ** (1 - precision[1])
+        roots = roots[
+            (reRan[0] - epsReal <= roots.real)
+            & (roots.real <= reRan[1] + epsReal)
+            & (imRan[0] - epsImag <= roots.imag)
+            & (roots.imag <= imRan[1] + epsImag)
+        ]
+        return roots[np.argsort(abs(roots - target), kind="stable")][:numRoots]
+
+    def calculateOrders(self) -> NDArray[np.int32]:
+        """
+        Calculate the orders of all roots which were found without orders
+        (e.g. by the Newton grid algorithm or on sampling lines) by the
+        argument principle on small circular contours around them. The target
+        function is evaluated on the contours of all such roots at once.
+
+        :return: the orders of all roots, parallel to the `roots` property
+        """
+        roots, orders = self.roots, self.orders
+        missing = orders <= 0
+        if not missing.any():
+            return orders
+        self.logger.info(
+            "calculating orders of %d roots found without orders...",
+            int(np.count_nonzero(missing)),
+        )
+        with openEvaluators(self.f):
+            orders[missing] = calcRootOrders(
+                lambda z: evalChunked(self.f, z, self.chunkSize),
+                roots[missing],
+                self.precision,
+                roots[~missing],
+            )
+        for root, order in zip(roots[missing], orders[missing]):
+            if order > 0:
+                self.container.updateRootOrder((complex(root), int(order)))
+        return self.orders
+
+    def countRoots(
+        self, reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> int:
+        """
+        Count the roots (with multiplicities) in the rectangle `reRan x imRan`
+        by evaluating the argument principle once along its boundary, i.e.
+        without refining the positions of the roots.
+
+        :param reRan: horizontal extend of the complex region to count in
+        :param imRan: vertical extend of the complex region to count in
+        :raises RootCountException: if the root count is not integral
+        :return: the number of roots inside the rectangle
+        """
+        return int(self.countRootsBatched([(reRan, imRan)])[0])
+
+    def countRootsBatched(
+        self, rectangles: Sequence[tRectangle]
+    ) -> NDArray[np.int64]:
+        """
+        Count the roots (with multiplicities) in many rectangles at once.
+        Changes in argument along edges shared by several rectangles (or
+        calculated during previous searches) are taken from the cache of the
+        argument estimator.
+
+        :param rectangles: the complex regions to count in
+        :raises RootCountException: if a root count is not integral
+        :return: the number of roots inside each rectangle
+        """
+        # desymmetrize with the internal precision used by `calculateRoots`
+        precision = (self.precision[0] + 1, self.precision[1] + 1)
+        counts = np.zeros(len(rectangles), dtype=np.int64)
+        with openEvaluators(self.f, self.df):
+            for i, (reRan, imRan) in enumerate(rectangles):
+                context = RootContext(
+                    f=self.f,
+                    df=self.df,
+                    container=self.container,
+                    precision=precision,
+                    reRan=reRan,
+                    imRan=imRan,
+                    chunkSize=self.chunkSize,
+                    knownRoots=self.knownRoots,
+                    derivativeBound=self.derivativeBound,
+                )
+                counts[i] = self.estimateRootCount(context)
+        return counts
+
+    def countRootsGrid(
+        self,
+        reRan: Tuple[float, float],
+        imRan: Tuple[float, float],
+        numCells: Tuple[int, int],
+    ) -> NDArray[np.int64]:
+        """
+        Count the roots (with multiplicities) in each cell of a regular grid
+        covering the rectangle `reRan x imRan`. Every grid line is sampled
+        once along its full length, such that edges shared by neighboring
+        cells are not evaluated repeatedly.
+
+        :param reRan: horizontal extend of the complex region to count in
+        :param imRan: vertical extend of the complex region to count in
+        :param numCells: number of cells in real and imaginary direction
+        :return: the number of roots inside each cell, where the cell at index
+            `(i, j)` is the `i`-th cell in real and `j`-th cell in imaginary
+            direction
+        """
+        precision = (self.precision[0] + 1, self.precision[1] + 1)
+        (x1, x2), (y1, y2) = self.desymmetrizeDomain(reRan, imRan, precision)
+        reGrid = np.linspace(x1, x2, numCells[0] + 1)
+        imGrid = np.linspace(y1, y2, numCells[1] + 1)
+        context = RootContext(
+            f=self.f,
+            df=self.df,
+            container=self.container,
+            precision=precision,
+            reRan=(x1, x2),
+            imRan=(y1, y2),
+            chunkSize=self.chunkSize,
+            knownRoots=self.knownRoots,
+            derivativeBound=self.derivativeBound,
+        )
+        with openEvaluators(self.f, self.df):
+            counts = self.estimator.calcArgumentGrid(
+                reGrid, imGrid, context
+            ) / (2 * np.pi)
+        if (abs(counts - np.round(counts)) >= ROOT_COUNT_TOL).any():
+            self.logger.warning(
+                "root counts on grid are not integral - roots might lie on "
+                + "grid lines!"
+            )
+        if len(self.knownRoots) > 0:
+            # known roots are deflated from the target function
+            roots = np.array([root for root, _ in self.knownRoots])
+            counts += np.histogram2d(
+                roots.real,
+                roots.imag,
+                bins=[reGrid, imGrid],
+                weights=[order for _, order in self.knownRoots],
+            )[0]
+        return np.round(counts).astype(np.int64)
+
+    def estimateRootCount(self, context: RootContext) -> int:
+        """
+        Estimate the number of roots inside the search domain of `context`.
+        Results which are far from integers indicate roots (too) close to the
+        boundary, in which case the domain is perturbed slightly and the count
+        is repeated.
+
+        :param context: `RootContext` describing the rectangle to count in
+        :raises RootCountException: if the count is not integral after
+            `ROOT_COUNT_RETRIES` perturbations of the rectangle
+        :return: the number of roots inside the rectangle
+        """
+        estimator = self.estimator
+        reRan, imRan = context.reRan, context.imRan
+        for _ in range(ROOT_COUNT_RETRIES):
+            reRan, imRan = self.desymmetrizeDomain(
+                reRan, imRan, context.precision
+            )
+            count = estimator.calcMoment(0, reRan, imRan, context).real / (
+                2 * np.pi
+            )
+            if abs(count - round(count)) < ROOT_COUNT_TOL:
+                break
+            self.logger.warning(
+                "root count %f is not integral - perturbing rectangle!",
+                count,
+            )
+        else:
+            raise RootCountException(context.reRan, context.imRan, count)
+        # known roots are deflated from the target function
+        return round(count) + sum(
+            order for _, order in self.knownRootsInside(reRan, imRan)
+        )
+
+    @property
+    def knownRoots(self) -> Tuple[tRoot, ...]:
+        """
+        Return the roots (with their orders) which are known already and
+        deflated from the target function during root searches.
+
+        :return: the known roots of this rootfinder
+        """
+        return self._knownRoots
+
+    @knownRoots.setter
+    def knownRoots(self, roots: Sequence[tRoot]) -> None:
+        """
+        Set the roots (with their orders) which are known already, e.g. from
+        a previous search via `zip(finder.roots, finder.orders)`. Samples of
+        the (previously deflated) target function are discarded.
+
+        :param roots: the known roots of this rootfinder
+        """
+        self._knownRoots = tuple(
+            (complex(root), int(order)) for root, order in roots
+        )
+        self.estimator.reset()
+
+    @property
+    def estimator(self) -> ArgumentEstimator:
+        """
+        Return the argument estimator used for counting roots. This is the
+        estimator of the root finding algorithm if it uses one (such that
+        their caches are shared) and a separate estimator otherwise.
+
+        :return: the argument estimator of this rootfinder
+        """
+        if isinstance(self.algorithm, SimpleArgumentAlgorithm):
+            return self.algorithm.estimator
+        if self._estimator is None:
+            self._estimator = ServiceLocator.tryResolve(
+                ArgumentEstimator,
+                estimatorType=self.estimatorType,
+                numPts=DEFAULT_NUM_PTS,
+                deltaPhi=DEFAULT_DELTA_PHI,
+                maxPrecision=DEFAULT_MAX_PRECISION,
+                cache=EstimatorCache.withMemoryCap(self.maxCacheBytes),
+            )
+        return self._estimator
+
+    @property
+    def cacheBytesUsed(self) -> int:
+        """
+        Return the (estimated) number of bytes currently held by the cache of
+        argument changes and function samples of the argument estimator used
+        for counting roots (which is shared with the root finding algorithm
+        if possible).
+
+        :return: the number of bytes held by the estimator cache
+        """
+        return self.estimator.cache.totalBytesUsed
+
     @property
     def roots(self) -> tVec:
         """
@@ -0,0 +1,112 @@
+"""
+This module contains tests of the CIRCLE_ARGUMENT implementation of the
+`FinderAlgorithm` interface.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.circle_holo import CircleArgumentAlgorithm
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.finder_test_cases import (
+    buildContextFromData,
+    testFunctions,
+)
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.containers.rounding_container import RoundingContainer
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+settingsService = RAMSettingsService(verbose=False)
+ServiceLocator.registerAsSingleton(SettingsService, settingsService)
+
+# some test functions do not work due to underflow of f near roots of very
+# high order
+KNOWN_FAILURES = ["x^100", "1e6 * x^100"]
+
+
+@pytest.mark.parametrize("testName", sorted(testFunctions.keys()))
+def testCircleArgument(testName: str) -> None:
+    """
+    Test the CIRCLE_ARGUMENT algorithm with the test case given by
+    `testName`.
+
+    :param testName: Name of the test case
+    """
+    if testName in KNOWN_FAILURES:
+        pytest.skip()
+
+    circleAlgo = CircleArgumentAlgorithm()
+    precision = testFunctions[testName].precision
+
+    context = buildContextFromData(testFunctions[testName])
+    circleAlgo.calcRoots(context)
+    foundRoots = context.container.getRoots()  # pylint: disable=E1111
+    expectedRoots = np.array(testFunctions[testName].expectedRoots)
+
+    assert rootsMatchClosely(foundRoots, expectedRoots, precision=precision)
+
+
+def testDerivativeFreeMultipleRoots() -> None:
+    """
+    Test that roots and their multiplicities are calculated from Fourier
+    coefficients of `log f` if no derivative is available.
+    """
+    context = RootContext(
+        f=lambda z: (z - 0.5) ** 3 * (z + 1j) * (z - 1 - 1j) * np.exp(z),
+        df=None,
+        container=RoundingContainer(precision=(5, 5)),
+        precision=(5, 5),
+        reRan=(-2.01, 2.02),
+        imRan=(-2.03, 2.04),
+    )
+    CircleArgumentAlgorithm().calcRoots(context)
+
+    roots = context.container.getRoots()
+    order = np.argsort(roots.imag)
+    assert np.allclose(roots[order], [-1j, 0.5, 1 + 1j], atol=1e-5)
+    assert np.all(context.container.getRootOrders()[order] == [1, 3, 1])
+
+
+def testRootOnSharedEdge() -> None:
+    """
+    Test that a root on the edge shared by two cells (and hence inside of
+    both of their circles) is reported exactly once.
+    """
+    context = RootContext(
+        f=lambda z: z * (z - 0.3 - 0.2j),
+        df=None,
+        container=ContainerFactory.getConcreteContainer(
+            containerType=ContainerTypes.PLAIN_CONTAINER
+        ),
+        precision=(5, 5),
+        reRan=(-1, 1),
+        imRan=(-0.5, 0.5),
+    )
+    # the search rectangle is covered by the cells [-1, 0] and [0, 1]
+    assert (
+        len(CircleArgumentAlgorithm.coverRectangle((-1, 1), (-0.5, 0.5))) == 2
+    )
+    CircleArgumentAlgorithm().calcRoots(context)
+
+    roots = context.container.getRoots()
+    order = np.argsort(roots.real)
+    assert np.allclose(roots[order], [0, 0.3 + 0.2j], atol=1e-5)
+    assert np.all(context.container.getRootOrders() == 1)
+
+
+def testCoverRectangle() -> None:
+    """
+    Test that elongated rectangles are covered by almost square cells.
+    """
+    cells = CircleArgumentAlgorithm.coverRectangle((-10, 10), (-1, 2))
+    assert len(cells) == 7
+    for (x1, x2), (y1, y2) in cells:
+        assert np.isclose(y2 - y1, 3) and np.isclose(x2 - x1, 20 / 7)
@@ -0,0 +1,83 @@
+"""
+This module contains tests of the MESH_ARGUMENT implementation of the
+`FinderAlgorithm` interface.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import cast
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
+from pyzeal.algorithms.mesh_holo import MeshArgumentAlgorithm
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.finder_test_cases import (
+    buildContextFromData,
+    testFunctions,
+)
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.factories.estimator_factory import EstimatorFactory
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+settingsService = RAMSettingsService(verbose=False)
+ServiceLocator.registerAsSingleton(SettingsService, settingsService)
+ServiceLocator.registerAsTransient(
+    ArgumentEstimator, EstimatorFactory.getConcreteEstimator
+)
+
+# some test functions do not work due to z-refinement limitations
+KNOWN_FAILURES = ["x^100", "1e6 * x^100"]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("testName", sorted(testFunctions.keys()))
+@pytest.mark.parametrize(
+    "estimator",
+    [EstimatorTypes.SUMMATION_ESTIMATOR, EstimatorTypes.QUADRATURE_ESTIMATOR],
+)
+def testMeshArgument(testName: str, estimator: EstimatorTypes) -> None:
+    """
+    Test the MESH_ARGUMENT algorithm with the test case given by `testName`.
+
+    :param testName: Name of the test case
+    :param estimator: The type of estimator to use
+    """
+    if testName in KNOWN_FAILURES:
+        pytest.skip()
+
+    meshAlgo = MeshArgumentAlgorithm(estimatorType=estimator)
+
+    context = buildContextFromData(testFunctions[testName])
+    meshAlgo.calcRoots(context)
+    foundRoots = context.container.getRoots()  # pylint: disable=E1111
+    expectedRoots = np.array(testFunctions[testName].expectedRoots)
+
+    assert rootsMatchClosely(
+        foundRoots, expectedRoots, precision=testFunctions[testName].precision
+    )
+
+
+def testCellPhases() -> None:
+    """
+    Test that winding numbers of all mesh cells are calculated at once and
+    that cells with fast phase changes are marked as unreliable.
+    """
+    reGrid, imGrid = MeshArgumentAlgorithm.buildMesh((-2, 2), (-1, 1), 4)
+    assert reGrid.size == 5 and imGrid.size == 3
+    zArr = cast(tVec, reGrid[np.newaxis, :] + 1j * imGrid[:, np.newaxis])
+
+    phases, reliable = MeshArgumentAlgorithm.calcCellPhases(zArr - 0.5 - 0.5j)
+    windings = np.zeros((2, 4))
+    windings[1, 2] = 1
+    assert np.allclose(phases / (2 * np.pi), windings)
+    assert np.all(reliable)
+
+    phases, reliable = MeshArgumentAlgorithm.calcCellPhases(zArr**8)
+    assert not np.any(reliable[:, 1:3])
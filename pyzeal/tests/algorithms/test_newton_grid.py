@@ -10,7 +10,11 @@ import numpy as np
 import pytest
 
 from pyzeal.algorithms.newton_grid import NewtonGridAlgorithm
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
 from pyzeal.pyzeal_types.filter_types import FilterTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import RootFinder
 from pyzeal.settings.ram_settings_service import RAMSettingsService
 from pyzeal.settings.settings_service import SettingsService
 from pyzeal.tests.resources.finder_test_cases import testFunctions
@@ -18,6 +22,7 @@ from pyzeal.tests.resources.utils import rootsMatchClosely
 from pyzeal.utils.containers.rounding_container import RoundingContainer
 from pyzeal.utils.factories.container_factory import ContainerFactory
 from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_orders import calcRootOrders
 from pyzeal.utils.service_locator import ServiceLocator
 
 settingsService = RAMSettingsService(verbose=False)
@@ -63,3 +68,73 @@ def testNewtonGridRootFinder(testName: str) -> None:
         assert rootsMatchClosely(
             foundRoots, expectedRoots, precision=precision
         )
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def testNewtonGridOrders() -> None:
+    """
+    Test that orders of roots found by the Newton grid algorithm are
+    calculated in a post-processing step.
+    """
+    finder = RootFinder(
+        lambda z: (z - 0.5j) ** 2 * (z + 1) * (z - 1.2) ** 3,
+        lambda z: (z - 0.5j)
+        * (z - 1.2) ** 2
+        * (
+            2 * (z + 1) * (z - 1.2)
+            + (z - 0.5j) * (z - 1.2)
+            + 3 * (z - 0.5j) * (z + 1)
+        ),
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.NEWTON_GRID,
+        numSamplePoints=20,
+        precision=(3, 3),
+    )
+    finder.calculateRoots((-2, 2), (-2, 2))
+    assert (finder.orders == 0).all()
+    orders = finder.calculateOrders()
+    assert (orders == finder.orders).all()
+    assert sorted(zip(finder.roots.real.round(3), orders)) == [
+        (-1.0, 1),
+        (0.0, 2),
+        (1.2, 3),
+    ]
+
+
+def testRootOrdersChunked() -> None:
+    """
+    Test that the target function is evaluated in chunks while calculating
+    orders of roots.
+    """
+    callSizes = []
+
+    def func(z: tVec) -> tVec:
+        callSizes.append(z.size)
+        return (z - 0.5j) ** 2 * (z + 1)
+
+    finder = RootFinder(
+        func,
+        lambda z: (z - 0.5j) * (3 * z + 2 - 0.5j),
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.NEWTON_GRID,
+        numSamplePoints=20,
+        precision=(3, 3),
+        chunkSize=8,
+    )
+    finder.calculateRoots((-2, 2), (-2, 2))
+    callSizes.clear()
+    assert sorted(finder.calculateOrders().tolist()) == [1, 2]
+    assert 0 < max(callSizes) <= 8
+
+
+def testCloseRootOrders() -> None:
+    """
+    Test that contours around close roots do not enclose each other.
+    """
+
+    def func(z: tVec) -> tVec:
+        return (z - 1e-3) * (z + 1e-3) ** 2 * (z - 1j)
+
+    roots = np.array([1e-3, -1e-3], dtype=np.complex128)
+    orders = calcRootOrders(func, roots, (5, 5), np.array([1j]))
+    assert orders.tolist() == [1, 2]
@@ -0,0 +1,163 @@
+"""
+This module contains tests of the RATIONAL_SURROGATE implementation of the
+`FinderAlgorithm` interface.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
+from pyzeal.algorithms.rational_holo import RationalSurrogateAlgorithm
+from pyzeal.algorithms.wrappers.barycentric_rational import (
+    BarycentricRational,
+)
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.finder_test_cases import (
+    buildContextFromData,
+    testFunctions,
+)
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.containers.rounding_container import RoundingContainer
+from pyzeal.utils.factories.estimator_factory import EstimatorFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+settingsService = RAMSettingsService(verbose=False)
+ServiceLocator.registerAsSingleton(SettingsService, settingsService)
+ServiceLocator.registerAsTransient(
+    ArgumentEstimator, EstimatorFactory.getConcreteEstimator
+)
+
+# roots of very high order are neither resolved by surrogates nor by the
+# argument principle search used as a fallback
+KNOWN_FAILURES = ["x^100", "1e6 * x^100"]
+
+
+@pytest.mark.parametrize("testName", sorted(testFunctions.keys()))
+def testRationalSurrogate(testName: str) -> None:
+    """
+    Test the RATIONAL_SURROGATE algorithm with the test case given by
+    `testName`.
+
+    :param testName: Name of the test case
+    """
+    if testName in KNOWN_FAILURES:
+        pytest.skip()
+
+    surrogateAlgo = RationalSurrogateAlgorithm()
+    precision = testFunctions[testName].precision
+
+    context = buildContextFromData(testFunctions[testName])
+    surrogateAlgo.calcRoots(context)
+    foundRoots = context.container.getRoots()  # pylint: disable=E1111
+    expectedRoots = np.array(testFunctions[testName].expectedRoots)
+
+    assert rootsMatchClosely(foundRoots, expectedRoots, precision=precision)
+
+
+def testDerivativeFreeMultipleRoots() -> None:
+    """
+    Test that roots and their multiplicities are confirmed with the target
+    function if no derivative is available.
+    """
+    context = RootContext(
+        f=lambda z: (z - 0.5) ** 3 * (z + 1j) * (z - 1 - 1j) * np.exp(z),
+        df=None,
+        container=RoundingContainer(precision=(5, 5)),
+        precision=(5, 5),
+        reRan=(-2.01, 2.02),
+        imRan=(-2.03, 2.04),
+    )
+    RationalSurrogateAlgorithm().calcRoots(context)
+
+    roots = context.container.getRoots()
+    order = np.argsort(roots.imag)
+    assert np.allclose(roots[order], [-1j, 0.5, 1 + 1j], atol=1e-5)
+    assert np.all(context.container.getRootOrders()[order] == [1, 3, 1])
+
+
+def testSurrogateCountMismatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that roots missed by surrogates are detected by the argument
+    principle and found by the fallback search.
+
+    :param monkeypatch: Fixture used to drop zeros of surrogates
+    """
+    zeros = BarycentricRational.zeros
+
+    def someZeros(self: BarycentricRational) -> tVec:
+        return zeros(self)[:1]
+
+    monkeypatch.setattr(BarycentricRational, "zeros", someZeros)
+    context = RootContext(
+        f=lambda z: (z - 0.5) * (z + 1j) * (z - 1 - 1j),
+        df=None,
+        container=RoundingContainer(precision=(4, 4)),
+        precision=(4, 4),
+        reRan=(-2.01, 2.02),
+        imRan=(-2.03, 2.04),
+    )
+    RationalSurrogateAlgorithm().calcRoots(context)
+
+    assert rootsMatchClosely(
+        context.container.getRoots(),
+        np.array([-1j, 0.5, 1 + 1j]),
+        precision=(4, 4),
+    )
+
+
+def testNoAccurateSurrogate() -> None:
+    """
+    Test that roots in rectangles without accurate surrogates are found by
+    the fallback search.
+    """
+    context = RootContext(
+        f=lambda z: (z - 0.5) * (z + 1j) * (z - 1 - 1j),
+        df=None,
+        container=RoundingContainer(precision=(4, 4)),
+        precision=(4, 4),
+        reRan=(-2.01, 2.02),
+        imRan=(-2.03, 2.04),
+    )
+    RationalSurrogateAlgorithm(maxDegree=0).calcRoots(context)
+
+    assert rootsMatchClosely(
+        context.container.getRoots(),
+        np.array([-1j, 0.5, 1 + 1j]),
+        precision=(4, 4),
+    )
+
+
+def testBarycentricRational() -> None:
+    """
+    Test that the AAA algorithm reproduces a rational function exactly and
+    recovers its zeros and poles.
+    """
+    zArr = np.exp(2j * np.pi * np.arange(100) / 100)
+    rational = BarycentricRational.fromSamples(
+        zArr, (zArr - 0.3) * (zArr + 0.2j) / (zArr - 2), 1e-13, 10
+    )
+
+    assert rational.support.size == 3
+    assert np.allclose(
+        rational(np.array([0.1j])), (0.1j - 0.3) * 0.3j / (0.1j - 2)
+    )
+    assert np.allclose(np.sort_complex(rational.zeros()), [-0.2j, 0.3])
+    assert np.allclose(rational.poles(), [2])
+
+
+def testMergeClusters() -> None:
+    """
+    Test that nearby zeros of a surrogate are merged into their mean.
+    """
+    zeros = np.array([1 + 1e-4, 1 - 1e-4, 2, 1 + 1e-4j])
+    candidates, sizes = RationalSurrogateAlgorithm.mergeClusters(zeros, 1e-3)
+
+    assert np.allclose(candidates, [1 + 1e-4j / 3, 2])
+    assert np.all(sizes == [3, 1])
@@ -55,6 +55,20 @@ def testRemovePlainContainer(
     assert not roundingContainer.removeRoot((0, 1))
 
 
+def testUpdateOrderRoundingContainer(
+    roundingContainer: RootContainer, filterContexts: List[FilterContext]
+) -> None:
+    """
+    Test the rounding container `updateRootOrder` implementation.
+    """
+    roundingContainer.addRoot((1.23456789, 0), filterContexts[0])
+    root = complex(roundingContainer.getRoots()[0])
+    assert roundingContainer.updateRootOrder((root, 2))
+    assert not roundingContainer.updateRootOrder((-root, 2))
+    assert (roundingContainer.getRoots() == [1.235]).all()
+    assert (roundingContainer.getRootOrders() == [2]).all()
+
+
 def testClearPlainContainer(
     roundingContainer: RootContainer, filterContexts: List[FilterContext]
 ) -> None:
@@ -0,0 +1,78 @@
+"""
+This module tests the behavior of the estimator of moments along circles.
+"""
+
+from typing import cast
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.estimators.circle_estimator import CircleEstimator
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.root_context import RootContext
+
+# roots (inside and outside of the unit circle around 0.1+0.2i) and orders
+ROOTS = np.array([0.3 + 0.1j, -0.4j, 0.1 + 0.5j, 2 + 1j])
+ORDERS = np.array([2, 1, 1, 3])
+
+
+def circleFunc(z: tVec) -> tVec:
+    "Test function with roots `ROOTS` of orders `ORDERS`."
+    return cast(
+        tVec,
+        np.prod(
+            [(z - root) ** order for root, order in zip(ROOTS, ORDERS)],
+            axis=0,
+        ),
+    )
+
+
+def circleDerivative(z: tVec) -> tVec:
+    "Derivative of `circleFunc`."
+    return cast(
+        tVec,
+        circleFunc(z)
+        * np.sum(
+            [order / (z - root) for root, order in zip(ROOTS, ORDERS)], axis=0
+        ),
+    )
+
+
+@pytest.mark.parametrize("derivative", [True, False])
+def testCircleMoments(derivative: bool) -> None:
+    """
+    Test that moments along a circle equal the power sums of the roots
+    inside of the circle (in circle-local coordinates).
+
+    :param derivative: Flag indicating if the derivative is available
+    """
+    context = RootContext(
+        f=circleFunc,
+        df=circleDerivative if derivative else None,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(5, 5),
+    )
+    center, radius = 0.1 + 0.2j, 0.8
+    moments = CircleEstimator().calcMoments(center, radius, 6, context)
+    assert moments is not None
+    inside = abs(ROOTS - center) < radius
+    expected = [
+        np.sum(ORDERS[inside] * ((ROOTS[inside] - center) / radius) ** p)
+        for p in range(6)
+    ]
+    assert np.allclose(moments, expected, atol=1e-8)
+
+
+def testRootOnCircle() -> None:
+    """
+    Test that no moments are returned if the target function vanishes on the
+    circle.
+    """
+    context = RootContext(
+        f=lambda z: z - 1,
+        df=lambda z: np.ones_like(z),
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(5, 5),
+    )
+    assert CircleEstimator().calcMoments(0, 1, 2, context) is None
@@ -0,0 +1,190 @@
+"""
+This module tests the behavior of the store for samples along lines.
+"""
+
+import pickle
+from dataclasses import replace
+from typing import List
+
+import numpy as np
+
+from pyzeal.algorithms.estimators import EstimatorCache
+from pyzeal.algorithms.estimators.argument_estimator import ArgumentEstimator
+from pyzeal.algorithms.estimators.constants import EDGE_LEAF_SIZE
+from pyzeal.algorithms.estimators.edge_store import EdgeSampleStore, tSamples
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.factories.estimator_factory import EstimatorFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.service_locator import ServiceLocator
+from pyzeal.utils.shared_samples import SharedLineSamples
+
+ServiceLocator.registerAsTransient(SettingsService, RAMSettingsService)
+
+
+def makeSamples(tArr: np.ndarray) -> tSamples:
+    """
+    Create samples of the identity along the real axis.
+
+    :param tArr: Positions of the samples
+    :return: Samples at the given positions
+    """
+    zArr = tArr.astype(np.complex128)
+    return tArr, zArr, zArr.copy(), np.full(tArr.size, np.nan, complex)
+
+
+def testEdgeSampleStoreLookup() -> None:
+    """
+    Test that samples inserted in several batches (forcing leaves to split)
+    are returned sorted and restricted to the queried range.
+    """
+    store = EdgeSampleStore()
+    tArr = np.linspace(0, 1, 4 * EDGE_LEAF_SIZE)
+    store.insert("line", makeSamples(tArr[::2]))
+    store.insert("line", makeSamples(tArr[1::2]))
+    store.insert("line", makeSamples(np.array([-1.0, 2.5])))
+    tOld, zOld, fOld, _ = store.lookup("line", -2, 3)
+    assert tOld.size == tArr.size + 2
+    assert np.all(np.diff(tOld) > 0)
+    assert np.all(zOld == fOld)
+    tOld, *_ = store.lookup("line", 0.25, 0.5)
+    assert np.all((0.25 <= tOld) & (tOld <= 0.5))
+    assert tOld.size == np.count_nonzero((0.25 <= tArr) & (tArr <= 0.5))
+    assert store.lookup("other", 0, 1)[0].size == 0
+
+
+def testEdgeSampleStoreRelease() -> None:
+    """
+    Test that released ranges keep their end points and that empty lines are
+    dropped from the store.
+    """
+    store = EdgeSampleStore()
+    store.insert("line", makeSamples(np.linspace(0, 1, 11)))
+    store.cover("line", 0, 1, 0.1)
+    store.cover("line", 0, 0.5, 0.1)
+    assert store.covering("line", 0.1, 0.2) == (0, 0.5, 0.1)
+    assert store.covering("line", 0.1, 0.7) == (0, 1, 0.1)
+    assert store.covering("line", -0.1, 0.7) is None
+    assert store.coveringLines(0.1, 0.7) == ["line"]
+
+    store.release("line", 0, 0.5)
+    tOld, *_ = store.lookup("line", 0, 1)
+    assert tOld[0] == 0
+    assert np.allclose(tOld[1:], np.linspace(0.5, 1, 6))
+    assert store.covering("line", 0.1, 0.2) == (0, 1, 0.1)
+    store.release("line", -1, 2)
+    assert len(store) == 0
+    assert store.bytesUsed == 0
+
+
+def testEdgeSampleStoreEviction() -> None:
+    """
+    Test that least recently used lines are evicted once the store exceeds
+    its memory cap.
+    """
+    samples = makeSamples(np.linspace(0, 1, 100))
+    lineBytes = sum(arr.nbytes for arr in samples)
+    store = EdgeSampleStore(maxBytes=2 * lineBytes)
+    store.insert("a", samples)
+    store.insert("b", samples)
+    store.lookup("a", 0, 1)
+    store.insert("c", samples)
+    assert len(store) == 2
+    assert store.lookup("b", 0, 1)[0].size == 0
+    assert store.lookup("a", 0, 1)[0].size == 100
+    assert store.bytesUsed <= store.maxBytes
+
+
+def testSampleLineReuse() -> None:
+    """
+    Test that estimators only evaluate the target function at points which
+    have not been sampled before.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return z**2 + 1
+
+    context = RootContext(
+        f=f,
+        df=lambda z: 2 * z,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    est = EstimatorFactory.getConcreteEstimator(
+        EstimatorTypes.QUADRATURE_ESTIMATOR,
+        numPts=6500,
+        deltaPhi=0.01,
+        maxPrecision=1e-10,
+        cache=EstimatorCache(),
+    )
+    est.sampleLine("horizontal", 0.5, np.linspace(0, 1, 5), context)
+    assert sum(numCalls) == 5
+    zArr, funcArr, derivArr = est.sampleLine(
+        "horizontal", 0.5, np.linspace(0, 1, 9), context, derivative=True
+    )
+    assert sum(numCalls) == 9
+    assert np.allclose(zArr, np.linspace(0, 1, 9) + 0.5j)
+    assert np.allclose(funcArr, zArr**2 + 1)
+    assert np.allclose(derivArr, 2 * zArr)
+
+
+def testSeedSharedSamples() -> None:
+    """
+    Test that samples exported by one estimator and transferred via shared
+    memory are reused (without copies) by another estimator.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return (z - 0.3j) * (z + 0.4)
+
+    def makeEstimator() -> ArgumentEstimator:
+        est = EstimatorFactory.getConcreteEstimator(
+            EstimatorTypes.SUMMATION_ESTIMATOR,
+            numPts=6500,
+            deltaPhi=0.01,
+            maxPrecision=1e-10,
+            cache=EstimatorCache(),
+        )
+        est.cache.setLattice((-1, 1), (-1, 1), (3, 3))
+        return est
+
+    context = RootContext(
+        f=f,
+        df=None,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    est = makeEstimator()
+    moment = est.calcMoment(0, (-1, 1), (-1, 1), context)
+    shared = SharedLineSamples(est.exportSamples())
+    try:
+        attached = pickle.loads(pickle.dumps(shared))
+        lines = attached.lines
+        assert len(lines) == 4
+        assert not any(array.flags.writeable for array in lines[0][2])
+
+        numCalls.clear()
+        seeded = makeEstimator()
+        seeded.seedSamples(replace(context, sharedLines=tuple(lines)))
+        assert np.isclose(
+            seeded.calcMoment(0, (-1, 1), (-1, 1), context), moment
+        )
+        assert np.isclose(moment, 2 * 2 * np.pi)
+        assert sum(numCalls) == 0
+        # seeded samples are views of the shared memory
+        samples = seeded.cache.samples.lookup(
+            seeded.cache.toLineKey("horizontal", -1), -1, 1
+        )
+        assert not samples[2].flags.owndata
+        del samples, lines
+        seeded.reset()
+        attached.close()
+    finally:
+        shared.unlink()
@@ -0,0 +1,85 @@
+"""
+This module tests the behavior of the lattice-keyed estimator cache.
+"""
+
+from pyzeal.algorithms.estimators import EstimatorCache
+from pyzeal.algorithms.estimators.constants import (
+    MAX_CACHE_BYTES,
+    MAX_ESTIMATOR_CACHE_BYTES,
+)
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsTransient(SettingsService, RAMSettingsService)
+
+
+def testEstimatorCacheOrientation() -> None:
+    """
+    Test that lines are stored once and can be retrieved in both orientations
+    as well as from end points which differ in the last few bits.
+    """
+    cache = EstimatorCache()
+    cache.setLattice((-1, 1), (-1, 1), (5, 5))
+    zStart, zEnd = 0.1 + 0.2j, 0.3 + 0.2j
+    cache.store(0, zStart, zEnd, 2 + 1j)
+    assert len(cache._cache) == 1
+    assert cache.retrieve(0, zStart, zEnd) == 2 + 1j
+    assert cache.retrieve(0, zEnd, zStart) == -2 - 1j
+    # end points which differ by an ulp are mapped to the same lattice point
+    assert cache.retrieve(0, zStart, zEnd + 1e-16) == 2 + 1j
+    assert cache.retrieve(1, zStart, zEnd) is None
+
+    cache.remove(0, zEnd, zStart)
+    assert cache.retrieve(0, zStart, zEnd) is None
+    assert not cache.dirty()
+
+
+def testEstimatorCacheCounters() -> None:
+    """
+    Test that hits and misses are counted (also for vanishing arguments).
+    """
+    cache = EstimatorCache()
+    cache.store(0, 0, 1, 0)
+    assert cache.retrieve(0, 0, 1) == 0
+    assert cache.retrieve(0, 1, 2) is None
+    assert (cache.cacheHits, cache.cacheMisses) == (1, 1)
+    cache.reset()
+    assert (cache.cacheHits, cache.cacheMisses) == (0, 0)
+    assert cache.bytesUsed == 0
+
+
+def testEstimatorCacheEviction() -> None:
+    """
+    Test that least recently used entries are evicted once the configured
+    cap is exceeded.
+    """
+    cache = EstimatorCache()
+    entryBytes = max(
+        EstimatorCache.entrySize(cache.toKey(0, k, k + 1)[0]) for k in range(3)
+    )
+    cache.maxBytes = 2 * entryBytes
+    cache.store(0, 0, 1, 1)
+    cache.store(0, 1, 2, 2)
+    assert cache.retrieve(0, 0, 1) == 1
+    cache.store(0, 2, 3, 3)
+    assert cache.bytesUsed <= 2 * entryBytes
+    assert cache.retrieve(0, 1, 2) is None
+    assert cache.retrieve(0, 0, 1) == 1
+    assert cache.retrieve(0, 2, 3) == 3
+
+
+def testEstimatorCacheMemoryCap() -> None:
+    """
+    Test that a total memory cap is split between argument changes and
+    samples in the ratio of the default caps.
+    """
+    assert EstimatorCache.withMemoryCap(MAX_CACHE_BYTES).maxBytes == (
+        MAX_ESTIMATOR_CACHE_BYTES
+    )
+    cache = EstimatorCache.withMemoryCap(5 * 2**20)
+    assert cache.maxBytes == 2**20
+    assert cache.samples.maxBytes == 4 * 2**20
+    assert cache.totalBytesUsed == 0
+    cache.store(0, 0, 1, 1)
+    assert cache.totalBytesUsed == cache.bytesUsed > 0
@@ -1,11 +1,14 @@
 """
 This module tests the behavior of the quadratue-based estimator.
 """
+from typing import List
+
 import numpy as np
 import pytest
 
 from pyzeal.algorithms.estimators import EstimatorCache
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
 from pyzeal.tests.resources.estimator_resources import (
     lineCases,
     rectangleCases,
@@ -75,3 +78,63 @@ def testExceptionDerivativefree() -> None:
     )
     with pytest.raises(ValueError):
         est.calcMomentAlongLine(0, 0, 1, context)
+
+
+def testQuadratureEstimatorAdaptive() -> None:
+    """
+    Test that the quadrature-based estimator only refines the vicinity of a
+    root close to the line of integration.
+    """
+    numCalls: List[int] = []
+    root = 0.5 + 1e-6j
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return z - root
+
+    context = RootContext(
+        f=f,
+        df=np.ones_like,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    est = EstimatorFactory.getConcreteEstimator(
+        EstimatorTypes.QUADRATURE_ESTIMATOR,
+        numPts=6500,
+        deltaPhi=0.01,
+        maxPrecision=1e-10,
+        cache=EstimatorCache(),
+    )
+    result = est.calcMomentAlongLine(0, 0, 1, context)
+    assert np.abs(result + 1j * np.log((1 - root) / -root)) < 1e-8
+    assert sum(numCalls) < 10**5
+
+
+def testQuadratureEstimatorPrefetch() -> None:
+    """
+    Test that the quadrature-based estimator samples all edges of a rectangle
+    (and of both of its halves) in a single call of the target function.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return z - 5
+
+    context = RootContext(
+        f=f,
+        df=np.ones_like,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    est = EstimatorFactory.getConcreteEstimator(
+        EstimatorTypes.QUADRATURE_ESTIMATOR, cache=EstimatorCache()
+    )
+    assert abs(est.calcMoment(0, (-1, 1), (-1, 1), context)) < 1e-8
+    assert numCalls == [4 * 15]
+    # the outer vertical edges of the halves are cached already
+    halves = [((-1.0, 0.0), (-1.0, 1.0)), ((0.0, 1.0), (-1.0, 1.0))]
+    est.prefetchBoundaries(halves, [0], context)
+    for reRan, imRan in halves:
+        assert abs(est.calcMoment(0, reRan, imRan, context)) < 1e-8
+    assert numCalls == [4 * 15, 5 * 15]
@@ -2,16 +2,22 @@
 This module tests the behavior of the summation-based estimator.
 """
 
+from typing import List, cast
+
 import numpy as np
 import pytest
 
 from pyzeal.algorithms.estimators import EstimatorCache
+from pyzeal.algorithms.estimators.sum_estimator import SummationEstimator
 from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
 from pyzeal.tests.resources.estimator_resources import (
     lineCases,
     rectangleCases,
 )
+from pyzeal.utils.containers.rounding_container import RoundingContainer
 from pyzeal.utils.factories.estimator_factory import EstimatorFactory
+from pyzeal.utils.root_context import RootContext
 
 
 @pytest.mark.parametrize("testName", sorted(rectangleCases.keys()))
@@ -53,3 +59,126 @@ def testSummationEstimatorLine(testName: str) -> None:
     result = est.calcMomentAlongLine(order, zStart, zEnd, context)
     assert np.abs(result.imag) < 1e-6
     assert np.abs(result.real - expected.real) < 1e-6
+
+
+def testSummationEstimatorBatchedRefinement() -> None:
+    """
+    Test that the summation-based estimator refines all intervals with large
+    phase changes in few batched evaluations of the target function.
+    """
+    numCalls = [0]
+    roots = np.array([0.3 + 1e-5j, -0.2 - 1e-6j, 0.7 + 3e-4j])
+
+    def f(z: tVec) -> tVec:
+        numCalls[0] += 1
+        return cast(tVec, np.prod(z[..., None] - roots, axis=-1))
+
+    context = RootContext(
+        f=f,
+        df=None,
+        container=RoundingContainer((5, 5)),
+        precision=(5, 5),
+    )
+    est = SummationEstimator(
+        numPts=6500, deltaPhi=0.01, maxPrecision=1e-10, cache=EstimatorCache()
+    )
+    zArr, phiArr = est.genPhiArr(0, -1 + 0j, 1 + 0j, context)
+    assert np.all(abs(phiArr) < 0.01)
+    assert np.all(np.diff(zArr.real) > 0)
+    assert abs(phiArr.sum() / np.pi - 1) < 1e-3
+    assert numCalls[0] <= 3
+
+
+def testSummationEstimatorAdaptiveSampling() -> None:
+    """
+    Test that new lines between sampled parallel lines with little phase
+    variation start with few support points.
+    """
+    numPoints = [0]
+
+    def f(z: tVec) -> tVec:
+        numPoints[0] += z.size
+        return z - 5
+
+    context = RootContext(
+        f=f,
+        df=None,
+        container=RoundingContainer((5, 5)),
+        precision=(5, 5),
+    )
+    est = SummationEstimator(
+        numPts=6500, deltaPhi=0.01, maxPrecision=1e-10, cache=EstimatorCache()
+    )
+    phi = est.calcMoment(0, (-1, 1), (-1, 1), context)
+    assert abs(phi) < 1e-10
+    # top and left edges already benefit from their parallel edges
+    assert 2 * 6500 <= numPoints[0] < 3 * 6500
+    numPoints[0] = 0
+    # only the new vertical line through the origin is sampled
+    phi = est.calcMoment(0, (-1, 0), (-1, 1), context)
+    assert abs(phi) < 1e-10
+    assert 0 < numPoints[0] < 100
+
+
+def testSummationEstimatorChunkedEvaluation() -> None:
+    """
+    Test that the target function is evaluated in blocks of bounded size.
+    """
+    callSizes: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        callSizes.append(z.size)
+        return z - 0.5j
+
+    context = RootContext(
+        f=f,
+        df=None,
+        container=RoundingContainer((5, 5)),
+        precision=(5, 5),
+        chunkSize=256,
+    )
+    est = SummationEstimator(
+        numPts=6500, deltaPhi=0.01, maxPrecision=1e-10, cache=EstimatorCache()
+    )
+    phi = est.calcMoment(0, (-1, 1), (-1, 1), context)
+    assert abs(phi - 2 * np.pi) < 1e-10
+    assert max(callSizes) == 256
+    assert sum(callSizes) > 6500
+
+
+def testSummationEstimatorArgumentGrid() -> None:
+    """
+    Test that changes in argument on a grid of cells coincide with the
+    changes along the boundaries of single cells, while every grid line is
+    sampled only once.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(z.size)
+        return (z - 0.3 - 0.2j) * (z + 1.1 - 0.7j) ** 2
+
+    context = RootContext(
+        f=f, df=None, container=RoundingContainer((5, 5)), precision=(5, 5)
+    )
+    reGrid = np.linspace(-2, 2, 5)
+    imGrid = np.linspace(-1.5, 1.5, 4)
+    est = SummationEstimator(
+        numPts=6500, deltaPhi=0.01, maxPrecision=1e-10, cache=EstimatorCache()
+    )
+    phi = est.calcArgumentGrid(reGrid, imGrid, context)
+    gridCalls = sum(numCalls)
+    expected = np.zeros((4, 3))
+    expected[2, 1] = 2 * np.pi
+    expected[0, 2] = 4 * np.pi
+    assert np.allclose(phi, expected, atol=1e-8)
+    # lines of the grid are sampled once (along with the vertices)
+    assert gridCalls <= 6500 * (reGrid.size + imGrid.size) * 1.2
+
+    # edges of single cells are retrieved from the cache
+    numCalls.clear()
+    moment = est.calcMoment(
+        0, (reGrid[2], reGrid[3]), (imGrid[1], imGrid[2]), context
+    )
+    assert abs(moment - 2 * np.pi) < 1e-8
+    assert sum(numCalls) == 0
@@ -9,7 +9,7 @@ Authors:\n
 
 from typing import Tuple
 
-from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.pyzeal_types.root_types import tHoloFunc, tVec
 
 
 def rootsMatchClosely(
@@ -46,3 +46,22 @@ def rootsMatchClosely(
             return False
 
     return True
+
+
+def polynomialFactory(roots: Tuple[complex, ...]) -> tHoloFunc:
+    """
+    Build a polynomial with given roots as a closure (which can not be
+    pickled, but the factory can be imported by spawned processes).
+
+    :param roots: roots of the polynomial
+    :return: the polynomial
+    """
+    return lambda z: _product(z, roots)
+
+
+def _product(z: tVec, roots: Tuple[complex, ...]) -> tVec:
+    "Evaluate the product of `z - root` over all `roots`."
+    result = 1 + 0 * z
+    for root in roots:
+        result = result * (z - root)
+    return result
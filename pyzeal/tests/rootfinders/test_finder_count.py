@@ -0,0 +1,166 @@
+"""
+This module contains tests of counting roots without refinement.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.constants import ROOT_COUNT_RETRIES
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import RootCountException, RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [AlgorithmTypes.SIMPLE_ARGUMENT, AlgorithmTypes.NEWTON_GRID],
+)
+@pytest.mark.parametrize(
+    "estimator",
+    [EstimatorTypes.SUMMATION_ESTIMATOR, EstimatorTypes.QUADRATURE_ESTIMATOR],
+)
+def testCountRoots(
+    algorithm: AlgorithmTypes, estimator: EstimatorTypes
+) -> None:
+    """
+    Test that roots are counted with multiplicities, also for rectangles
+    with roots (almost) on their edges.
+
+    :param algorithm: The type of algorithm of the root finder
+    :param estimator: The type of estimator to use
+    """
+    finder = RootFinder(
+        lambda z: (z - 1) ** 2 * np.sin(z),
+        lambda z: 2 * (z - 1) * np.sin(z) + (z - 1) ** 2 * np.cos(z),
+        algorithmType=algorithm,
+        estimatorType=estimator,
+        precision=(3, 3),
+    )
+    assert finder.countRoots((-4, 4), (-1, 1)) == 5
+    assert finder.countRoots((0.5, 4), (-1, 1)) == 3
+    # the root at zero lies on the left edge
+    assert finder.countRoots((0, 2), (-1, 1)) in (2, 3)
+    assert finder.countRoots((4, 5), (-1, 1)) == 0
+
+
+def testCountRootsBatchedSharesEdges() -> None:
+    """
+    Test that batched counting of adjacent rectangles reuses the changes in
+    argument along shared edges (and the samples of previous searches).
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return np.sin(z)
+
+    finder = RootFinder(
+        f,
+        np.cos,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    rectangles = [((x, x + 1.0), (-1.0, 1.0)) for x in np.arange(-4.5, 4.5)]
+    counts = finder.countRootsBatched(rectangles)
+    assert np.all(counts == [0, 1, 0, 0, 1, 0, 0, 1, 0])
+    assert finder.countRoots((-4.5, -3.5), (-1.0, 1.0)) == 0
+    numEvaluations = sum(numCalls)
+    # repeated counts are answered from the estimator cache
+    assert np.all(finder.countRootsBatched(rectangles) == counts)
+    assert sum(numCalls) == numEvaluations
+
+
+def testCountRootsNotIntegral(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that root counts which stay non-integral after all perturbations of
+    the counting rectangle raise an exception instead of being rounded.
+
+    :param monkeypatch: fixture replacing the moment calculation
+    """
+    finder = RootFinder(
+        np.sin,
+        np.cos,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    numCalls: List[int] = []
+
+    def calcMoment(*_: object) -> complex:
+        numCalls.append(1)
+        return 2.5 * 2 * np.pi
+
+    monkeypatch.setattr(finder.estimator, "calcMoment", calcMoment)
+    with pytest.raises(RootCountException) as excInfo:
+        finder.countRoots((-4, 4), (-1, 1))
+    assert excInfo.value.count == pytest.approx(2.5)
+    assert len(numCalls) == ROOT_COUNT_RETRIES
+    with pytest.raises(RootCountException):
+        finder.countRootsBatched([((-4, 4), (-1, 1))])
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [EstimatorTypes.SUMMATION_ESTIMATOR, EstimatorTypes.QUADRATURE_ESTIMATOR],
+)
+def testCountRootsGrid(estimator: EstimatorTypes) -> None:
+    """
+    Test that root counts on a grid of cells match the roots of the target
+    function.
+
+    :param estimator: The type of estimator to use
+    """
+    finder = RootFinder(
+        lambda z: (z - 1) ** 2 * np.sin(z),
+        lambda z: 2 * (z - 1) * np.sin(z) + (z - 1) ** 2 * np.cos(z),
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=estimator,
+        precision=(3, 3),
+    )
+    counts = finder.countRootsGrid((-4.5, 3.5), (-1.5, 1.5), (4, 3))
+    expected = np.zeros((4, 3), dtype=np.int64)
+    # roots -pi, 0 (simple), 1 (double) and pi lie in the middle row
+    expected[:, 1] = [1, 0, 3, 1]
+    assert np.all(counts == expected)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [AlgorithmTypes.SIMPLE_ARGUMENT, AlgorithmTypes.NEWTON_GRID],
+)
+def testCacheMemoryCap(algorithm: AlgorithmTypes) -> None:
+    """
+    Test that the memory cap of root finders reaches the estimator cache and
+    that the memory held by the cache is reported.
+
+    :param algorithm: The type of algorithm of the root finder
+    """
+    finder = RootFinder(
+        np.sin,
+        np.cos,
+        algorithmType=algorithm,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+        maxCacheBytes=5 * 2**17,
+    )
+    assert finder.cacheBytesUsed == 0
+    assert finder.countRoots((-20, 20), (-1, 1)) == 13
+    cache = finder.estimator.cache
+    assert (cache.maxBytes, cache.samples.maxBytes) == (2**17, 4 * 2**17)
+    # without the cap the samples of all four edges are kept (about 1MB)
+    assert 0 < finder.cacheBytesUsed <= 5 * 2**17
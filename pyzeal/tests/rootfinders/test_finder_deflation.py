@@ -0,0 +1,118 @@
+"""
+This module contains tests of root searches deflating known roots from the
+target function.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import cast
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import ParallelRootFinder, RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def deflatedFunc(z: tVec) -> tVec:
+    "Target function with roots at `0.5j` and `k * pi` (module level)."
+    return cast(tVec, np.sin(z) * (z - 0.5j))
+
+
+def deflatedDerivative(z: tVec) -> tVec:
+    "Derivative of `deflatedFunc` (module level)."
+    return np.cos(z) * (z - 0.5j) + np.sin(z)
+
+
+def testDeflatedContext() -> None:
+    """
+    Test that contexts with known roots evaluate the deflated function and
+    its derivative.
+    """
+    context = RootContext(
+        f=lambda z: (z - 1) ** 2 * (z + 2j),
+        df=lambda z: 2 * (z - 1) * (z + 2j) + (z - 1) ** 2,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+        knownRoots=((1, 2),),
+    )
+    zArr = np.array([0.5 + 0.5j, -2, 3j, 1])
+    funcArr = context.evalFunc(zArr)
+    assert np.allclose(funcArr[:-1], zArr[:-1] + 2j)
+    assert funcArr[-1] == 0
+    assert np.allclose(context.evalDerivative(zArr[:-1]), 1)
+    assert np.allclose(context.evalDerivative(zArr[:-1], funcArr[:-1]), 1)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [AlgorithmTypes.SIMPLE_ARGUMENT, AlgorithmTypes.HANKEL_PENCIL],
+)
+@pytest.mark.parametrize(
+    "estimator",
+    [EstimatorTypes.SUMMATION_ESTIMATOR, EstimatorTypes.QUADRATURE_ESTIMATOR],
+)
+def testIncrementalSearch(
+    algorithm: AlgorithmTypes, estimator: EstimatorTypes
+) -> None:
+    """
+    Test that roots found by a previous search are deflated (and reported)
+    during a search on a larger domain.
+
+    :param algorithm: The type of algorithm of the root finder
+    :param estimator: The type of estimator to use
+    """
+    finder = RootFinder(
+        deflatedFunc,
+        deflatedDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=algorithm,
+        estimatorType=estimator,
+        precision=(4, 4),
+    )
+    finder.calculateRoots((-2, 2), (-1, 1))
+    assert rootsMatchClosely(
+        finder.roots, np.array([0, 0.5j]), precision=(4, 4)
+    )
+    finder.knownRoots = list(zip(finder.roots, finder.orders))
+    finder.container.clear()
+    assert finder.countRoots((-4, 4), (-1, 1)) == 4
+    finder.calculateRoots((-4, 4), (-1, 1))
+    assert rootsMatchClosely(
+        finder.roots, np.array([-np.pi, 0, np.pi, 0.5j]), precision=(4, 4)
+    )
+    assert finder.roots.size == 4
+
+
+def testParallelDeflation() -> None:
+    """
+    Test that parallel root finders deflate (and report) known roots.
+    """
+    finder = ParallelRootFinder(
+        deflatedFunc,
+        deflatedDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        precision=(4, 4),
+        knownRoots=[(0, 1), (0.5j, 1), (10, 1)],
+    )
+    finder.calculateRoots((-4, 4), (-1, 1))
+    assert rootsMatchClosely(
+        finder.roots, np.array([-np.pi, 0, np.pi, 0.5j]), precision=(4, 4)
+    )
+    assert finder.roots.size == 4
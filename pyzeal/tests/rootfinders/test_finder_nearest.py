@@ -0,0 +1,104 @@
+"""
+This module contains tests of the best-first search for roots closest to a
+target point.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.service_locator import ServiceLocator
+
+# disable progress bar by default for tests
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [AlgorithmTypes.SIMPLE_ARGUMENT, AlgorithmTypes.NEWTON_GRID],
+)
+def testNearestRoots(algorithm: AlgorithmTypes) -> None:
+    """
+    Test that the roots closest to a target point are found (and ordered by
+    their distance to the target).
+
+    :param algorithm: The type of algorithm of the root finder
+    """
+    finder = RootFinder(
+        np.sin,
+        np.cos,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=algorithm,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    roots = finder.calculateNearestRoots(7.5 + 0.5j, 2, (-20, 20), (-1, 1))
+    assert rootsMatchClosely(
+        roots, np.array([2 * np.pi, 3 * np.pi]), precision=(3, 3)
+    )
+    assert abs(roots[0] - 2 * np.pi) < 1e-3
+
+
+def testNearestRootsIgnorePreviousSearches() -> None:
+    """
+    Test that roots found by previous searches outside of the queried
+    rectangle are not returned as nearest roots.
+    """
+    finder = RootFinder(
+        np.sin,
+        np.cos,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    finder.calculateRoots((-20, 20), (-1, 1))
+    roots = finder.calculateNearestRoots(12, 2, (0.5, 10), (-1, 1))
+    assert rootsMatchClosely(
+        roots, np.array([3 * np.pi, 2 * np.pi]), precision=(3, 3)
+    )
+    assert abs(roots[0] - 3 * np.pi) < 1e-3
+
+
+def testNearestRootsRefineOnlyClosestRectangles() -> None:
+    """
+    Test that best-first search refines fewer rectangles than a search for
+    all roots.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return np.sin(z)
+
+    finder = RootFinder(
+        f,
+        np.cos,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    roots = finder.calculateNearestRoots(0.1, 1, (-20, 20), (-1, 1))
+    assert roots.size == 1 and abs(roots[0]) < 1e-3
+    assert finder.roots.size < 13
+    numNearest = sum(numCalls)
+
+    numCalls.clear()
+    finder.calculateRoots((-20, 20), (-1, 1))
+    assert finder.roots.size == 13
+    assert numNearest < sum(numCalls)
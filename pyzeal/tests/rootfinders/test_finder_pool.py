@@ -0,0 +1,287 @@
+"""
+This module contains tests of the long-lived worker pool used by parallel
+root finders.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing import get_context
+from os import getpid
+from typing import List, Optional, Tuple, Union, cast
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.root_types import tRoot, tVec
+from pyzeal.rootfinders import ParallelRootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.async_function import AsyncFunction
+from pyzeal.utils.concurrent_function import ConcurrentFunction
+from pyzeal.utils.service_locator import ServiceLocator
+from pyzeal.utils.shared_samples import SharedLineSamples
+
+# disable progress bar by default for tests
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def poolFunc(z: tVec) -> tVec:
+    "Test function with roots at `+-1` and `0.5j` (picklable)."
+    return (z**2 - 1) * (z - 0.5j)
+
+
+def poolDerivative(z: tVec) -> tVec:
+    "Derivative of `poolFunc` (picklable)."
+    return 2 * z * (z - 0.5j) + z**2 - 1
+
+
+def scalarPoolFunc(z: complex) -> complex:
+    "Scalar version of `poolFunc` (picklable)."
+    return (z**2 - 1) * (z - 0.5j)
+
+
+async def asyncPoolFunc(z: tVec) -> tVec:
+    "Awaitable version of `poolFunc`."
+    await asyncio.sleep(0)
+    return poolFunc(z)
+
+
+# clustered roots (and a single distant root) for partitioning tests
+CLUSTERED_ROOTS = np.array(
+    [0.6 + 0.6j, 0.7 + 1.3j, 0.9 + 0.8j, 1.1 + 1.2j, 1.2 + 0.7j, 1.4 + 1.4j]
+    + [0.8 + 0.9j, 1.3 + 1.1j, -1.5 - 1.5j]
+)
+
+
+def clusteredFunc(z: tVec) -> tVec:
+    "Test function with roots `CLUSTERED_ROOTS` (picklable)."
+    return cast(tVec, np.prod([z - root for root in CLUSTERED_ROOTS], axis=0))
+
+
+def clusteredDerivative(z: tVec) -> tVec:
+    "Derivative of `clusteredFunc` (picklable)."
+    return cast(
+        tVec,
+        clusteredFunc(z)
+        * np.sum([1 / (z - root) for root in CLUSTERED_ROOTS], axis=0),
+    )
+
+
+def workerPid(_: int) -> int:
+    "Return the process id of a worker (picklable)."
+    return getpid()
+
+
+def testPoolIsReused() -> None:
+    """
+    Test that subsequent searches run on the same pool of worker processes
+    and that the pool is shut down at the end of a `with` block.
+    """
+    with ParallelRootFinder(
+        poolFunc,
+        poolDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        precision=(4, 4),
+    ) as finder:
+        finder.calculateRoots((-2, 2), (-2, 2))
+        pool = finder.pool
+        pids = set(pool.map(workerPid, range(4 * finder.numWorkers)))
+        finder.container.clear()
+        finder.calculateRoots((-2, 2), (-2, 2))
+        assert finder.pool is pool
+        assert pids >= set(pool.map(workerPid, range(finder.numWorkers)))
+        assert rootsMatchClosely(
+            finder.roots, np.array([-1, 1, 0.5j]), precision=(4, 4)
+        )
+    assert finder._pool is None
+
+
+def testPoolRestartsForNewTarget() -> None:
+    """
+    Test that the pool is restarted if the target function changes and that
+    tasks only consist of rectangles and search parameters.
+    """
+    finder = ParallelRootFinder(
+        poolFunc,
+        poolDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        precision=(4, 4),
+        knownRoots=[(0.5j, 1)],
+    )
+    sharedLines: Optional[SharedLineSamples] = None
+    try:
+        tasks = finder.createRootTasks(2, (-2.1, 1.9), (-1.3, 2.2), (5, 5))
+        assert len(tasks) == 2
+        reRan, imRan, precision, knownRoots, bound, sharedLines = tasks[0]
+        assert np.allclose([*reRan, *imRan], [-2.1, -0.1, -1.3, 0.45])
+        assert precision == (5, 5) and knownRoots == ((0.5j, 1),)
+        assert bound is None
+        # samples along the seam between both tasks are shared
+        assert sharedLines is not None and sharedLines is tasks[1][5]
+        assert any(
+            pos == "vertical" and np.isclose(coord, -0.1)
+            for pos, coord, *_ in sharedLines.lines
+        )
+        pool = finder.pool
+        finder.df = None
+        assert finder.pool is not pool
+        finder.df = poolDerivative
+        roots: List[List[tRoot]] = finder.pool.map(
+            ParallelRootFinder.rootWorker, tasks
+        )
+        found: List[Tuple[complex, int]] = sum(roots, [])
+        assert rootsMatchClosely(
+            np.array([root for root, _ in found]),
+            np.array([-1, 1]),
+            precision=(4, 4),
+        )
+    finally:
+        finder.close()
+        if sharedLines is not None:
+            sharedLines.unlink()
+
+
+def testBalancedPartition() -> None:
+    """
+    Test that tasks of parallel root finders only cover rectangles containing
+    roots and hold similar numbers of roots.
+    """
+    with ParallelRootFinder(
+        clusteredFunc,
+        clusteredDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        precision=(4, 4),
+    ) as finder:
+        tasks = finder.createRootTasks(4, (-2.03, 1.97), (-2.07, 1.93), (5, 5))
+        cast(SharedLineSamples, tasks[0][5]).unlink()
+        counts = finder.countRootsBatched(
+            [(reRan, imRan) for reRan, imRan, *_ in tasks]
+        )
+        assert sum(counts) == CLUSTERED_ROOTS.size
+        assert (counts > 0).all()
+        assert max(counts) <= 3
+        assert (
+            sum(
+                (reRan[1] - reRan[0]) * (imRan[1] - imRan[0])
+                for reRan, imRan, *_ in tasks
+            )
+            < 8
+        )
+        finder.calculateRoots((-2, 2), (-2, 2))
+        assert rootsMatchClosely(
+            finder.roots, CLUSTERED_ROOTS, precision=(4, 4)
+        )
+
+
+@pytest.mark.parametrize("executorType", ["thread", "fork"])
+def testCustomExecutor(executorType: str) -> None:
+    """
+    Test that parallel root finders run their tasks on executors supplied by
+    the caller without shutting them down.
+
+    :param executorType: Kind of executor to use
+    """
+    executor: Executor = (
+        ThreadPoolExecutor(max_workers=2)
+        if executorType == "thread"
+        else ProcessPoolExecutor(max_workers=2, mp_context=get_context("fork"))
+    )
+    with executor:
+        finder = ParallelRootFinder(
+            clusteredFunc,
+            clusteredDerivative,
+            containerType=ContainerTypes.ROUNDING_CONTAINER,
+            algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+            precision=(4, 4),
+            executor=executor,
+            numWorkers=3,
+            tasksPerChunk=2,
+        )
+        for _ in range(2):
+            finder.container.clear()
+            finder.calculateRoots((-2, 2), (-2, 2))
+            assert rootsMatchClosely(
+                finder.roots, CLUSTERED_ROOTS, precision=(4, 4)
+            )
+        assert finder._pool is None
+        # the executor remains usable
+        assert executor.submit(workerPid, 0).result() > 0
+
+
+def testSharedSamplesFreedOnError(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that samples shared with the workers are freed if a worker raises.
+
+    :param monkeypatch: Fixture used to let tasks fail and to record freed
+        samples
+    """
+    freed: List[SharedLineSamples] = []
+    unlink = SharedLineSamples.unlink
+
+    def recordUnlink(self: SharedLineSamples) -> None:
+        freed.append(self)
+        unlink(self)
+
+    def failingTasks(*_: object) -> List[List[tRoot]]:
+        raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(SharedLineSamples, "unlink", recordUnlink)
+    with ParallelRootFinder(
+        clusteredFunc,
+        clusteredDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        precision=(4, 4),
+    ) as finder:
+        monkeypatch.setattr(finder, "mapTasks", failingTasks)
+        with pytest.raises(RuntimeError, match="worker failed"):
+            finder.calculateRoots((-2, 2), (-2, 2))
+    assert len(freed) == 1
+
+
+@pytest.mark.parametrize("wrapper", ["concurrent", "async"])
+def testExecutorSharesEvaluators(wrapper: str) -> None:
+    """
+    Test that the threads of an executor share the evaluators of wrapped
+    target functions over consecutive root searches, without one thread
+    shutting down the evaluators used by other threads.
+
+    :param wrapper: Kind of wrapped target function
+    """
+    func: Union[ConcurrentFunction, AsyncFunction] = (
+        ConcurrentFunction(scalarPoolFunc, numWorkers=2)
+        if wrapper == "concurrent"
+        else AsyncFunction(asyncPoolFunc)
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        finder = ParallelRootFinder(
+            func,
+            poolDerivative,
+            containerType=ContainerTypes.ROUNDING_CONTAINER,
+            algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+            precision=(4, 4),
+            executor=executor,
+            numWorkers=4,
+        )
+        for _ in range(3):
+            finder.container.clear()
+            finder.calculateRoots((-2, 2), (-2, 2))
+            assert rootsMatchClosely(
+                finder.roots, np.array([-1, 1, 0.5j]), precision=(4, 4)
+            )
+            assert func._refs == 0
@@ -0,0 +1,145 @@
+"""
+This module contains tests of root searches restricted to fundamental
+domains of symmetric target functions.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import List, Sequence, cast
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.pyzeal_types.symmetry_types import SymmetryTypes
+from pyzeal.rootfinders import ParallelRootFinder, RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.service_locator import ServiceLocator
+from pyzeal.utils.symmetry_reduction import SymmetryReduction
+
+# disable progress bar by default for tests
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+# roots symmetric to the real axis and the origin (also on symmetry lines)
+SYMMETRIC_ROOTS = np.array(
+    [1.5, -1.5, 1 + 1j, 1 - 1j, -1 + 1j, -1 - 1j, 0.5j, -0.5j]
+)
+
+
+def symmetricFunc(z: tVec) -> tVec:
+    "Test function with roots `SYMMETRIC_ROOTS` (picklable)."
+    return cast(tVec, np.prod([z - root for root in SYMMETRIC_ROOTS], axis=0))
+
+
+def symmetricDerivative(z: tVec) -> tVec:
+    "Derivative of `symmetricFunc` (picklable)."
+    return cast(
+        tVec,
+        symmetricFunc(z)
+        * np.sum([1 / (z - root) for root in SYMMETRIC_ROOTS], axis=0),
+    )
+
+
+def testSymmetryReductionDomains() -> None:
+    """
+    Test that rectangles are reduced only by compatible symmetries and that
+    fundamental domains extend slightly across symmetry lines.
+    """
+    reduction = SymmetryReduction(
+        [SymmetryTypes.CONJUGATE, SymmetryTypes.PERIODIC],
+        (3, 3),
+        period=2 * np.pi,
+    )
+    (x1, x2), (y1, y2) = reduction.reduce((-10, 10), (-1, 2))
+    assert x1 == -10 and abs(x2 - (2 * np.pi - 10)) < 1e-1
+    assert -1e-1 < y1 < 0 and y2 == 2
+    assert len(reduction.reductions) == 2
+    # reflections at the origin require symmetric rectangles
+    reduction = SymmetryReduction([SymmetryTypes.EVEN], (3, 3))
+    assert reduction.reduce((-1, 2), (-1, 2)) == ((-1, 2), (-1, 2))
+    (x1, x2), (y1, y2) = reduction.reduce((-1, 2), (-1, 1))
+    assert -1e-1 < x1 < 0 and (x2, y1, y2) == (2, -1, 1)
+    with pytest.raises(ValueError):
+        SymmetryReduction([SymmetryTypes.PERIODIC], (3, 3))
+
+
+@pytest.mark.parametrize(
+    "symmetries",
+    [
+        [SymmetryTypes.CONJUGATE],
+        [SymmetryTypes.EVEN],
+        [SymmetryTypes.CONJUGATE, SymmetryTypes.EVEN],
+    ],
+)
+@pytest.mark.parametrize("parallel", [False, True])
+def testSymmetricRootFinder(
+    symmetries: Sequence[SymmetryTypes], parallel: bool
+) -> None:
+    """
+    Test that roots on and off symmetry lines are reconstructed exactly once
+    from the roots on fundamental domains.
+
+    :param symmetries: the declared symmetries of the target function
+    :param parallel: If roots should be searched in parallel
+    """
+    finderType = ParallelRootFinder if parallel else RootFinder
+    finder = finderType(
+        symmetricFunc,
+        symmetricDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(4, 4),
+        symmetries=symmetries,
+    )
+    finder.calculateRoots((-2, 2), (-2, 2))
+    assert finder.roots.size == SYMMETRIC_ROOTS.size
+    assert rootsMatchClosely(finder.roots, SYMMETRIC_ROOTS, precision=(4, 4))
+
+
+def testPeriodicRootFinder() -> None:
+    """
+    Test that the roots of a periodic function are searched on a single
+    period only.
+    """
+    numCalls: List[int] = []
+
+    def f(z: tVec) -> tVec:
+        numCalls.append(np.size(z))
+        return cast(tVec, np.sin(z) - 0.5)
+
+    finder = RootFinder(
+        f,
+        np.cos,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(4, 4),
+        symmetries=[SymmetryTypes.CONJUGATE, SymmetryTypes.PERIODIC],
+        period=2 * np.pi,
+    )
+    finder.calculateRoots((-10, 90), (-1, 1))
+    shifts = 2 * np.pi * np.arange(-2, 15)
+    expected = np.concatenate((np.pi / 6 + shifts, 5 * np.pi / 6 + shifts))
+    expected = expected[(-10 <= expected) & (expected <= 90)]
+    assert finder.roots.size == expected.size
+    assert rootsMatchClosely(finder.roots, expected, precision=(4, 4))
+    numSymmetric = sum(numCalls)
+
+    numCalls.clear()
+    RootFinder(
+        f,
+        np.cos,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(4, 4),
+    ).calculateRoots((-10, 90), (-1, 1))
+    assert 2 * numSymmetric < sum(numCalls)
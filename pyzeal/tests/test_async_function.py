@@ -0,0 +1,151 @@
+"""
+This module tests the concurrent evaluation of awaitable target functions.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+
+from pyzeal.algorithms.estimators import EstimatorCache
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.async_function import AsyncFunction
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.factories.estimator_factory import EstimatorFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+async def asyncFunc(z: tVec) -> tVec:
+    "Awaitable test function simulating the latency of a remote service."
+    await asyncio.sleep(0.001)
+    return np.sin(z) * (z - 0.5j)
+
+
+async def asyncDerivative(z: tVec) -> tVec:
+    "Awaitable derivative of `asyncFunc`."
+    await asyncio.sleep(0.001)
+    return np.cos(z) * (z - 0.5j) + np.sin(z)
+
+
+def testAsyncFunctionOrder() -> None:
+    """
+    Test that blocks awaited concurrently are reassembled in the order (and
+    shape) of the input points and that the in-flight limit is respected.
+    """
+    inFlight: List[int] = [0]
+    maxInFlight: List[int] = [0]
+
+    async def func(z: tVec) -> tVec:
+        inFlight[0] += 1
+        maxInFlight[0] = max(maxInFlight[0], inFlight[0])
+        await asyncio.sleep(0.001)
+        inFlight[0] -= 1
+        return np.sin(z) * (z - 0.5j)
+
+    zArr = (np.linspace(-2, 2, 1001).reshape(7, 143) + 0.3j).astype(
+        np.complex128
+    )
+    expected = np.sin(zArr) * (zArr - 0.5j)
+    wrapped = AsyncFunction(func, maxInFlight=3, blockSize=50)
+    with wrapped:
+        assert np.allclose(wrapped(zArr), expected)
+    assert maxInFlight[0] == 3
+    # without a running event loop a temporary one is used
+    assert np.allclose(AsyncFunction(func)(zArr[0]), expected[0])
+
+
+def testAsyncFunctionLifecycle() -> None:
+    """
+    Test that the event loop is stopped by the last `close()` only, such that
+    threads opening and closing a shared function do not stop the loop used
+    by other threads.
+    """
+    zArr = (np.linspace(-2, 2, 101) + 0.3j).astype(np.complex128)
+    expected = np.sin(zArr) * (zArr - 0.5j)
+    func = AsyncFunction(asyncFunc, maxInFlight=2)
+    func.open()
+    func.open()
+    func.close()
+    assert func._refs == 1
+
+    def evaluate(_: int) -> bool:
+        with func:
+            return bool(np.allclose(func(zArr), expected))
+
+    with ThreadPoolExecutor(4) as pool:
+        assert all(pool.map(evaluate, range(32)))
+    assert func._refs == 1
+    func.close()
+    assert func._refs == 0 and func._loop is None
+    # unbalanced calls of `close()` are ignored
+    func.close()
+    assert np.allclose(func(zArr), expected)
+
+
+def testAsyncFunctionRootFinder() -> None:
+    """
+    Test that root finders wrap coroutine functions automatically and stop
+    their event loops after the search.
+    """
+    finder = RootFinder(
+        asyncFunc,
+        asyncDerivative,
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    assert isinstance(finder.f, AsyncFunction)
+    finder.calculateRoots((-4, 4), (-1, 1))
+    assert rootsMatchClosely(
+        finder.roots,
+        np.array([-np.pi, 0, np.pi, 0.5j]),
+        precision=(3, 3),
+    )
+    assert finder.f._loop is None
+
+
+def testAsyncEdgesConcurrent() -> None:
+    """
+    Test that the edges of a rectangle are awaited concurrently by the
+    quadrature estimator.
+    """
+    inFlight: List[int] = [0]
+    maxInFlight: List[int] = [0]
+
+    async def func(z: tVec) -> tVec:
+        inFlight[0] += 1
+        maxInFlight[0] = max(maxInFlight[0], inFlight[0])
+        await asyncio.sleep(0.001)
+        inFlight[0] -= 1
+        return z - 5
+
+    # blocks hold the Kronrod nodes of a single edge
+    context = RootContext(
+        f=AsyncFunction(func, maxInFlight=8, blockSize=15),
+        df=np.ones_like,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    estimator = EstimatorFactory.getConcreteEstimator(
+        EstimatorTypes.QUADRATURE_ESTIMATOR, cache=EstimatorCache()
+    )
+    moment = estimator.calcMoment(0, (-1, 1), (-1, 1), context)
+    assert abs(moment) < 1e-8
+    assert maxInFlight[0] == 4
@@ -0,0 +1,127 @@
+"""
+This module tests the concurrent evaluation of scalar target functions.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import cmath
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.rootfinders import ParallelRootFinder, RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.concurrent_function import ConcurrentFunction
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def scalarFunc(z: complex) -> complex:
+    "Scalar test function (defined on module level to allow pickling)."
+    return cmath.sin(z) * (z - 0.5j)
+
+
+def scalarDerivative(z: complex) -> complex:
+    "Derivative of `scalarFunc` (defined on module level to allow pickling)."
+    return cmath.cos(z) * (z - 0.5j) + cmath.sin(z)
+
+
+def testConcurrentFunctionOrder() -> None:
+    """
+    Test that concurrently evaluated function values are reassembled in the
+    order (and shape) of the input points.
+    """
+    zArr = (np.linspace(-2, 2, 1001).reshape(7, 143) + 0.3j).astype(
+        np.complex128
+    )
+    expected = np.sin(zArr) * (zArr - 0.5j)
+    for mode in ("thread", "process"):
+        func = ConcurrentFunction(scalarFunc, numWorkers=3, mode=mode)
+        with func:
+            assert np.allclose(func(zArr), expected)
+        # without an open pool a temporary one is used
+        assert np.allclose(func(zArr[0]), expected[0])
+
+
+def testConcurrentFunctionLifecycle() -> None:
+    """
+    Test that the pool of workers is shut down by the last `close()` only,
+    such that threads opening and closing a shared function do not tear down
+    the pool used by other threads.
+    """
+    zArr = (np.linspace(-2, 2, 101) + 0.3j).astype(np.complex128)
+    expected = np.sin(zArr) * (zArr - 0.5j)
+    func = ConcurrentFunction(scalarFunc, numWorkers=2)
+    func.open()
+    func.open()
+    func.close()
+    assert func._refs == 1
+
+    def evaluate(_: int) -> bool:
+        with func:
+            return bool(np.allclose(func(zArr), expected))
+
+    with ThreadPoolExecutor(4) as pool:
+        assert all(pool.map(evaluate, range(32)))
+    assert func._refs == 1
+    func.close()
+    assert func._refs == 0 and func._executor is None
+    # unbalanced calls of `close()` are ignored
+    func.close()
+    assert np.allclose(func(zArr), expected)
+
+
+def testConcurrentFunctionRootFinder() -> None:
+    """
+    Test that root finders accept concurrent functions without changes to
+    the estimators and shut down their pools after the search.
+    """
+    func = ConcurrentFunction(scalarFunc, numWorkers=4)
+    finder = RootFinder(
+        func,
+        ConcurrentFunction(
+            lambda z: cmath.cos(z) * (z - 0.5j) + cmath.sin(z), numWorkers=4
+        ),
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+    )
+    finder.calculateRoots((-4, 4), (-1, 1))
+    assert rootsMatchClosely(
+        finder.roots,
+        np.array([-np.pi, 0, np.pi, 0.5j]),
+        precision=(3, 3),
+    )
+    assert func._executor is None
+
+
+def testProcessFunctionParallelFinder() -> None:
+    """
+    Test that parallel root finders accept functions evaluated on pools of
+    processes, which fall back to threads inside of the (daemonic) workers.
+    """
+    with ParallelRootFinder(
+        ConcurrentFunction(scalarFunc, numWorkers=2, mode="process"),
+        ConcurrentFunction(scalarDerivative, numWorkers=2, mode="process"),
+        containerType=ContainerTypes.ROUNDING_CONTAINER,
+        algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR,
+        precision=(3, 3),
+        numWorkers=2,
+    ) as finder:
+        finder.calculateRoots((-4, 4), (-1, 1))
+        assert rootsMatchClosely(
+            finder.roots,
+            np.array([-np.pi, 0, np.pi, 0.5j]),
+            precision=(3, 3),
+        )
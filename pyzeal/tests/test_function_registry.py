@@ -0,0 +1,130 @@
+"""
+This module tests the registry shipping unpicklable target functions to the
+workers of parallel root finders.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.algorithm_types import AlgorithmTypes
+from pyzeal.pyzeal_types.container_types import ContainerTypes
+from pyzeal.rootfinders import ParallelRootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import polynomialFactory, rootsMatchClosely
+from pyzeal.utils.function_registry import (
+    FunctionRegistry,
+    RegisteredFunction,
+)
+from pyzeal.utils.lambda_wrapper import LambdaWrapper
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def testConcurrentRegisteredLambdas() -> None:
+    """
+    Test that parallel searches on several registered lambdas run
+    concurrently without pickling the lambdas.
+    """
+    targets = [
+        (
+            FunctionRegistry.register(lambda z: z**2 - 1),
+            FunctionRegistry.register(lambda z: 2 * z),
+            np.array([-1, 1]),
+        ),
+        (
+            FunctionRegistry.register(lambda z: (z - 0.5j) * (z + 1.5)),
+            FunctionRegistry.register(lambda z: 2 * z + 1.5 - 0.5j),
+            np.array([0.5j, -1.5]),
+        ),
+    ]
+    finders = [
+        ParallelRootFinder(
+            f,
+            df,
+            containerType=ContainerTypes.ROUNDING_CONTAINER,
+            algorithmType=AlgorithmTypes.SIMPLE_ARGUMENT,
+            precision=(4, 4),
+        )
+        for f, df, _ in targets
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(
+                executor.map(
+                    lambda finder: finder.calculateRoots(
+                        (-2.1, 1.9), (-2.2, 1.8)
+                    ),
+                    finders,
+                )
+            )
+        for finder, (_, _, roots) in zip(finders, targets):
+            assert rootsMatchClosely(finder.roots, roots, precision=(4, 4))
+    finally:
+        for finder, (f, df, _) in zip(finders, targets):
+            finder.close()
+            FunctionRegistry.unregister(f)
+            FunctionRegistry.unregister(df)
+
+
+def testRebuildFromFactory() -> None:
+    """
+    Test that handles only pickle their keys and factories and that spawned
+    workers rebuild registered functions from factories.
+    """
+    roots = (0.5j, -1.0)
+    handle = FunctionRegistry.register(
+        factory=polynomialFactory, factoryArgs=(roots,)
+    )
+    zArr = (np.linspace(-2, 2, 11) + 0.3j).astype(np.complex128)
+    expected = (zArr - 0.5j) * (zArr + 1)
+    try:
+        assert pickle.loads(pickle.dumps(handle)).key == handle.key
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as executor:
+            assert np.allclose(
+                executor.submit(handle, zArr).result(), expected
+            )
+    finally:
+        FunctionRegistry.unregister(handle)
+    # rebuilt on demand in processes which lost the function
+    assert not FunctionRegistry.isRegistered(handle.key)
+    assert np.allclose(handle(zArr), expected)
+    FunctionRegistry.unregister(handle)
+    with pytest.raises(ValueError):
+        RegisteredFunction(handle.key)(zArr)
+
+
+def testRegistryKeys() -> None:
+    """
+    Test that stable keys can not be reused by other functions and that the
+    lambda wrapper keeps its save mode.
+    """
+    identity = lambda z: z  # noqa: E731
+    func = FunctionRegistry.register(identity, key="identity")
+    try:
+        # registering the same function again is allowed
+        assert (
+            FunctionRegistry.register(identity, key="identity").key == func.key
+        )
+        with pytest.raises(ValueError):
+            FunctionRegistry.register(lambda z: z, key="identity")
+    finally:
+        FunctionRegistry.unregister(func)
+    wrapped = LambdaWrapper.wrapLambda(lambda z: z + 1, mode="unsave")
+    with pytest.raises(ValueError):
+        LambdaWrapper.wrapLambda(lambda z: z + 2)
+    assert wrapped(np.array([1.0]))[0] == 2
+    wrapped = LambdaWrapper.wrapLambda(lambda z: z + 2, mode="unsave")
+    assert wrapped(np.array([1.0]))[0] == 3
@@ -0,0 +1,181 @@
+"""
+This module tests the exclusion of roots from rectangles by sampled function
+values and bounds of the derivative.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import functools
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from pyzeal.algorithms.constants import EXCLUSION_NUM_PTS
+from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
+from pyzeal.pyzeal_types.estimator_types import EstimatorTypes
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.rootfinders import ParallelRootFinder, RootFinder
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.tests.resources.utils import rootsMatchClosely
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_exclusion import isRootFree
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def rootFunc(z: tVec, root: complex, order: int) -> tVec:
+    "Target function with a single root of given order."
+    return np.asarray((z - root) ** order * np.exp(z), dtype=np.complex128)
+
+
+def rootDerivative(z: tVec, root: complex, order: int) -> tVec:
+    "Derivative of `rootFunc`."
+    return np.asarray(
+        (z - root) ** (order - 1) * (order + z - root) * np.exp(z),
+        dtype=np.complex128,
+    )
+
+
+def testRootFreeRectangle() -> None:
+    """
+    Test that rectangles far away from roots are excluded with supplied and
+    with estimated bounds of the derivative.
+    """
+    for df, bound in [(None, 1.0), (lambda z: np.ones_like(z), None)]:
+        context = RootContext(
+            f=lambda z: z - 10,
+            df=df,
+            container=ContainerFactory.getConcreteContainer(),
+            precision=(5, 5),
+            derivativeBound=bound,
+        )
+        assert isRootFree((-1, 1), (-1, 1), context, EXCLUSION_NUM_PTS)
+        # the distance to the root is too small for the test to decide
+        assert not isRootFree((8, 9.9), (-1, 1), context, 2)
+
+
+@pytest.mark.parametrize("order", [1, 2, 3])
+@pytest.mark.parametrize("withDerivative", [False, True])
+@pytest.mark.parametrize("bound", [None, 1e3])
+def testRectangleWithRoot(
+    order: int, withDerivative: bool, bound: Optional[float]
+) -> None:
+    """
+    Test that rectangles containing a root are never excluded.
+
+    :param order: Order of the root
+    :param withDerivative: Flag indicating if a derivative is supplied
+    :param bound: User supplied bound of the derivative
+    """
+    rng = np.random.default_rng(order)
+    for root in rng.uniform(-1, 1, 10) + 1j * rng.uniform(-1, 1, 10):
+        context = RootContext(
+            f=functools.partial(rootFunc, root=root, order=order),
+            df=(
+                functools.partial(rootDerivative, root=root, order=order)
+                if withDerivative
+                else None
+            ),
+            container=ContainerFactory.getConcreteContainer(),
+            precision=(5, 5),
+            derivativeBound=bound,
+        )
+        for numPts in (2, 3, EXCLUSION_NUM_PTS, 9):
+            assert not isRootFree((-1, 1), (-1, 1), context, numPts)
+            assert not isRootFree(
+                (root.real - 1e-3, 1), (-1, root.imag + 1e-3), context, numPts
+            )
+
+
+def testDefaultExclusion() -> None:
+    """
+    Test that the exclusion test is only enabled by default for a user
+    supplied bound of the derivative and for estimators which do not reuse
+    line samples.
+    """
+    summation = SimpleArgumentAlgorithm(
+        estimatorType=EstimatorTypes.SUMMATION_ESTIMATOR
+    )
+    quadrature = SimpleArgumentAlgorithm(
+        estimatorType=EstimatorTypes.QUADRATURE_ESTIMATOR
+    )
+    for bound in (None, 1.0):
+        context = RootContext(
+            f=lambda z: z - 10,
+            df=None,
+            container=ContainerFactory.getConcreteContainer(),
+            precision=(5, 5),
+            derivativeBound=bound,
+        )
+        assert not summation.excludeRoots((-1, 1), (-1, 1), context)
+        assert quadrature.excludeRoots((-1, 1), (-1, 1), context) == (
+            bound is not None
+        )
+
+
+def hiddenRootsFunc(z: tVec) -> tVec:
+    "Target function whose derivative nearly vanishes at grid samples."
+    return np.asarray(np.sin(4 * np.pi * (z - 0.125)), dtype=np.complex128)
+
+
+def hiddenRootsDerivative(z: tVec) -> tVec:
+    "Derivative of `hiddenRootsFunc`."
+    return np.asarray(
+        4 * np.pi * np.cos(4 * np.pi * (z - 0.125)), dtype=np.complex128
+    )
+
+
+def testUnderestimatedDerivative() -> None:
+    """
+    Test that no roots are lost by default if the derivative sampled by the
+    exclusion test underestimates the maximum of `|f'|`.
+    """
+    reRan, imRan = (-1.0, 1.0), (-0.005, 0.005)
+    context = RootContext(
+        f=hiddenRootsFunc,
+        df=hiddenRootsDerivative,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(3, 3),
+    )
+    # the heuristic bound misses the roots between the samples of the
+    # rectangle and of its halves
+    assert isRootFree(reRan, imRan, context, EXCLUSION_NUM_PTS)
+    for half in ((-1.0, 0.0), (0.0, 1.0)):
+        assert isRootFree(half, imRan, context, EXCLUSION_NUM_PTS)
+    finder = RootFinder(
+        hiddenRootsFunc,
+        hiddenRootsDerivative,
+        estimatorType=EstimatorTypes.QUADRATURE_ESTIMATOR,
+        precision=(3, 3),
+    )
+    finder.calculateRoots(reRan, imRan)
+    assert rootsMatchClosely(
+        finder.roots, np.arange(-0.875, 1, 0.25, dtype=np.complex128), (3, 3)
+    )
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def testFinderWithDerivativeBound(parallel: bool) -> None:
+    """
+    Test that root finders supplied with a bound of the derivative find all
+    roots of a target function.
+
+    :param parallel: If roots should be searched in parallel
+    """
+    finderType = ParallelRootFinder if parallel else RootFinder
+    finder = finderType(
+        lambda z: (z**2 + 1) * (z - 3),
+        lambda z: 3 * z**2 - 6 * z + 1,
+        estimatorType=EstimatorTypes.QUADRATURE_ESTIMATOR,
+        precision=(4, 4),
+        derivativeBound=200.0,
+    )
+    finder.calculateRoots((-5, 5), (-5, 5))
+    assert rootsMatchClosely(finder.roots, np.array([1j, -1j, 3]), (3, 3))
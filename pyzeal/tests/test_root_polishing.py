@@ -0,0 +1,57 @@
+"""
+This module tests the polishing of approximate roots by the Newton algorithm
+and the secant method.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import numpy as np
+import pytest
+
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.settings.ram_settings_service import RAMSettingsService
+from pyzeal.settings.settings_service import SettingsService
+from pyzeal.utils.factories.container_factory import ContainerFactory
+from pyzeal.utils.root_context import RootContext
+from pyzeal.utils.root_polishing import polishCandidates, polishRoots
+from pyzeal.utils.service_locator import ServiceLocator
+
+ServiceLocator.registerAsSingleton(
+    SettingsService, RAMSettingsService(verbose=False)
+)
+
+
+def polishFunc(z: tVec) -> tVec:
+    "Target function with a simple root at `1j` and a double root at `0.5`."
+    return np.asarray((z - 0.5) ** 2 * (z - 1j), dtype=np.complex128)
+
+
+def polishDerivative(z: tVec) -> tVec:
+    "Derivative of `polishFunc`."
+    return np.asarray(
+        2 * (z - 0.5) * (z - 1j) + (z - 0.5) ** 2, dtype=np.complex128
+    )
+
+
+@pytest.mark.parametrize("withDerivative", [False, True])
+def testPolishCandidates(withDerivative: bool) -> None:
+    """
+    Test that candidates close to roots converge to the roots (taking their
+    multiplicities into account) with and without a derivative.
+
+    :param withDerivative: Flag indicating if a derivative is supplied
+    """
+    context = RootContext(
+        f=polishFunc,
+        df=polishDerivative if withDerivative else None,
+        container=ContainerFactory.getConcreteContainer(),
+        precision=(6, 6),
+    )
+    candidates = np.array([0.52 + 0.01j, 0.02 + 0.97j])
+    orders = np.array([2, 1], dtype=np.int32)
+    polished = polishCandidates(candidates, orders, context)
+    assert np.allclose(polished, [0.5, 1j], atol=1e-6)
+    # without a derivative the Newton algorithm leaves roots unchanged
+    if not withDerivative:
+        assert np.all(polishRoots(candidates, orders, context) == candidates)
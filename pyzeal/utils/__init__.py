@@ -2,12 +2,22 @@
 Various utilities and framework elements used to support `PyZEAL`.
 """
 
+from pyzeal.utils.async_function import AsyncFunction
+from pyzeal.utils.concurrent_function import ConcurrentFunction
 from pyzeal.utils.configuration_exception import InvalidServiceConfiguration
+from pyzeal.utils.function_registry import (
+    FunctionRegistry,
+    RegisteredFunction,
+)
 from pyzeal.utils.lambda_wrapper import LambdaWrapper
 from pyzeal.utils.service_locator import ServiceLocator
 
 __all__ = [
+    "AsyncFunction",
+    "ConcurrentFunction",
+    "FunctionRegistry",
     "InvalidServiceConfiguration",
     "LambdaWrapper",
+    "RegisteredFunction",
     "ServiceLocator",
 ]
@@ -0,0 +1,212 @@
+"""
+Class AsyncFunction from the package pyzeal_utils.
+
+This module wraps awaitable target functions (e.g. functions computed by a
+service over a socket), such that they can be used by the synchronous root
+finding algorithms. Arrays of points are split into blocks which are awaited
+concurrently on a private event loop, hiding the latency of single calls.
+The quadrature estimator requests the nodes of all edges of a rectangle (and
+of both halves of a subdivided rectangle) in a single call, such that these
+edges are awaited concurrently. Its adaptive refinements of single edges and
+the (default) summation estimator, which refines edges depending on existing
+samples, still await one edge at a time.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import asyncio
+from inspect import iscoroutinefunction
+from math import ceil
+from threading import Lock, Thread
+from types import TracebackType
+from typing import Any, List, Optional, Tuple, Type, cast
+
+import numpy as np
+
+from pyzeal.pyzeal_types.root_types import (
+    tAsyncHoloFunc,
+    tHoloFunc,
+    tTargetFunc,
+    tVec,
+)
+
+# default maximal number of concurrently awaited calls of a target function
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class AsyncFunction:
+    """
+    Wrapper around an awaitable (vectorized) target function. Each call
+    splits its input into blocks, awaits at most `maxInFlight` of them
+    concurrently and reassembles the results in the order of the input
+    points. Root finders keep the event loop running for the duration of a
+    root search, otherwise an event loop is started for each call. Opening
+    and closing is reference-counted (and thread-safe), such that the event
+    loop is stopped by the last `close()` only.
+    """
+
+    __slots__ = (
+        "func",
+        "maxInFlight",
+        "blockSize",
+        "_loop",
+        "_thread",
+        "_lock",
+        "_refs",
+    )
+
+    def __init__(
+        self,
+        func: tAsyncHoloFunc,
+        *,
+        maxInFlight: int = DEFAULT_MAX_IN_FLIGHT,
+        blockSize: Optional[int] = None,
+    ) -> None:
+        """
+        Wrap an awaitable function for use in root finding algorithms.
+
+        :param func: the awaitable function to wrap
+        :param maxInFlight: maximal number of concurrently awaited calls
+        :param blockSize: maximal number of points per call of `func`,
+            defaults to splitting each input evenly into `maxInFlight` blocks
+        """
+        self.func = func
+        self.maxInFlight = maxInFlight
+        self.blockSize = blockSize
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self._refs = 0
+
+    def __call__(self, zArr: tVec) -> tVec:
+        """
+        Evaluate the wrapped function on all points of `zArr`. The event loop
+        is held open during the evaluation (a temporary loop is started if it
+        is not open), such that concurrent calls of `close()` cannot stop it.
+
+        :param zArr: Points at which to evaluate the function
+        :raises RuntimeError: if the event loop is not available
+        :return: Function values at `zArr` (with the same shape)
+        """
+        with self:
+            if (loop := self._loop) is None:
+                raise RuntimeError("event loop is not running!")
+            return asyncio.run_coroutine_threadsafe(
+                self.evaluate(zArr), loop
+            ).result()
+
+    async def evaluate(self, zArr: tVec) -> tVec:
+        """
+        Evaluate the wrapped function on all points of `zArr` by awaiting
+        blocks of points concurrently.
+
+        :param zArr: Points at which to evaluate the function
+        :return: Function values at `zArr` (with the same shape)
+        """
+        points = np.asarray(zArr).ravel()
+        size = self.blockSize or max(ceil(points.size / self.maxInFlight), 1)
+        inFlight = asyncio.Semaphore(self.maxInFlight)
+
+        async def evalBlock(block: tVec) -> tVec:
+            async with inFlight:
+                return await self.func(block)
+
+        results: List[tVec] = await asyncio.gather(
+            *(
+                evalBlock(points[start : start + size])
+                for start in range(0, points.size, size)
+            )
+        )
+        out = np.empty(points.size, dtype=np.complex128)
+        for start, result in zip(range(0, points.size, size), results):
+            out[start : start + size] = result
+        return out.reshape(np.shape(zArr))
+
+    def open(self) -> None:
+        """
+        Start the event loop (in a background thread) if it is not running
+        yet and register one more user of the loop.
+        """
+        with self._lock:
+            self._refs += 1
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self._loop.run_forever, daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """
+        Unregister a user of the event loop and stop the loop (after pending
+        evaluations finished) if it was the last one.
+        """
+        with self._lock:
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs > 0 or self._loop is None or self._thread is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    def __enter__(self) -> "AsyncFunction":
+        """
+        Start the event loop for the duration of a `with` block.
+
+        :return: The wrapped function itself
+        """
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        excType: Optional[Type[BaseException]],
+        excValue: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Stop the event loop at the end of a `with` block.
+        """
+        self.close()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the wrapped function without its event loop (e.g. for parallel
+        root finders).
+
+        :return: State of the wrapper
+        """
+        return self.func, self.maxInFlight, self.blockSize
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Restore a pickled wrapper (without a running event loop).
+
+        :param state: State of the wrapper
+        """
+        self.func, self.maxInFlight, self.blockSize = state
+        self._loop = None
+        self._thread = None
+        self._lock = Lock()
+        self._refs = 0
+
+
+def wrapAsync(func: tTargetFunc) -> tHoloFunc:
+    """
+    Wrap `func` in an `AsyncFunction` if it is a coroutine function, such
+    that root finders can evaluate it synchronously. Only points requested
+    by a single call are awaited concurrently: the quadrature estimator
+    requests all edges of rectangles (and of sibling rectangles) at once,
+    while the default summation estimator samples and refines one edge at a
+    time.
+
+    :param func: Target function (or derivative) of a root search
+    :return: Synchronously callable target function
+    """
+    if iscoroutinefunction(func):
+        return AsyncFunction(cast(tAsyncHoloFunc, func))
+    return cast(tHoloFunc, func)
@@ -0,0 +1,176 @@
+"""
+Class ConcurrentFunction from the package pyzeal_utils.
+
+This module wraps expensive target functions which can only be evaluated on
+single (scalar) complex numbers, such that they can be used by the vectorized
+root finding algorithms. Scalar evaluations are distributed over a pool of
+threads or processes.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import AbstractContextManager, ExitStack
+from multiprocessing import current_process
+from os import cpu_count
+from threading import Lock
+from types import TracebackType
+from typing import Any, Literal, Optional, Tuple, Type
+
+import numpy as np
+
+from pyzeal.pyzeal_types.root_types import tHoloFunc, tScalarFunc, tVec
+
+
+class ConcurrentFunction:
+    """
+    Wrapper around a scalar target function which evaluates arrays of points
+    concurrently on a pool of threads or processes. Function values are
+    reassembled in the order of the input points. Root finders open the pool
+    once for the duration of a root search, otherwise a pool is created for
+    each call. Opening and closing is reference-counted (and thread-safe),
+    such that the pool is shut down by the last `close()` only.
+    """
+
+    __slots__ = ("func", "numWorkers", "mode", "_executor", "_lock", "_refs")
+
+    def __init__(
+        self,
+        func: tScalarFunc,
+        *,
+        numWorkers: Optional[int] = None,
+        mode: Literal["thread", "process"] = "thread",
+    ) -> None:
+        """
+        Wrap a scalar function for concurrent evaluation.
+
+        :param func: the scalar function to wrap (must be picklable if
+            `mode` is "process")
+        :param numWorkers: number of threads or processes evaluating the
+            function, defaults to the number of CPUs
+        :param mode: evaluate the function on a pool of threads (suitable if
+            the function releases the GIL, e.g. waits for I/O or an external
+            program) or on a pool of processes (daemonic processes, e.g. the
+            workers of parallel root finders, fall back to threads because
+            they must not start processes of their own)
+        """
+        self.func = func
+        self.numWorkers = numWorkers or cpu_count() or 1
+        self.mode = mode
+        self._executor: Optional[Executor] = None
+        self._lock = Lock()
+        self._refs = 0
+
+    def __call__(self, zArr: tVec) -> tVec:
+        """
+        Evaluate the wrapped function on all points of `zArr`. The pool is
+        held open during the evaluation (a temporary pool is started if it is
+        not open), such that concurrent calls of `close()` cannot shut it down.
+
+        :param zArr: Points at which to evaluate the function
+        :raises RuntimeError: if the pool of workers is not available
+        :return: Function values at `zArr` (with the same shape)
+        """
+        with self:
+            if (executor := self._executor) is None:
+                raise RuntimeError("pool of workers is not running!")
+            points = np.asarray(zArr).ravel().tolist()
+            chunkSize = max(len(points) // (4 * self.numWorkers), 1)
+            return np.fromiter(
+                executor.map(self.func, points, chunksize=chunkSize),
+                dtype=np.complex128,
+                count=len(points),
+            ).reshape(np.shape(zArr))
+
+    def open(self) -> None:
+        """
+        Start the pool of workers if it is not running yet and register one
+        more user of the pool.
+        """
+        with self._lock:
+            self._refs += 1
+            if self._executor is not None:
+                return
+            if self.mode == "process" and not current_process().daemon:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.numWorkers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.numWorkers
+                )
+
+    def close(self) -> None:
+        """
+        Unregister a user of the pool of workers and shut the pool down (after
+        pending evaluations finished) if it was the last one.
+        """
+        with self._lock:
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs > 0 or self._executor is None:
+                return
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ConcurrentFunction":
+        """
+        Start the pool of workers for the duration of a `with` block.
+
+        :return: The wrapped function itself
+        """
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        excType: Optional[Type[BaseException]],
+        excValue: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Shut down the pool of workers at the end of a `with` block.
+        """
+        self.close()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the wrapped function without its pool of workers (e.g. for
+        parallel root finders).
+
+        :return: State of the wrapper
+        """
+        return self.func, self.numWorkers, self.mode
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Restore a pickled wrapper (without a running pool of workers).
+
+        :param state: State of the wrapper
+        """
+        self.func, self.numWorkers, self.mode = state
+        self._executor = None
+        self._lock = Lock()
+        self._refs = 0
+
+
+def openEvaluators(*funcs: Optional[tHoloFunc]) -> ExitStack:
+    """
+    Start the workers of all wrapped target functions among `funcs` (e.g.
+    `ConcurrentFunction` or `AsyncFunction`) until the returned `ExitStack` is
+    closed. Plain functions are ignored.
+
+    :param funcs: Target functions (and derivatives) of a root search
+    :return: Context manager shutting down the workers upon exit
+    """
+    stack = ExitStack()
+    for func in funcs:
+        if isinstance(func, AbstractContextManager):
+            stack.enter_context(func)
+    return stack
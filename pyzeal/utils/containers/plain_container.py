@@ -67,6 +67,21 @@ class PlainContainer(RootContainer):
         """
         return False
 
+    def updateRootOrder(self, root: tRoot) -> bool:
+        """
+        Replace the order of a root held in this container. Return value
+        indicates success.
+
+        :param root: the root with its new order
+        :return: a boolean flag indicating if an update happened
+        """
+        self._transferRootBuffer()
+        for i, (value, _) in enumerate(self._roots):
+            if value == root[0]:
+                self._roots[i] = root
+                return True
+        return False
+
     def getRoots(self) -> tVec:
         """
         Returns all roots currently held in this container as a vector.
@@ -61,6 +61,16 @@ class RootContainer(Loggable, Protocol):
         """
         ...
 
+    def updateRootOrder(self, root: tRoot) -> bool:
+        """
+        Replace the order of a root held in this container (without filtering
+        the root again) and indicate whether or not the root was found.
+
+        :param root: the root (as returned by `getRoots`) with its new order
+        :return: a boolean flag indicating if an update happened
+        """
+        ...
+
     def clear(self) -> None:
         "Clear all data from the container."
         ...
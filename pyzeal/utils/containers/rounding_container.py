@@ -111,6 +111,27 @@ class RoundingContainer(RootContainer):
             )
             return False
 
+    def updateRootOrder(self, root: tRoot) -> bool:
+        """
+        Replace the order of a root held in this container (without filtering
+        the root again). Return value indicates success.
+
+        :param root: the root with its new order
+        :return: a boolean flag indicating if an update happened
+        """
+        value, order = RoundingContainer.roundRoot(root, self.precision)
+        for oldRoot in [old for old in self.rootSet if old[0] == value]:
+            self.rootSet.remove(oldRoot)
+            self.rootSet.add((value, order))
+            self.logger.debug(
+                "updated order of root %f+%fi to %d!",
+                value.real,
+                value.imag,
+                order,
+            )
+            return True
+        return False
+
     def getRoots(self) -> tVec:
         """
         Returns all roots currently held in this container as a vector.
@@ -9,9 +9,14 @@ Authors:\n
 
 from typing import Optional
 
+from pyzeal.algorithms.circle_holo import CircleArgumentAlgorithm
+from pyzeal.algorithms.estimators.constants import MAX_CACHE_BYTES
 from pyzeal.algorithms.finder_algorithm import FinderAlgorithm
+from pyzeal.algorithms.hankel_holo import HankelPencilAlgorithm
+from pyzeal.algorithms.mesh_holo import MeshArgumentAlgorithm
 from pyzeal.algorithms.newton_grid import NewtonGridAlgorithm
 from pyzeal.algorithms.polynomial_holo import AssociatedPolynomialAlgorithm
+from pyzeal.algorithms.rational_holo import RationalSurrogateAlgorithm
 from pyzeal.algorithms.simple_holo import SimpleArgumentAlgorithm
 from pyzeal.algorithms.simple_holo_newton import SimpleArgumentNewtonAlgorithm
 from pyzeal.pyzeal_logging.log_levels import LogLevel
@@ -35,6 +40,7 @@ class AlgorithmFactory:
         *,
         estimatorType: EstimatorTypes = EstimatorTypes.DEFAULT,
         numSamplePoints: Optional[int] = None,
+        maxCacheBytes: int = MAX_CACHE_BYTES,
     ) -> FinderAlgorithm:
         """
         Construct and return an algorithm instance based on the given type of
@@ -44,6 +50,7 @@ class AlgorithmFactory:
         :param algoType: type of algorithm to construct
         :param estimatorType: type of argument estimator to use
         :param numSamplePoints: sample point configuration for NewtonGridAlgo
+        :param maxCacheBytes: memory cap of the caches of argument estimators
         :return: a concrete `FinderAlgorithm` instance
         """
         if AlgorithmFactory._logger is None:
@@ -62,17 +69,49 @@ class AlgorithmFactory:
             AlgorithmFactory._logger.debug(
                 "requested usage of a SimpleArgumentAlgorithm..."
             )
-            return SimpleArgumentAlgorithm(estimatorType=estimatorType)
+            return SimpleArgumentAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
         if algoType == AlgorithmTypes.SIMPLE_ARGUMENT_NEWTON:
             AlgorithmFactory._logger.debug(
                 "requested usage of a SimpleArgumentNewtonAlgorithm..."
             )
-            return SimpleArgumentNewtonAlgorithm(estimatorType=estimatorType)
+            return SimpleArgumentNewtonAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
         if algoType == AlgorithmTypes.ASSOCIATED_POLYNOMIAL:
             AlgorithmFactory._logger.debug(
                 "requested usage of an AssociatedPolynomialAlgorithm..."
             )
-            return AssociatedPolynomialAlgorithm(estimatorType=estimatorType)
+            return AssociatedPolynomialAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
+        if algoType == AlgorithmTypes.HANKEL_PENCIL:
+            AlgorithmFactory._logger.debug(
+                "requested usage of a HankelPencilAlgorithm..."
+            )
+            return HankelPencilAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
+        if algoType == AlgorithmTypes.CIRCLE_ARGUMENT:
+            AlgorithmFactory._logger.debug(
+                "requested usage of a CircleArgumentAlgorithm..."
+            )
+            return CircleArgumentAlgorithm()
+        if algoType == AlgorithmTypes.RATIONAL_SURROGATE:
+            AlgorithmFactory._logger.debug(
+                "requested usage of a RationalSurrogateAlgorithm..."
+            )
+            return RationalSurrogateAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
+        if algoType == AlgorithmTypes.MESH_ARGUMENT:
+            AlgorithmFactory._logger.debug(
+                "requested usage of a MeshArgumentAlgorithm..."
+            )
+            return MeshArgumentAlgorithm(
+                estimatorType=estimatorType, maxCacheBytes=maxCacheBytes
+            )
 
         # return the current default algorithm
         AlgorithmFactory._logger.debug(
@@ -83,6 +122,7 @@ class AlgorithmFactory:
             settings.defaultAlgorithm,
             numSamplePoints=numSamplePoints,
             estimatorType=estimatorType,
+            maxCacheBytes=maxCacheBytes,
         )
 
     @staticmethod
@@ -0,0 +1,159 @@
+"""
+Class FunctionRegistry from the package pyzeal_utils.
+
+This module ships target functions which can not be pickled (e.g. lambdas or
+closures) to the workers of parallel root finders. Functions are registered
+under stable keys and replaced by picklable handles holding only the key.
+Workers started via `fork` inherit the registry, while workers started via
+`spawn` rebuild missing functions from importable factories.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import uuid4
+
+from pyzeal.pyzeal_types.root_types import tHoloFunc, tVec
+
+# registered functions of the current process (inherited by forked workers)
+_registry: Dict[str, tHoloFunc] = {}
+_registryLock = Lock()
+
+
+class RegisteredFunction:
+    """
+    Picklable handle of a function in the registry. Pickling a handle only
+    transfers its key and (optionally) a reference to an importable factory
+    together with its arguments, but never the function itself.
+    """
+
+    __slots__ = ("key", "factory", "factoryArgs")
+
+    def __init__(
+        self,
+        key: str,
+        factory: Optional[Callable[..., tHoloFunc]] = None,
+        factoryArgs: Tuple[Any, ...] = (),
+    ) -> None:
+        """
+        Create a handle of a registered function.
+
+        :param key: Key of the function in the registry
+        :param factory: Importable (module level) callable rebuilding the
+            function in processes which did not inherit the registry
+        :param factoryArgs: Picklable arguments passed to `factory`
+        """
+        self.key = key
+        self.factory = factory
+        self.factoryArgs = factoryArgs
+
+    def __call__(self, z: tVec) -> tVec:
+        """
+        Evaluate the registered function.
+
+        :param z: Points at which to evaluate the function
+        :return: Function values at `z`
+        """
+        return FunctionRegistry.lookup(self)(z)
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the key and factory of the handle.
+
+        :return: State of the handle
+        """
+        return self.key, self.factory, self.factoryArgs
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Restore a pickled handle.
+
+        :param state: State of the handle
+        """
+        self.key, self.factory, self.factoryArgs = state
+
+    def __repr__(self) -> str:
+        "Representation of the handle (containing its key)."
+        return f"RegisteredFunction(key={self.key!r})"
+
+
+class FunctionRegistry:
+    """
+    Static registry of target functions shared with worker processes.
+    """
+
+    @staticmethod
+    def register(
+        func: Optional[tHoloFunc] = None,
+        *,
+        key: Optional[str] = None,
+        factory: Optional[Callable[..., tHoloFunc]] = None,
+        factoryArgs: Tuple[Any, ...] = (),
+    ) -> RegisteredFunction:
+        """
+        Register a function and return a picklable handle of it.
+
+        :param func: Function to register, defaults to `factory(*factoryArgs)`
+        :param key: Stable key of the function, defaults to a random key
+        :param factory: Importable (module level) callable rebuilding the
+            function in workers started via `spawn`
+        :param factoryArgs: Picklable arguments passed to `factory`
+        :raises ValueError: if neither a function nor a factory is given or if
+            another function is registered under `key` already
+        :return: Handle evaluating the registered function
+        """
+        if func is None:
+            if factory is None:
+                raise ValueError("register requires a function or factory!")
+            func = factory(*factoryArgs)
+        key = key if key is not None else uuid4().hex
+        with _registryLock:
+            if _registry.get(key, func) is not func:
+                raise ValueError(f"function with key {key} exists already!")
+            _registry[key] = func
+        return RegisteredFunction(key, factory, factoryArgs)
+
+    @staticmethod
+    def unregister(handle: RegisteredFunction) -> None:
+        """
+        Remove a function from the registry of the current process.
+
+        :param handle: Handle of the function to remove
+        """
+        with _registryLock:
+            _registry.pop(handle.key, None)
+
+    @staticmethod
+    def lookup(handle: RegisteredFunction) -> tHoloFunc:
+        """
+        Return the function registered for a handle. Missing functions are
+        rebuilt from the factory of the handle (if available).
+
+        :param handle: Handle of a registered function
+        :raises ValueError: if the function is neither registered in the
+            current process nor can be rebuilt
+        :return: The registered function
+        """
+        func = _registry.get(handle.key)
+        if func is not None:
+            return func
+        if handle.factory is None:
+            raise ValueError(
+                f"function with key {handle.key} is not registered in this "
+                "process (register it with a factory for spawned workers)!"
+            )
+        rebuilt = handle.factory(*handle.factoryArgs)
+        with _registryLock:
+            return _registry.setdefault(handle.key, rebuilt)
+
+    @staticmethod
+    def isRegistered(key: str) -> bool:
+        """
+        Check if a function is registered under `key` in the current process.
+
+        :param key: Key of the function
+        :return: Flag indicating a registered function
+        """
+        return key in _registry
@@ -7,32 +7,40 @@ Authors:\n
 - Philipp Schuette\n
 """
 
-from typing import Literal, Optional, Union
-
-from pyzeal.pyzeal_types.root_types import tHoloFunc, tVec
-
-# global variables holding the lambda function to be wrapped and its derivative
-_func: Optional[tHoloFunc] = None
-_derivative: Optional[tHoloFunc] = None
-
-
-def wrappedFunc(z: tVec) -> tVec:
-    "The wrapped input function."
-    if _func is not None:
-        return _func(z)
-    raise ValueError("something went wrong during lambda wrapping!")
-
-
-def wrappedDerivative(z: tVec) -> tVec:
-    "The wrapped derivative function."
-    if _derivative is not None:
-        return _derivative(z)
-    raise ValueError("something went wrong during derivative wrapping!")
+from typing import Literal, Union
+
+from pyzeal.pyzeal_types.root_types import tHoloFunc
+from pyzeal.utils.function_registry import (
+    FunctionRegistry,
+    RegisteredFunction,
+)
+
+# registry keys of the wrapped lambda function and its derivative
+LAMBDA_KEY = "pyzeal.lambda"
+DERIVATIVE_KEY = "pyzeal.derivative"
+
+
+def _wrap(
+    func: tHoloFunc,
+    key: str,
+    mode: Union[Literal["save"], Literal["unsave"]],
+) -> tHoloFunc:
+    "Register `func` under a fixed `key` (overwriting it in unsave mode)."
+    if FunctionRegistry.isRegistered(key):
+        if mode == "save":
+            raise ValueError(
+                f"you cannot wrap more than one function under {key} in save"
+                " mode!"
+            )
+        FunctionRegistry.unregister(RegisteredFunction(key))
+    return FunctionRegistry.register(func, key=key)
 
 
 class LambdaWrapper:
     """
-    Static wrapper class for lambda functions.
+    Static wrapper class for a single lambda function and its derivative.
+    Several functions can be shipped to workers concurrently by registering
+    them with `FunctionRegistry` directly.
     """
 
     @staticmethod
@@ -51,15 +59,7 @@ class LambdaWrapper:
             in "save" mode, while another function is already being wrapped.
         :return: The wrapped function.
         """
-        global _func
-
-        if _func is not None and mode == "save":
-            raise ValueError(
-                "you cannot wrap more than one lambda in save mode!"
-            )
-
-        _func = func
-        return wrappedFunc
+        return _wrap(func, LAMBDA_KEY, mode)
 
     @staticmethod
     def wrapDerivative(
@@ -77,12 +77,4 @@ class LambdaWrapper:
             in "save" mode, while another function is already being wrapped.
         :return: The wrapped derivative.
         """
-        global _derivative
-
-        if _derivative is not None and mode == "save":
-            raise ValueError(
-                "you cannot wrap more than one derivative in save mode!"
-            )
-
-        _derivative = derivative
-        return wrappedDerivative
+        return _wrap(derivative, DERIVATIVE_KEY, mode)
@@ -8,14 +8,39 @@ Authors:\n
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Final, Optional, Tuple
 
+import numpy as np
 from rich.progress import TaskID
 
-from pyzeal.pyzeal_types.root_types import tHoloFunc
+from pyzeal.pyzeal_types.root_types import tHoloFunc, tRoot, tVec
 from pyzeal.utils.containers.root_container import RootContainer
 from pyzeal.utils.filter_context import FilterContext
 from pyzeal.utils.finder_progress import FinderProgressBar
+from pyzeal.utils.shared_samples import tLineSamples
+
+# default maximal number of points passed to a single call of f or df
+DEFAULT_CHUNK_SIZE: Final[int] = 2**16
+
+
+def evalChunked(func: tHoloFunc, zArr: tVec, chunkSize: int) -> tVec:
+    """
+    Evaluate a function on an array of points in blocks of at most
+    `chunkSize` points, such that temporaries allocated by the function are
+    bounded independently of the size of `zArr`. Results are written into a
+    single preallocated output array.
+
+    :param func: Function to evaluate
+    :param zArr: Points at which to evaluate the function
+    :param chunkSize: Maximal number of points per call of `func`
+    :return: Function values at `zArr`
+    """
+    if zArr.size <= chunkSize:
+        return func(zArr)
+    out = np.empty(zArr.size, dtype=np.complex128)
+    for start in range(0, zArr.size, chunkSize):
+        out[start : start + chunkSize] = func(zArr[start : start + chunkSize])
+    return out
 
 
 @dataclass(frozen=True)
@@ -33,6 +58,64 @@ class RootContext:
     imRan: Tuple[float, float] = (-1.0, 1.0)
     progress: Optional[FinderProgressBar] = None
     task: Optional[TaskID] = None
+    chunkSize: int = DEFAULT_CHUNK_SIZE
+    knownRoots: Tuple[tRoot, ...] = ()
+    derivativeBound: Optional[float] = None
+    sharedLines: Tuple[tLineSamples, ...] = ()
+
+    def evalFunc(self, zArr: tVec) -> tVec:
+        """
+        Evaluate the target function `f` in blocks of at most `chunkSize`
+        points. If roots of `f` are known already, the deflated function
+        `f(z) / prod_k (z - r_k)^m_k` is evaluated instead, such that known
+        roots are invisible to argument estimators.
+
+        :param zArr: Points at which to evaluate `f`
+        :return: (Deflated) function values at `zArr`
+        """
+        funcArr = evalChunked(self.f, zArr, self.chunkSize)
+        if len(self.knownRoots) == 0:
+            return funcArr
+        deflation = np.ones(zArr.shape, dtype=np.complex128)
+        for root, order in self.knownRoots:
+            deflation *= (zArr - root) ** order
+        with np.errstate(divide="ignore", invalid="ignore"):
+            funcArr = funcArr / deflation
+        # known roots hit exactly are reported as zeros of the deflated
+        # function (such that lines through them get translated)
+        funcArr[deflation == 0] = 0
+        return funcArr
+
+    def evalDerivative(
+        self, zArr: tVec, funcArr: Optional[tVec] = None
+    ) -> tVec:
+        """
+        Evaluate the derivative `df` in blocks of at most `chunkSize` points.
+        If roots of `f` are known already, the derivative of the deflated
+        function is evaluated instead.
+
+        :param zArr: Points at which to evaluate `df`
+        :param funcArr: Values of the (deflated) function at `zArr`, which are
+            calculated if they are required but not given
+        :raises ValueError: if no derivative is available
+        :return: (Deflated) derivative values at `zArr`
+        """
+        if self.df is None:
+            raise ValueError("derivative is not available in this context!")
+        derivArr = evalChunked(self.df, zArr, self.chunkSize)
+        if len(self.knownRoots) == 0:
+            return derivArr
+        if funcArr is None:
+            funcArr = self.evalFunc(zArr)
+        # (f / p)' = f' / p - (f / p) * sum_k m_k / (z - r_k)
+        deflation = np.ones(zArr.shape, dtype=np.complex128)
+        logDerivative = np.zeros(zArr.shape, dtype=np.complex128)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for root, order in self.knownRoots:
+                deflation *= (zArr - root) ** order
+                logDerivative += order / (zArr - root)
+            derivArr = derivArr / deflation - funcArr * logDerivative
+        return derivArr
 
     def toFilterContext(self) -> FilterContext:
         """
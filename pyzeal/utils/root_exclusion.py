@@ -0,0 +1,90 @@
+"""
+Function isRootFree from the package pyzeal_utils.
+
+This module provides a cheap test which excludes roots of a target function
+from a rectangle by a few samples on a regular grid. If `|f'| <= L` holds on
+the rectangle, then `|f(z)| >= |f(z_k)| - L * |z - z_k|` holds for every
+sample `z_k`, such that `f` cannot vanish anywhere if all `|f(z_k)|` exceed
+`L` times the largest distance of points of the rectangle to their nearest
+sample. The test is a proof only if a valid bound `L` is supplied by users,
+hence root finding algorithms only use it by default in this case.
+Otherwise `L` is estimated heuristically from the maximum of samples of the
+derivative (or of difference quotients) times a safety factor, and an
+underestimate of `|f'|` silently drops roots from the search.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from pyzeal.algorithms.constants import EXCLUSION_MARGIN
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.root_context import RootContext, evalChunked
+
+
+def isRootFree(
+    reRan: Tuple[float, float],
+    imRan: Tuple[float, float],
+    context: RootContext,
+    numPts: int,
+) -> bool:
+    """
+    Test if a rectangle contains no roots of `context.f` by sampling `f` on
+    a regular `numPts x numPts` grid including the boundary of the rectangle.
+    A result of `False` means that the test is undecided.
+
+    :param reRan: Real part of the rectangle
+    :param imRan: Imaginary part of the rectangle
+    :param context: `RootContext` containing the target function and (if
+        available) its derivative and a bound of `|f'|`
+    :param numPts: Number of samples per row and column (at least two)
+    :return: flag indicating that the rectangle contains no roots
+    """
+    (x1, x2), (y1, y2) = reRan, imRan
+    grid = np.linspace(0, 1, numPts)
+    zArr = (
+        x1
+        + (x2 - x1) * grid[np.newaxis, :]
+        + 1j * (y1 + (y2 - y1) * grid)[:, np.newaxis]
+    )
+    # known roots are not deflated, such that user supplied bounds apply
+    funcArr = evalChunked(context.f, zArr.ravel(), context.chunkSize)
+    if not np.all(np.isfinite(funcArr)):
+        return False
+    bound = context.derivativeBound
+    if bound is None:
+        bound = EXCLUSION_MARGIN * estimateDerivativeBound(
+            zArr, funcArr.reshape(zArr.shape), context
+        )
+    # points of a grid cell are closest to its corners
+    radius = 0.5 * abs((x2 - x1) + 1j * (y2 - y1)) / (numPts - 1)
+    return bool(np.abs(funcArr).min() > bound * radius)
+
+
+def estimateDerivativeBound(
+    zArr: tVec, funcArr: tVec, context: RootContext
+) -> float:
+    """
+    Estimate the maximum of `|f'|` on a rectangle from samples on a grid,
+    either from samples of the derivative (if available) or from difference
+    quotients of neighboring samples.
+
+    :param zArr: Grid of sample points (rows correspond to imaginary parts)
+    :param funcArr: Function values on the grid
+    :param context: `RootContext` containing the derivative (if available)
+    :return: the estimated maximum of `|f'|`
+    """
+    if context.df is not None:
+        derivArr = evalChunked(context.df, zArr.ravel(), context.chunkSize)
+        return float(np.abs(derivArr).max())
+    quotients = [
+        np.abs(np.diff(funcArr, axis=axis) / np.diff(zArr, axis=axis))
+        for axis in (0, 1)
+        if zArr.shape[axis] > 1
+    ]
+    if len(quotients) == 0:
+        return np.inf
+    return float(max(quotient.max() for quotient in quotients))
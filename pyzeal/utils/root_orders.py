@@ -0,0 +1,77 @@
+"""
+Function calcRootOrders from the package pyzeal_utils.
+
+This module determines the orders (multiplicities) of roots which were found
+without orders, e.g. by the Newton grid algorithm or on the sampling lines of
+argument principle based algorithms. Orders are calculated as winding numbers
+of the target function along small circular contours around the roots. The
+target function is evaluated on all contours at once.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.constants import (
+    ORDER_MAX_PHASE_STEP,
+    ORDER_NUM_PTS,
+    ORDER_RADIUS_SCALE,
+    ORDER_REFINEMENTS,
+)
+from pyzeal.pyzeal_types.root_types import tHoloFunc, tVec
+
+
+def calcRootOrders(
+    f: tHoloFunc,
+    roots: tVec,
+    precision: Tuple[int, int],
+    neighbors: Optional[tVec] = None,
+) -> NDArray[np.int32]:
+    """
+    Calculate the orders of `roots` by the argument principle on circular
+    contours. The radius of each contour is at most `ORDER_RADIUS_SCALE`
+    times the accuracy of the roots and less than half of the distance to the
+    nearest other root (or neighbor), such that contours do not overlap.
+    Contours are refined where the phase of `f` changes quickly.
+
+    :param f: Target function (vectorized)
+    :param roots: Roots whose orders are calculated
+    :param precision: Accuracy of the roots in real and imaginary parts
+    :param neighbors: Further roots which must not be enclosed by contours
+    :return: Orders of `roots` (`0` if no order could be determined)
+    """
+    orders = np.zeros(roots.size, dtype=np.int32)
+    if roots.size == 0:
+        return orders
+    others = roots if neighbors is None else np.concatenate((roots, neighbors))
+    distances = np.abs(roots[:, np.newaxis] - others[np.newaxis, :])
+    # ignore distances of roots to themselves
+    distances[distances == 0] = np.inf
+    radii = np.minimum(
+        ORDER_RADIUS_SCALE * 10.0 ** (-min(precision)),
+        0.4 * distances.min(axis=1),
+    )
+    pending = np.arange(roots.size)
+    numPts = ORDER_NUM_PTS
+    for refinement in range(ORDER_REFINEMENTS + 1):
+        circle = np.exp(2j * np.pi * np.arange(numPts + 1) / numPts)
+        points = roots[pending, np.newaxis] + np.outer(radii[pending], circle)
+        values = np.asarray(f(points.ravel())).reshape(points.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = np.angle(values[:, 1:] / values[:, :-1])
+        resolved = np.isfinite(steps).all(axis=1) & (
+            np.abs(steps).max(axis=1) < ORDER_MAX_PHASE_STEP
+        )
+        if refinement == ORDER_REFINEMENTS:
+            resolved = np.isfinite(steps).all(axis=1)
+        winding = np.rint(steps[resolved].sum(axis=1) / (2 * np.pi))
+        orders[pending[resolved]] = np.maximum(winding, 0)
+        pending = pending[~resolved]
+        if pending.size == 0:
+            break
+        numPts *= 2
+    return orders
@@ -0,0 +1,82 @@
+"""
+Functions polishRoots and polishCandidates from the package pyzeal_utils.
+
+This module refines approximate roots (e.g. calculated from Hankel pencils,
+zeros of rational surrogates or winding numbers of mesh cells) by a few steps
+of the Newton algorithm modified by their multiplicities. Without a
+derivative the secant method is used instead. All roots are iterated at once.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.algorithms.constants import PENCIL_NEWTON_STEPS
+from pyzeal.pyzeal_types.root_types import tVec
+from pyzeal.utils.root_context import RootContext
+
+
+def polishRoots(
+    roots: tVec, orders: NDArray[np.int32], context: RootContext
+) -> tVec:
+    """
+    Polish roots with a few steps of the Newton algorithm modified by the
+    multiplicity of each root. Roots for which the iteration breaks down keep
+    their previous value. Without a derivative the roots are returned as they
+    are.
+
+    :param roots: the roots to polish
+    :param orders: the multiplicities of the roots
+    :param context: `RootContext` containing the target function
+    :return: the polished roots
+    """
+    if context.df is None:
+        return roots
+    eps = min(10 ** (-context.precision[0]), 10 ** (-context.precision[1]))
+    with np.errstate(all="ignore"):
+        for _ in range(PENCIL_NEWTON_STEPS):
+            step = (
+                orders
+                * context.evalFunc(roots)
+                / context.evalDerivative(roots)
+            )
+            step[~np.isfinite(step)] = 0
+            roots = roots - step
+            if np.all(abs(step) < eps):
+                break
+    return roots
+
+
+def polishCandidates(
+    candidates: tVec, orders: NDArray[np.int32], context: RootContext
+) -> tVec:
+    """
+    Polish candidate roots with a few steps of the Newton algorithm (or of
+    the secant method if no derivative is available) modified by their
+    expected multiplicities. Candidates for which the iteration breaks down
+    keep their previous value.
+
+    :param candidates: the candidate roots
+    :param orders: the expected multiplicities of the candidates
+    :param context: `RootContext` containing the target function
+    :return: the polished candidates
+    """
+    if context.df is not None:
+        return polishRoots(candidates, orders, context)
+    eps = min(10 ** (-context.precision[0]), 10 ** (-context.precision[1]))
+    previous = candidates + 10 * eps
+    funcPrevious = context.evalFunc(previous)
+    funcCurrent = context.evalFunc(candidates)
+    with np.errstate(all="ignore"):
+        for _ in range(PENCIL_NEWTON_STEPS):
+            slope = (funcCurrent - funcPrevious) / (candidates - previous)
+            step = orders * funcCurrent / slope
+            step[~np.isfinite(step)] = 0
+            previous, funcPrevious = candidates, funcCurrent
+            candidates = candidates - step
+            if np.all(abs(step) < eps):
+                break
+            funcCurrent = context.evalFunc(candidates)
+    return candidates
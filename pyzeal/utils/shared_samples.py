@@ -0,0 +1,150 @@
+"""
+Class SharedLineSamples from the package pyzeal_utils.
+
+This module transfers samples of the target function along horizontal and
+vertical lines (e.g. the seams between the subrectangles of a parallel root
+search) between processes. All samples are packed into a single block of
+shared memory once, such that each process can attach to them without copying
+or pickling the sample arrays.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.pyzeal_types.root_types import tVec
+
+# samples along a line (positions along the line, points, f and df values)
+tLineArrays = Tuple[NDArray[np.float64], tVec, tVec, tVec]
+# completely sampled ranges of a line (lower and upper end, spacing)
+tLineRanges = Tuple[Tuple[float, float, float], ...]
+# samples along a horizontal or vertical line at a given coordinate
+tLineSamples = Tuple[
+    Literal["horizontal", "vertical"], float, tLineArrays, tLineRanges
+]
+# position of a line inside of the shared block (orientation, coordinate,
+# offset and number of samples, sampled ranges)
+tLineLayout = Tuple[
+    Literal["horizontal", "vertical"], float, int, int, tLineRanges
+]
+
+
+class SharedLineSamples:
+    """
+    Samples along several lines stored in a single block of shared memory.
+    Positions are stored as `float64` followed by points, function and
+    derivative values as `complex128` for each line. Pickling an instance
+    only transfers the name of the block and the layout of the lines. The
+    process which packed the samples owns the block and must `unlink` it.
+    """
+
+    __slots__ = ("layout", "_memory", "_owner")
+
+    def __init__(self, lines: Sequence[tLineSamples]) -> None:
+        """
+        Pack samples along lines into a new block of shared memory.
+
+        :param lines: Orientation, coordinate, samples and sampled ranges of
+            each line
+        """
+        self.layout: List[tLineLayout] = []
+        offset = 0
+        for pos, coord, arrays, ranges in lines:
+            self.layout.append((pos, coord, offset, arrays[0].size, ranges))
+            offset += arrays[0].size
+        # shared memory blocks must not be empty
+        self._memory: Optional[SharedMemory] = SharedMemory(
+            create=True, size=max(offset * 56, 1)
+        )
+        self._owner = True
+        for (_, _, start, size, _), (_, _, arrays, _) in zip(
+            self.layout, lines
+        ):
+            for target, array in zip(self.viewLine(start, size), arrays):
+                target[:] = array
+
+    @property
+    def lines(self) -> List[tLineSamples]:
+        """
+        Returns (read-only) views of the samples along all lines.
+
+        :return: Orientation, coordinate, samples and sampled ranges of each
+            line
+        """
+        lines: List[tLineSamples] = []
+        for pos, coord, start, size, ranges in self.layout:
+            arrays = self.viewLine(start, size)
+            for array in arrays:
+                array.flags.writeable = False
+            lines.append((pos, coord, arrays, ranges))
+        return lines
+
+    def viewLine(self, start: int, size: int) -> tLineArrays:
+        """
+        Create views of the samples of a single line inside of the block.
+
+        :param start: Index of the first sample of the line
+        :param size: Number of samples along the line
+        :return: Positions, points, function and derivative values
+        """
+        if self._memory is None:
+            raise ValueError("shared samples were closed already!")
+        total = sum(lineSize for _, _, _, lineSize, _ in self.layout)
+        buffer = self._memory.buf
+        positions = np.ndarray(
+            (size,), dtype=np.float64, buffer=buffer, offset=8 * start
+        )
+        values = [
+            np.ndarray(
+                (size,),
+                dtype=np.complex128,
+                buffer=buffer,
+                offset=8 * total + 16 * (i * total + start),
+            )
+            for i in range(3)
+        ]
+        return positions, values[0], values[1], values[2]
+
+    def close(self) -> None:
+        """
+        Detach from the block of shared memory (views of the samples must not
+        be used afterwards).
+        """
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+
+    def unlink(self) -> None:
+        """
+        Detach from and free the block of shared memory (if this instance
+        packed the samples).
+        """
+        memory = self._memory
+        self.close()
+        if memory is not None and self._owner:
+            memory.unlink()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the name of the block and the layout of the lines.
+
+        :return: State of the shared samples
+        """
+        if self._memory is None:
+            raise ValueError("shared samples were closed already!")
+        return self._memory.name, self.layout
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Attach to the block of shared memory of pickled samples.
+
+        :param state: State of the shared samples
+        """
+        name, self.layout = state
+        self._memory = SharedMemory(name=name)
+        self._owner = False
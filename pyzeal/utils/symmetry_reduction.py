@@ -0,0 +1,209 @@
+"""
+Class SymmetryReduction from the package pyzeal_utils.
+
+This module restricts root searches for target functions with known
+symmetries to fundamental domains and reconstructs the complete set of roots
+from the roots found on these fundamental domains.
+
+Authors:\n
+- Philipp Schuette\n
+"""
+
+from math import ceil, floor
+from typing import Final, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyzeal.pyzeal_types.root_types import tRectangle, tRoot, tVec
+from pyzeal.pyzeal_types.symmetry_types import SymmetryTypes
+
+# width of the bands (relative to the requested precision) by which
+# fundamental domains extend across symmetry lines, such that roots on these
+# lines do not lie on the boundary of a searched rectangle
+SYMMETRY_BAND: Final[float] = 10
+
+
+class SymmetryReduction:
+    """
+    Reduction of rectangular search domains by a sequence of symmetries of the
+    target function. Symmetries are applied in the given order, each
+    symmetry which is compatible with the (reduced) domain halves it (or cuts
+    it down to a single period). Roots found on the final fundamental domain
+    are mapped back to the original domain in reverse order.
+    """
+
+    __slots__ = ("symmetries", "period", "precision", "_reductions")
+
+    def __init__(
+        self,
+        symmetries: Sequence[SymmetryTypes],
+        precision: Tuple[int, int],
+        *,
+        period: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize a reduction by the symmetries of a target function.
+
+        :param symmetries: the symmetries of the target function
+        :param precision: the accuracy at which roots are considered exact
+        :param period: the (real) period of the target function, required if
+            `symmetries` contains `SymmetryTypes.PERIODIC`
+        :raises ValueError: if a periodic function has no positive period
+        """
+        if SymmetryTypes.PERIODIC in symmetries and not (
+            period is not None and period > 0
+        ):
+            raise ValueError("periodic functions require a positive period!")
+        self.symmetries = tuple(symmetries)
+        self.period = period
+        self.precision = precision
+        self._reductions: List[Tuple[SymmetryTypes, tRectangle]] = []
+
+    def reduce(
+        self, reRan: Tuple[float, float], imRan: Tuple[float, float]
+    ) -> tRectangle:
+        """
+        Reduce the rectangle `reRan x imRan` to a fundamental domain whose
+        images under the symmetries cover the rectangle.
+
+        :param reRan: horizontal extend of the complex region to search in
+        :param imRan: vertical extend of the complex region to search in
+        :return: the fundamental domain to search in
+        """
+        self._reductions = []
+        (x1, x2), (y1, y2) = sorted(reRan), sorted(imRan)
+        domain: tRectangle = ((x1, x2), (y1, y2))
+        for symmetry in self.symmetries:
+            reduced = self.fundamentalDomain(symmetry, domain)
+            if reduced is not None:
+                self._reductions.append((symmetry, domain))
+                domain = reduced
+        return domain
+
+    @property
+    def reductions(self) -> List[Tuple[SymmetryTypes, tRectangle]]:
+        """
+        Return the symmetries applied during the last reduction together with
+        the domains they were applied to.
+
+        :return: applied symmetries and the domains before their application
+        """
+        return self._reductions
+
+    def fundamentalDomain(
+        self, symmetry: SymmetryTypes, domain: tRectangle
+    ) -> Optional[tRectangle]:
+        """
+        Calculate a fundamental domain of `domain` with respect to a single
+        symmetry. Fundamental domains extend slightly across symmetry lines.
+
+        :param symmetry: the symmetry to reduce by
+        :param domain: the rectangle to reduce
+        :return: the fundamental domain, or `None` if the rectangle is not
+            compatible with the symmetry
+        """
+        (x1, x2), (y1, y2) = domain
+        bandRe = SYMMETRY_BAND * 10 ** (-self.precision[0])
+        bandIm = SYMMETRY_BAND * 10 ** (-self.precision[1])
+        if symmetry == SymmetryTypes.PERIODIC:
+            period = float(self.period or 0)
+            if x2 - x1 <= period + bandRe:
+                return None
+            return (x1, x1 + period + bandRe), (y1, y2)
+        # keep the larger half of rectangles straddling the real axis
+        halveIm = y1 < 0 < y2
+        if symmetry != SymmetryTypes.CONJUGATE:
+            # reflections at the origin require symmetric real parts
+            halveIm &= abs(x1 + x2) <= bandRe / SYMMETRY_BAND
+            if not halveIm and x1 < 0 < x2:
+                if abs(y1 + y2) > bandIm / SYMMETRY_BAND:
+                    return None
+                if x2 >= -x1:
+                    return (max(x1, -bandRe), x2), (y1, y2)
+                return (x1, min(x2, bandRe)), (y1, y2)
+        if not halveIm:
+            return None
+        if y2 >= -y1:
+            return (x1, x2), (max(y1, -bandIm), y2)
+        return (x1, x2), (y1, min(y2, bandIm))
+
+    def expand(self, roots: tVec, orders: NDArray[np.int32]) -> List[tRoot]:
+        """
+        Reconstruct all roots on the original domain from the roots found on
+        the fundamental domain of the last reduction. Roots found several
+        times (e.g. on symmetry lines) are reported once.
+
+        :param roots: the roots found on the fundamental domain
+        :param orders: the orders of the roots found on the fundamental domain
+        :return: the roots (and their orders) on the original domain
+        """
+        found = self.deduplicate(
+            [(complex(root), int(order)) for root, order in zip(roots, orders)]
+        )
+        for symmetry, domain in reversed(self._reductions):
+            found = self.deduplicate(
+                found
+                + [
+                    (image, order)
+                    for root, order in found
+                    for image in self.images(symmetry, root, domain)
+                ]
+            )
+        return found
+
+    def images(
+        self, symmetry: SymmetryTypes, root: complex, domain: tRectangle
+    ) -> List[complex]:
+        """
+        Calculate the images of a root under a symmetry which lie inside of a
+        given domain.
+
+        :param symmetry: the symmetry to apply
+        :param root: the root to map
+        :param domain: the domain containing the images
+        :return: the images of `root` inside of `domain`
+        """
+        (x1, x2), (y1, y2) = domain
+        epsRe = 10 ** (-self.precision[0])
+        epsIm = 10 ** (-self.precision[1])
+        if symmetry == SymmetryTypes.CONJUGATE:
+            images = [root.conjugate()]
+        elif symmetry == SymmetryTypes.PERIODIC:
+            period = float(self.period or 0)
+            images = [
+                root + shift * period
+                for shift in range(
+                    ceil((x1 - epsRe - root.real) / period),
+                    floor((x2 + epsRe - root.real) / period) + 1,
+                )
+                if shift != 0
+            ]
+        else:
+            images = [-root]
+        return [
+            image
+            for image in images
+            if x1 - epsRe <= image.real <= x2 + epsRe
+            and y1 - epsIm <= image.imag <= y2 + epsIm
+        ]
+
+    def deduplicate(self, roots: List[tRoot]) -> List[tRoot]:
+        """
+        Remove roots which coincide (up to the requested precision) with
+        roots occurring earlier.
+
+        :param roots: the roots (and their orders) to deduplicate
+        :return: the roots without duplicates
+        """
+        epsRe = 10 ** (-self.precision[0])
+        epsIm = 10 ** (-self.precision[1])
+        unique: List[tRoot] = []
+        for root, order in roots:
+            if not any(
+                abs(root.real - other.real) < epsRe
+                and abs(root.imag - other.imag) < epsIm
+                for other, _ in unique
+            ):
+                unique.append((root, order))
+        return unique